@@ -1,47 +1,250 @@
+import time
+_CONFTEST_IMPORT_STARTED = time.perf_counter()
+
 import logging
 import os
+import re
 import random as rnd
 import pytest
+import allure
 from playwright.sync_api import sync_playwright
 from config.config import BASE_URL
 from datetime import datetime
-from pages.home_page import HomePage
-from pages.height_weight_page import HeightWeightPage
-from pages.goal_weight_page import GoalWeightPage
-from pages.gender_age_page import GenderAndAgePage
-from pages.experience_illness_page import ExperienceIllnessPage
-from pages.priority_page import PriorityPage
-from pages.rank_page import RankPage
-from pages.metabolic_graph_page import MetabolicGraphPage
-from pages.glp1_page import GLP1Page
-from pages.frank_new_man_page import FrankNewManPage
-from pages.reasons_page import ReasonsPage
-from pages.lose_weight_page import LoseWeightPage
-from pages.analyze_metabolism_page import AnalyzeMetabolismPage
-from pages.sleep_check_page import SleepCheckPage
-from pages.sleep_hours_page import SleepHoursPage
-from pages.body_review_page import BodyReviewPage
-from pages.health_conditions_page import HealthConditionsPage
-from pages.additional_health_questions_page import AdditionalHealthQuestionsPage
-from pages.taken_medication_page import TakenMedicationPage
-from pages.glp1_medicine_page import GLP1MedicinePage
-from pages.last_three_month_medication_page import lastThreeMonthMedicationPage
-from pages.surgery_weight_loss_page import SurgeryWeightLossPage
-from pages.weight_loss_program_page import WeightLossProgramPage
-from pages.clinically_appropriate_page import ClinicallyAppropriatePage
-from pages.weight_change_last_year_page import WeightChangeLastYearPage
-from pages.average_blood_pressure_range_page import AverageBloodPressureRangePage
-from pages.body_changing_img_page import BodyChangingImgPage
-from pages.average_resting_heart_rate_page import AverageRestingHeartRatePage
-from pages.best_medicine_match_page import BestMedicineMatchPage
-from pages.currently_taking_medicine_page import CurrentlyTakingMedicinePage
-from pages.understand_state_of_mind_page import UnderstandStateOfMindPage
-from pages.info_shared_with_medical_team_page import InfoSharedWithMedicalTeamPage
-from pages.your_need_page import YourNeedPage
-from pages.date_of_birth_page import DateOfBirthPage
-from pages.your_medical_review_page import YourMedicalReviewPage
-from pages.check_eligibility_page import CheckEligibilityPage
-from pages.submission_form_page import SubmissionFormPage
+from flow.context import FlowContext, PAGE_REGISTRY
+from flow.segments import DEPENDENCIES, SEGMENTS, SEGMENTS_BY_NAME, restore_checkpoint
+from flow.steps import STEP_LISTENERS
+from utils.checkpoint import CheckpointStore
+from utils.locator_registry import FrameHandle
+from utils import shard_planner
+from utils.startup_profiler import STARTUP
+from utils.step_profiler import StepSampler
+from utils.base_page import BasePage
+from utils.golden import GoldenStore, check_screen
+from utils.answer_ledger import PERSONA_KEY, AnswerLedger
+from utils.asset_monitor import AssetMonitor
+from utils.screen_events import ScreenBridge
+from utils.frame_watchdog import STALL_MS, FrameWatchdog
+from utils import circuit_breaker, soft_assert, step_budget, wait_model
+from utils.text_index import TEXT_INDEX_SCRIPT
+from utils import reduced_motion
+from utils.step_timings import StepTimings, load_medians, savings_table
+
+STARTUP.record("import", "conftest.py (in process)", time.perf_counter() - _CONFTEST_IMPORT_STARTED)
+
+
+# --------------------- Command Line Options --------------------- #
+
+def pytest_addoption(parser):
+    group = parser.getgroup("medvi")
+    group.addoption(
+        "--medvi-shard",
+        default=None,
+        help="Run only shard i of N ('i/N') from the duration-balanced shard plan.",
+    )
+    group.addoption(
+        "--medvi-shard-plan",
+        default=shard_planner.DEFAULT_PLAN,
+        help="Shard plan written by 'python -m utils.shard_planner'.",
+    )
+    group.addoption(
+        "--medvi-shard-groups",
+        action="store_true",
+        default=False,
+        help="Pin each planned shard to one xdist worker (use with '-n N --dist loadgroup').",
+    )
+    group.addoption(
+        "--medvi-profile-startup",
+        action="store_true",
+        default=False,
+        help="Report import, fixture setup, browser launch and first navigation times.",
+    )
+    group.addoption(
+        "--medvi-profile-startup-json",
+        default="reports/startup_profile.json",
+        help="Where --medvi-profile-startup writes its JSON breakdown.",
+    )
+    group.addoption(
+        "--medvi-profile-steps",
+        action="store_true",
+        default=False,
+        help="Sample the harness' Python stacks per Allure step into one collapsed-stack file per test.",
+    )
+    group.addoption(
+        "--medvi-profile-steps-dir",
+        default="reports/flamegraphs",
+        help="Directory for the --medvi-profile-steps collapsed-stack files.",
+    )
+    group.addoption(
+        "--medvi-segments",
+        action="store_true",
+        default=False,
+        help="Also run the flow as separate segment tests resuming from checkpoints (tests/test_medvi_segments.py).",
+    )
+    group.addoption(
+        "--medvi-bench-text-index",
+        action="store_true",
+        default=False,
+        help="Run the text index vs. XPath selection latency benchmark.",
+    )
+    group.addoption(
+        "--medvi-reduced-motion",
+        action="store_true",
+        default=False,
+        help="Emulate prefers-reduced-motion and zero all CSS animation/transition durations in every frame.",
+    )
+    group.addoption(
+        "--medvi-timer-speedup",
+        type=float,
+        default=1.0,
+        help="Divide page setTimeout/setInterval delays by this factor (with --medvi-reduced-motion).",
+    )
+    group.addoption(
+        "--medvi-step-timings",
+        action="store_true",
+        default=False,
+        help="Record per-step durations and report savings against the run of the other motion mode.",
+    )
+    group.addoption(
+        "--medvi-step-timings-dir",
+        default="reports/step_timings",
+        help="Directory for the --medvi-step-timings JSON files.",
+    )
+    group.addoption(
+        "--medvi-soft-assert-policy",
+        choices=soft_assert.POLICIES,
+        default=soft_assert.WARN,
+        help="'warn' only records failed soft assertions; 'fail' also fails the test after it ran.",
+    )
+    group.addoption(
+        "--medvi-soft-assert-budget",
+        type=int,
+        default=BasePage.SOFT_ASSERT_BUDGET,
+        help="Shared deadline in ms for all checks of one soft assertion block.",
+    )
+    group.addoption(
+        "--medvi-golden",
+        choices=("check", "update"),
+        default=None,
+        help="Compare each step's screen with its golden snapshot ('check') or re-record them ('update').",
+    )
+    group.addoption(
+        "--medvi-golden-file",
+        default="goldens/steps.json",
+        help="JSON file holding the golden step snapshots.",
+    )
+    group.addoption(
+        "--medvi-image-hash",
+        choices=("check", "update"),
+        default=None,
+        help="Compare perceptual hashes of the verified images with their references, or re-record them.",
+    )
+    group.addoption(
+        "--medvi-image-references",
+        default="goldens/images.json",
+        help="JSON file holding the reference image hashes.",
+    )
+    group.addoption(
+        "--medvi-asset-visibility",
+        action="store_true",
+        default=False,
+        help="After an asset's response checks out, also wait for its <img> to be visible.",
+    )
+    group.addoption(
+        "--medvi-canary-budget",
+        type=float,
+        default=60.0,
+        help="End-to-end time budget in seconds of the shortest-path canary (smoke) test.",
+    )
+    group.addoption(
+        "--medvi-step-budget",
+        default=None,
+        help="Flow SLA: JSON file of per-step budgets in seconds, or 'history' for the recorded "
+             "--medvi-step-timings medians (fails fast once the cumulative budget is exceeded).",
+    )
+    group.addoption(
+        "--medvi-step-budget-factor",
+        type=float,
+        default=step_budget.HISTORY_FACTOR,
+        help="With --medvi-step-budget=history, budget of each step as a multiple of its recorded median.",
+    )
+    group.addoption(
+        "--medvi-wait-model",
+        default=None,
+        help="JSON file of observed wait durations per locator; learned timeouts (p95 plus a margin) "
+             "replace the flat ones and the file is updated at the end of the session.",
+    )
+    group.addoption(
+        "--medvi-stall-ms",
+        type=int,
+        default=STALL_MS,
+        help="Reload the Typeform iframe once it is loading without progress for this many ms (0 disables the watchdog).",
+    )
+    group.addoption(
+        "--medvi-circuit-breaker",
+        default="reports/circuit_breaker.json",
+        help="State file of the circuit breaker shared by all xdist workers of the session.",
+    )
+    group.addoption(
+        "--medvi-breaker-threshold",
+        type=int,
+        default=circuit_breaker.THRESHOLD,
+        help="Consecutive infrastructure failures (site down, iframe never attaching) that open the "
+             "circuit breaker and skip the remaining UI tests (0 disables it).",
+    )
+    group.addoption(
+        "--medvi-breaker-cooldown",
+        type=float,
+        default=circuit_breaker.COOLDOWN_S,
+        help="Seconds the circuit breaker stays open before one test probes the site again.",
+    )
+    group.addoption(
+        "--medvi-answer-ledger",
+        default="reports/answer_ledger.jsonl",
+        help="JSONL stream the entered answers of every test are written to (one answer per line).",
+    )
+
+
+def pytest_configure(config):
+    """
+    Apply the soft assertion and asset options to every page object; start a fresh
+    answer ledger stream and circuit breaker, and drop checkpoints of an older flow.
+    """
+    BasePage.SOFT_ASSERT_POLICY = config.getoption("--medvi-soft-assert-policy")
+    BasePage.SOFT_ASSERT_BUDGET = config.getoption("--medvi-soft-assert-budget")
+    BasePage.VERIFY_ASSET_VISIBILITY = config.getoption("--medvi-asset-visibility")
+    BasePage.VERIFY_IMAGE_HASH = config.getoption("--medvi-image-hash") is not None
+    ledger_stream = _worker_path(config.getoption("--medvi-answer-ledger"))
+    if os.path.exists(ledger_stream):
+        os.remove(ledger_stream)
+    if not hasattr(config, "workerinput"):
+        CheckpointStore().prune({name: SEGMENTS_BY_NAME[name].version for name in DEPENDENCIES})
+    global _BREAKER
+    if config.getoption("--medvi-breaker-threshold") > 0:
+        _BREAKER = circuit_breaker.CircuitBreaker(
+            config.getoption("--medvi-circuit-breaker"),
+            worker=os.getenv("PYTEST_XDIST_WORKER", "main"),
+            threshold=config.getoption("--medvi-breaker-threshold"),
+            cooldown_s=config.getoption("--medvi-breaker-cooldown"),
+        )
+        # The controller (or a run without xdist) starts every session closed; workers share its file
+        if not hasattr(config, "workerinput"):
+            _BREAKER.reset()
+
+
+_BREAKER = None
+
+
+def pytest_report_header(config):
+    """Show whether the circuit breaker can open in this session."""
+    if _BREAKER is None:
+        return "circuit breaker: off (--medvi-breaker-threshold 0)"
+    line = f"circuit breaker: opens after {_BREAKER.threshold} infrastructure failures"
+    maxfail = config.getoption("maxfail")
+    if 0 < maxfail <= _BREAKER.threshold:
+        line += f", but --maxfail={maxfail} ends the session first"
+    return line
+
+
 # --------------------- Logging Configuration --------------------- #
 
 @pytest.fixture(autouse=True, scope="session")
@@ -60,6 +263,12 @@ def configure_logging():
     yield
 
 
+@pytest.fixture(autouse=True)
+def label_node_id(request):
+    """Tag every Allure result with its node id so shard planning can map history to tests."""
+    allure.dynamic.label("nodeid", request.node.nodeid)
+
+
 # ------------------- HTML Reporting Hooks ------------------- #
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -93,6 +302,316 @@ def pytest_runtest_makereport(item, call):
             except Exception as e:
                 print(f"❌ Failed to capture failure details: {e}")
 
+    # Remember segments that did not pass so dependent segments on this worker are skipped too
+    marker = item.get_closest_marker("medvi_segment")
+    if marker and (rep.failed or rep.skipped):
+        _FAILED_SEGMENTS.add(marker.args[0])
+
+    # Count outages across workers; any other outcome shows the site is reachable
+    if _BREAKER is not None and rep.when == "call" and not rep.skipped and "page" in item.fixturenames:
+        outage = rep.failed and circuit_breaker.is_infrastructure_failure(call.excinfo)
+        state = _BREAKER.record(outage, str(call.excinfo.value) if outage else "")
+        if outage:
+            logging.getLogger("CircuitBreaker").warning(f"🔌 Infrastructure failure in {item.nodeid}; breaker {state}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Fail the test once it ran if soft assertions, goldens, image hashes or the step budget recorded failures."""
+    soft_assert.drain()
+    outcome = yield
+    page = item.funcargs.get("page") if hasattr(item, "funcargs") else None
+    if page is not None and BasePage.VERIFY_IMAGE_HASH:
+        from utils.image_hash import ImageVerifier
+
+        verifier = ImageVerifier.get(page)
+    else:
+        verifier = None
+    if verifier is not None:
+        soft_assert.PENDING_FAILURES.extend(verifier.resolve())
+        if verifier.rows:
+            allure.attach("\n".join(verifier.rows), name="Image hashes", attachment_type=allure.attachment_type.TEXT)
+    budget = step_budget.ACTIVE
+    if budget is not None and budget.finish():
+        soft_assert.PENDING_FAILURES.append(f"Flow SLA exceeded in the last step\n{budget.report()}")
+    failures = soft_assert.drain()
+    if failures and outcome.excinfo is None:
+        outcome.force_exception(AssertionError("Soft assertions failed:\n" + "\n".join(failures)))
+
+
+# ------------------- Startup Profiling ------------------- #
+
+_PROFILED_FIXTURES = ("playwright", "browser", "page")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Time setup of the Playwright fixtures when --medvi-profile-startup is on."""
+    if fixturedef.argname not in _PROFILED_FIXTURES or not request.config.getoption("--medvi-profile-startup"):
+        yield
+        return
+    with STARTUP.timed("fixture", fixturedef.argname):
+        yield
+
+
+def _profile_first_navigation(page):
+    """Record when the first navigation to BASE_URL starts and how long it takes."""
+    started = []
+
+    def on_request(req):
+        if not started and req.is_navigation_request() and req.url.startswith(BASE_URL):
+            started.append(time.perf_counter())
+            STARTUP.record("navigation", "conftest import -> first goto", started[0] - _CONFTEST_IMPORT_STARTED)
+
+    def on_loaded(_):
+        if started:
+            STARTUP.record("navigation", f"first goto {BASE_URL}", time.perf_counter() - started[0])
+            page.remove_listener("request", on_request)
+            page.remove_listener("domcontentloaded", on_loaded)
+
+    page.on("request", on_request)
+    page.on("domcontentloaded", on_loaded)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print and persist the startup breakdown and the per-step timings; report circuit breaker trips."""
+    if config.getoption("--medvi-profile-startup"):
+        _report_startup(terminalreporter, config)
+    if config.getoption("--medvi-step-timings"):
+        _report_step_timings(terminalreporter, config)
+    if _GOLDEN is not None:
+        _report_goldens(terminalreporter)
+    if _BREAKER is not None and not hasattr(config, "workerinput"):
+        state = _BREAKER.state()
+        if state.get("trips"):
+            terminalreporter.write_line(
+                f"🔌 Circuit breaker opened {state['trips']}x (now {state['state']}; last error: {state.get('last_error')})"
+            )
+
+
+def _worker_path(path: str) -> str:
+    """Give every xdist worker its own output file."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return path.replace(".json", f".{worker}.json") if worker else path
+
+
+def _report_startup(terminalreporter, config):
+    STARTUP.measure_imports(
+        ["conftest"] + [module for module, _ in PAGE_REGISTRY.values()], cwd=str(config.rootpath)
+    )
+    output = _worker_path(config.getoption("--medvi-profile-startup-json"))
+    STARTUP.write_json(output)
+    terminalreporter.write_sep("=", "MEDVi startup profile")
+    terminalreporter.write_line(STARTUP.table())
+    terminalreporter.write_line(f"📝 Startup profile written to {output}")
+
+
+def _report_step_timings(terminalreporter, config):
+    if not _STEP_TIMINGS.durations:
+        return
+    mode = "reduced_motion" if config.getoption("--medvi-reduced-motion") else "baseline"
+    other = "baseline" if mode == "reduced_motion" else "reduced_motion"
+    directory = config.getoption("--medvi-step-timings-dir")
+    output = _worker_path(os.path.join(directory, f"{mode}.json"))
+    _STEP_TIMINGS.write_json(output, mode)
+    terminalreporter.write_sep("=", f"MEDVi step timings ({mode})")
+    terminalreporter.write_line(f"📝 Step timings written to {output}")
+
+    compare = load_medians(_worker_path(os.path.join(directory, f"{other}.json")))
+    if compare:
+        if mode == "reduced_motion":
+            baseline, current = compare, _STEP_TIMINGS.medians()
+        else:
+            baseline, current = _STEP_TIMINGS.medians(), compare
+        terminalreporter.write_line(savings_table(baseline, current))
+    else:
+        terminalreporter.write_line(f"ℹ️ Run again in {other} mode to see per-step savings")
+
+
+def _report_goldens(terminalreporter):
+    _GOLDEN.save()
+    terminalreporter.write_sep("=", "MEDVi golden snapshots")
+    if _GOLDEN.update:
+        terminalreporter.write_line(f"📝 Goldens written to {_GOLDEN.path}")
+        return
+    for key, diff in sorted(_GOLDEN.mismatches.items()):
+        terminalreporter.write_line(f"❌ {key} changed:\n{diff}")
+    for key in _GOLDEN.missing:
+        terminalreporter.write_line(f"ℹ️ {key} has no golden yet, record it with --medvi-golden=update")
+    if not _GOLDEN.mismatches:
+        terminalreporter.write_line("✅ All captured steps match their goldens")
+
+
+_STEP_TIMINGS = StepTimings()
+_GOLDEN = None
+
+
+@pytest.fixture(autouse=True, scope="session")
+def time_steps(request):
+    """Time the flow steps of the whole session when --medvi-step-timings is on."""
+    if not request.config.getoption("--medvi-step-timings"):
+        yield
+        return
+    _STEP_TIMINGS.start()
+    yield
+    _STEP_TIMINGS.stop()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def adaptive_waits(request):
+    """Learn and apply per-locator wait timeouts when --medvi-wait-model is set."""
+    path = request.config.getoption("--medvi-wait-model")
+    if not path:
+        yield
+        return
+    path = _worker_path(path)
+    model = wait_model.ACTIVE = wait_model.WaitModel.load(path)
+    yield
+    wait_model.ACTIVE = None
+    model.save(path)
+    logging.getLogger("WaitModel").info(f"⏱️ Wait model of {len(model.waits)} locators written to {path}")
+    if model.misses:
+        logging.getLogger("WaitModel").warning(f"⏱️ Learned timeouts missed:\n{model.summary()}")
+
+
+@pytest.fixture(autouse=True)
+def profile_steps(request):
+    """Sample Python stacks while Allure steps run, when --medvi-profile-steps is on."""
+    if not request.config.getoption("--medvi-profile-steps"):
+        yield
+        return
+
+    sampler = StepSampler(str(request.config.rootpath))
+    sampler.start()
+    yield
+    sampler.stop()
+
+    file_name = re.sub(r"[^\w.-]+", "_", request.node.nodeid) + ".collapsed"
+    path = os.path.join(request.config.getoption("--medvi-profile-steps-dir"), file_name)
+    sampler.write_collapsed(path)
+    allure.attach.file(path, name="Step flame graph (collapsed stacks)", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(autouse=True)
+def golden_snapshots(request):
+    """Check or record the screen of every flow step when --medvi-golden is set."""
+    global _GOLDEN
+    mode = request.config.getoption("--medvi-golden")
+    if not mode:
+        yield
+        return
+    if _GOLDEN is None:
+        _GOLDEN = GoldenStore(request.config.getoption("--medvi-golden-file"), update=mode == "update")
+
+    def on_step(pages, step):
+        # The landing page before step 1 has no form yet
+        if pages.page.query_selector(BasePage.IFRAME_SELECTOR) is None:
+            return
+        key = f"step-{step.number:02d}"
+        diff = check_screen(_GOLDEN, key, pages.page, BasePage(pages.page).frame)
+        if diff:
+            allure.attach(diff, name=f"Golden diff {key}", attachment_type=allure.attachment_type.TEXT)
+            soft_assert.PENDING_FAILURES.append(f"{key} ({step.title}) differs from its golden")
+
+    STEP_LISTENERS.append(on_step)
+    yield
+    STEP_LISTENERS.remove(on_step)
+
+
+@pytest.fixture(autouse=True)
+def step_deadlines(request):
+    """Enforce per-step SLA budgets on the flow when --medvi-step-budget is set."""
+    source = request.config.getoption("--medvi-step-budget")
+    if not source:
+        yield
+        return
+    if source == "history":
+        history = _worker_path(os.path.join(request.config.getoption("--medvi-step-timings-dir"), "baseline.json"))
+        budget = step_budget.StepBudget.from_history(history, request.config.getoption("--medvi-step-budget-factor"))
+    else:
+        budget = step_budget.StepBudget.from_file(source)
+
+    def on_step(pages, step):
+        budget.enter(step.number, step.title)
+
+    step_budget.ACTIVE = budget
+    STEP_LISTENERS.insert(0, on_step)
+    yield
+    STEP_LISTENERS.remove(on_step)
+    step_budget.ACTIVE = None
+    if budget.used:
+        allure.attach(budget.report(), name="Step budget", attachment_type=allure.attachment_type.TEXT)
+        overruns = budget.overruns()
+        if overruns:
+            logging.getLogger("StepBudget").warning(f"⏰ Steps over budget: {overruns}\n{budget.report()}")
+
+
+# ------------------- Segment Ordering ------------------- #
+
+_FAILED_SEGMENTS = set()
+_SEGMENT_ORDER = {s.name: i for i, s in enumerate(SEGMENTS)}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep segment tests in dependency order; other tests keep their position."""
+    slots = [i for i, item in enumerate(items) if item.get_closest_marker("medvi_segment")]
+    ordered = sorted(
+        (items[i] for i in slots),
+        key=lambda item: _SEGMENT_ORDER[item.get_closest_marker("medvi_segment").args[0]],
+    )
+    for i, item in zip(slots, ordered):
+        items[i] = item
+
+    _apply_shard_plan(config, items)
+
+
+def _apply_shard_plan(config, items):
+    """Deselect tests outside --medvi-shard, or group shards for xdist workers."""
+    shard = config.getoption("--medvi-shard")
+    pin_groups = config.getoption("--medvi-shard-groups")
+    if not shard and not pin_groups:
+        return
+
+    plan = shard_planner.load_plan(config.getoption("--medvi-shard-plan"))
+    if shard:
+        try:
+            index, nodes = shard_planner.parse_shard(shard)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    else:
+        # Without a plan, spread over as many groups as there are xdist workers
+        index, nodes = None, plan["nodes"] if plan else int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "0"))
+        if not nodes:
+            raise pytest.UsageError("--medvi-shard-groups needs a shard plan (python -m utils.shard_planner) or -n N")
+    if plan and plan["nodes"] != nodes:
+        raise pytest.UsageError(f"Shard plan is for {plan['nodes']} nodes, not {nodes}")
+
+    shards = shard_planner.assign_shards([item.nodeid for item in items], plan, nodes)
+    selected, deselected = [], []
+    for item in items:
+        item_shard = shards[item.nodeid]
+        if pin_groups:
+            item.add_marker(pytest.mark.xdist_group(name=f"shard{item_shard}"))
+        (selected if index in (None, item_shard) else deselected).append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_runtest_setup(item):
+    """Skip UI tests while the circuit breaker is open, and segments whose dependency failed or was skipped."""
+    if _BREAKER is not None and "page" in item.fixturenames:
+        reason = _BREAKER.admit()
+        if reason:
+            pytest.skip(reason)
+    marker = item.get_closest_marker("medvi_segment")
+    if marker is None:
+        return
+    depends = SEGMENTS_BY_NAME[marker.args[0]].depends
+    if depends in _FAILED_SEGMENTS:
+        pytest.skip(f"Segment '{depends}' did not pass; '{marker.args[0]}' depends on it")
+
 
 # ------------------- Playwright Fixtures ------------------- #
 
@@ -114,243 +633,325 @@ def browser(playwright, request):
 
     headless = not request.config.getoption("--headed", default=False)
 
-    if browser_type == "chromium":
-        browser = playwright.chromium.launch(headless=headless)
-    elif browser_type == "firefox":
-        browser = playwright.firefox.launch(headless=headless)
-    elif browser_type == "webkit":
-        browser = playwright.webkit.launch(headless=headless)
-    else:
+    if browser_type not in ("chromium", "firefox", "webkit"):
         raise ValueError(f"Unsupported browser: {browser_type}")
 
+    launch_started = time.perf_counter()
+    browser = getattr(playwright, browser_type).launch(headless=headless)
+    if request.config.getoption("--medvi-profile-startup"):
+        STARTUP.record("launch", browser_type, time.perf_counter() - launch_started)
+
     yield browser
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def checkpoints():
+    """Checkpoint store shared by the end-to-end and segment tests."""
+    return CheckpointStore()
+
+
+def _open_page(browser, request, storage_state=None):
+    """New context (from ``storage_state``, if given) with the harness scripts installed, and its page."""
+    reduce_motion = request.config.getoption("--medvi-reduced-motion")
+    context = browser.new_context(
+        storage_state=storage_state,
+        reduced_motion="reduce" if reduce_motion else None,
+    )
+    context.add_init_script(TEXT_INDEX_SCRIPT)
+    screens = ScreenBridge.install(context)
+    stall_ms = request.config.getoption("--medvi-stall-ms")
+    if request.node.get_closest_marker("medvi_no_watchdog"):
+        stall_ms = 0
+    watchdog = FrameWatchdog.install(context, BasePage.IFRAME_SELECTOR, stall_ms) if stall_ms else None
+    if reduce_motion:
+        reduced_motion.install(context, request.config.getoption("--medvi-timer-speedup"))
+    page = context.new_page()
+    AssetMonitor.for_page(page)
+    image_hash = request.config.getoption("--medvi-image-hash")
+    if image_hash:
+        # Pillow is only needed (and imported) when images are hashed
+        from utils.image_hash import ImageVerifier
+
+        ImageVerifier(page, request.config.getoption("--medvi-image-references"), update=image_hash == "update")
+    if request.config.getoption("--medvi-profile-startup"):
+        _profile_first_navigation(page)
+    return context, page, screens, watchdog
+
+
 @pytest.fixture(scope="function")
-def page(browser):
-    """Page instance for each test."""
-    page = browser.new_page()
+def page(browser, checkpoints, request):
+    """
+    Page instance for each test. Segment tests get a page restored from the checkpoint
+    of the segment they depend on (``request.node.medvi_checkpoint``), or a clean one
+    when it is missing or does not land on the segment's first screen.
+    """
+    checkpoint = None
+    marker = request.node.get_closest_marker("medvi_segment")
+    if marker:
+        segment = SEGMENTS_BY_NAME[marker.args[0]]
+        if segment.depends:
+            checkpoint = checkpoints.load(segment.depends, SEGMENTS_BY_NAME[segment.depends].version)
+
+    context, page, screens, watchdog = _open_page(browser, request, checkpoint and checkpoint["storage_state"])
+    if checkpoint is not None and not restore_checkpoint(segment, page, checkpoint):
+        # Nothing of the partly restored state (cookies, localStorage) may leak into the prefix run
+        context.close()
+        context, page, screens, watchdog = _open_page(browser, request)
+        checkpoint = None
+    request.node.medvi_checkpoint = checkpoint
     yield page
-    page.close()
+
+    stats = FrameHandle.stats(page)
+    logging.getLogger("FrameHandle").info(
+        f"🧭 Iframe resolved {stats['resolutions']}x, invalidated {stats['invalidations']}x"
+    )
+    allure.attach(
+        f"resolutions: {stats['resolutions']}\ninvalidations: {stats['invalidations']}",
+        name="Iframe frame resolutions",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+    if watchdog is not None and watchdog.recoveries:
+        allure.attach(watchdog.report(), name="Iframe stall recoveries", attachment_type=allure.attachment_type.TEXT)
+    ledger = AnswerLedger.for_page(page)
+    if len(ledger):
+        if "user_data" in request.fixturenames:
+            ledger.record(PERSONA_KEY, request.getfixturevalue("user_data"))
+        allure.attach(ledger.to_jsonl(), name="Answer ledger", attachment_type=allure.attachment_type.JSON)
+        ledger.append_to(_worker_path(request.config.getoption("--medvi-answer-ledger")), test=request.node.nodeid)
+    timeline = screens.timeline()
+    if timeline:
+        allure.attach(
+            "\n".join(f"{seconds:8.2f}s  {title}" for title, seconds in timeline),
+            name="Screen timeline",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def flow(page):
+    """Lazily constructed page objects of the flow (``flow.goal_weight``)."""
+    return FlowContext(page)
 
 
 # ------------------- Page Object Fixtures ------------------- #
+# Thin aliases of ``flow`` attributes, kept for tests that request pages by name.
 
 @pytest.fixture(scope="function")
-def home_page(page):
+def home_page(flow):
     """Home page fixture."""
-    return HomePage(page)
+    return flow.home_page
 
 
 @pytest.fixture(scope="function")
-def height_weight_page(page):
+def height_weight_page(flow):
     """Height and weight page fixture."""
-    return HeightWeightPage(page)
+    return flow.height_weight_page
 
 
 @pytest.fixture(scope="function")
-def goal_weight(page):
+def goal_weight(flow):
     """Goal weight page fixture."""
-    return GoalWeightPage(page)
+    return flow.goal_weight
 
 
 @pytest.fixture(scope="function")
-def gender_and_age(page):
+def gender_and_age(flow):
     """Gender and age page fixture."""
-    return GenderAndAgePage(page)
+    return flow.gender_and_age
 
 
 @pytest.fixture(scope="function")
-def experience_illness(page):
+def experience_illness(flow):
     """Experience illness page fixture."""
-    return ExperienceIllnessPage(page)
+    return flow.experience_illness
 
 
 @pytest.fixture(scope="function")
-def priority(page):
+def priority(flow):
     """Priority page fixture."""
-    return PriorityPage(page)
+    return flow.priority
 
 
 @pytest.fixture(scope="function")
-def rank(page):
+def rank(flow):
     """Rank page fixture."""
-    return RankPage(page)
+    return flow.rank
 
 
 @pytest.fixture(scope="function")
-def metabolic_graph(page):
+def metabolic_graph(flow):
     """Metabolic graph page fixture."""
-    return MetabolicGraphPage(page)
+    return flow.metabolic_graph
 
 
 @pytest.fixture(scope="function")
-def gpl(page):
+def gpl(flow):
     """GLP-1 page fixture."""
-    return GLP1Page(page)
+    return flow.gpl
 
 
 @pytest.fixture(scope="function")
-def frank_new_man(page):
+def frank_new_man(flow):
     """Frank new man page fixture."""
-    return FrankNewManPage(page)
+    return flow.frank_new_man
 
 
 @pytest.fixture(scope="function")
-def reasons(page):
+def reasons(flow):
     """Reasons page fixture."""
-    return ReasonsPage(page)
+    return flow.reasons
 
 
 @pytest.fixture(scope="function")
-def lose_weight(page):
+def lose_weight(flow):
     """Lose weight page fixture."""
-    return LoseWeightPage(page)
+    return flow.lose_weight
 
 
 @pytest.fixture(scope="function")
-def analyze_metabolism(page):
+def analyze_metabolism(flow):
     """Analyze metabolism page fixture."""
-    return AnalyzeMetabolismPage(page)
+    return flow.analyze_metabolism
 
 
 @pytest.fixture(scope="function")
-def sleep_check(page):
+def sleep_check(flow):
     """Sleep check page fixture."""
-    return SleepCheckPage(page)
+    return flow.sleep_check
 
 
 @pytest.fixture(scope="function")
-def sleep_hours(page):
+def sleep_hours(flow):
     """Sleep hours page fixture."""
-    return SleepHoursPage(page)
+    return flow.sleep_hours
 
 
 @pytest.fixture(scope="function")
-def body_review(page):
+def body_review(flow):
     """Body review page fixture."""
-    return BodyReviewPage(page)
+    return flow.body_review
 
 
 @pytest.fixture(scope="function")
-def health_conditions(page):
+def health_conditions(flow):
     """Health conditions page fixture."""
-    return HealthConditionsPage(page)
+    return flow.health_conditions
 
 
 @pytest.fixture(scope="function")
-def additional_health_questions(page):
+def additional_health_questions(flow):
     """Additional health questions page fixture."""
-    return AdditionalHealthQuestionsPage(page)
+    return flow.additional_health_questions
 
 
 @pytest.fixture(scope="function")
-def taken_medication(page):
+def taken_medication(flow):
     """Taken medication page fixture."""
-    return TakenMedicationPage(page)
+    return flow.taken_medication
 
 
 @pytest.fixture(scope="function")
-def glp1_medicine(page):
+def glp1_medicine(flow):
     """GLP-1 medicine page fixture."""
-    return GLP1MedicinePage(page)
+    return flow.glp1_medicine
 
 
 @pytest.fixture(scope="function")
-def last_three_month_medication(page):
+def last_three_month_medication(flow):
     """Last three month medication page fixture."""
-    return lastThreeMonthMedicationPage(page)
+    return flow.last_three_month_medication
 
 
 @pytest.fixture(scope="function")
-def surgery_weight_loss(page):
+def surgery_weight_loss(flow):
     """Surgery weight loss page fixture."""
-    return SurgeryWeightLossPage(page)
+    return flow.surgery_weight_loss
 
 
 @pytest.fixture(scope="function")
-def weight_loss_program(page):
+def weight_loss_program(flow):
     """Weight loss program page fixture."""
-    return WeightLossProgramPage(page)
+    return flow.weight_loss_program
 
 
 @pytest.fixture(scope="function")
-def clinically_appropriate(page):
+def clinically_appropriate(flow):
     """Clinically appropriate page fixture."""
-    return ClinicallyAppropriatePage(page)
+    return flow.clinically_appropriate
 
 
 @pytest.fixture(scope="function")
-def weight_change_last_year(page):
+def weight_change_last_year(flow):
     """Weight change last year page fixture."""
-    return WeightChangeLastYearPage(page)
+    return flow.weight_change_last_year
 
 
 @pytest.fixture(scope="function")
-def average_blood_pressure_range(page):
+def average_blood_pressure_range(flow):
     """Average blood pressure range page fixture."""
-    return AverageBloodPressureRangePage(page)
+    return flow.average_blood_pressure_range
 
 
 @pytest.fixture(scope="function")
-def body_changing_img(page):
+def body_changing_img(flow):
     """Body changing img page fixture."""
-    return BodyChangingImgPage(page)
+    return flow.body_changing_img
 
 
 @pytest.fixture(scope="function")
-def average_resting_heart_rate(page):
+def average_resting_heart_rate(flow):
     """Average resting heart rate page fixture."""
-    return AverageRestingHeartRatePage(page)
+    return flow.average_resting_heart_rate
 
 
 @pytest.fixture(scope="function")
-def best_medicine_match(page):
+def best_medicine_match(flow):
     """Best medicine match page fixture."""
-    return BestMedicineMatchPage(page)
+    return flow.best_medicine_match
 
 
 @pytest.fixture(scope="function")
-def currently_taking_medicine(page):
+def currently_taking_medicine(flow):
     """Currently taking medicine page fixture."""
-    return CurrentlyTakingMedicinePage(page)
+    return flow.currently_taking_medicine
 
 
 @pytest.fixture(scope="function")
-def understand_state_of_mind(page):
+def understand_state_of_mind(flow):
     """Understand state of mind page fixture."""
-    return UnderstandStateOfMindPage(page)
+    return flow.understand_state_of_mind
 
 @pytest.fixture(scope="function")
-def your_need(page):
+def your_need(flow):
     """Your need page fixture."""
-    return YourNeedPage(page)
+    return flow.your_need
 
 @pytest.fixture(scope="function")
-def info_shared_with_medical_team(page):
+def info_shared_with_medical_team(flow):
     """Info shared with medical team page fixture."""
-    return InfoSharedWithMedicalTeamPage(page)
+    return flow.info_shared_with_medical_team
 
 @pytest.fixture(scope="function")
-def date_of_birth(page):
+def date_of_birth(flow):
     """Date of birth page fixture."""
-    return DateOfBirthPage(page)
+    return flow.date_of_birth
 
 @pytest.fixture(scope="function")
-def your_medical_review(page):
+def your_medical_review(flow):
     """Your medical review page fixture."""
-    return YourMedicalReviewPage(page)
+    return flow.your_medical_review
 
 @pytest.fixture(scope="function")
-def check_eligibility(page):
+def check_eligibility(flow):
     """Check eligibility page fixture."""
-    return CheckEligibilityPage(page)
+    return flow.check_eligibility
 
 @pytest.fixture(scope="function")
-def submission_form(page):
+def submission_form(flow):
     """Submission form page fixture."""
-    return SubmissionFormPage(page)
+    return flow.submission_form
 # ------------------- Test Data Fixtures ------------------- #
 
 @pytest.fixture(scope="function")
@@ -393,6 +994,10 @@ def user_data():
     currently_taking_medicine = rnd.choice(["Yes", "No"])
     understand_state_of_mind = rnd.choice(["I'm Ready!", "I'm feeling hopeful", "I'm cautious"])
     info_shared_with_medical_team = rnd.choice(["Yes", "No"])
+    health_conditions = [
+        "End-stage liver disease (cirrhosis)",
+        "Cancer (active diagnosis, active treatment, or in remission or cancer-free for less than 5 continuous years - does not apply to non-melanoma skin cancer that was considered cured via simple excision)",
+    ]
     data = {
         "timestamp": timestamp,
         "feet": feet,
@@ -419,6 +1024,7 @@ def user_data():
         "currently_taking_medicine": str(currently_taking_medicine),
         "understand_state_of_mind": str(understand_state_of_mind),
         "info_shared_with_medical_team": str(info_shared_with_medical_team),
+        "health_conditions": health_conditions,
      }
 
     # Log the generated data
@@ -0,0 +1,67 @@
+"""
+Shortest-path canary through the qualification flow.
+
+Every branch of ``flow.spec`` is an ``Equals``/``Not`` condition on a single
+``user_data`` key, so the cost of a persona splits per key: ``cheapest_answers``
+prices each answer in ``BRANCH_CHOICES`` by the screens and calls it makes the
+flow run (extra arguments such as free-text details and uploads count as heavy)
+and keeps the cheapest. The canary drives that persona with verification off and
+images, media and fonts blocked, against a strict time budget: ``canary_budget``
+is a ``StepBudget`` whose every deadline is the end of the canary, so while it is
+active no wait inside any step outlives the budget.
+"""
+from typing import Dict, Iterable, Sequence
+
+from playwright.sync_api import BrowserContext, Route
+
+from flow.plan import VERIFY, Step, condition_key
+from utils.step_budget import StepBudget
+
+SCREEN_COST = 5         # a screen transition outweighs any single call on it
+HEAVY_RESOURCE_TYPES = ("image", "media", "font")
+
+
+def _op_cost(op) -> int:
+    # Each argument is something typed, picked or uploaded on the screen
+    return 1 + len(op.args)
+
+
+def path_cost(steps: Iterable[Step], key: str, value: str, verify: bool = False) -> int:
+    """Cost of the screens and calls that depend on ``user_data[key] == value``."""
+    persona = {key: value}
+    cost = 0
+    for step in steps:
+        if condition_key(step.when) == key:
+            if not step.when(persona):
+                continue
+            cost += SCREEN_COST + sum(_op_cost(op) for op in step.ops if verify or op.kind != VERIFY)
+            continue
+        for op in step.ops:
+            if condition_key(op.when) == key and op.when(persona):
+                cost += _op_cost(op)
+    return cost
+
+
+def cheapest_answers(steps: Sequence[Step], choices: Dict[str, Sequence[str]]) -> Dict[str, str]:
+    """The lowest-cost answer for every branching key (first declared choice wins ties)."""
+    return {key: min(options, key=lambda value: path_cost(steps, key, value)) for key, options in choices.items()}
+
+
+def canary_data(user_data: Dict, steps: Sequence[Step], choices: Dict[str, Sequence[str]]) -> Dict:
+    """``user_data`` with every branching answer replaced by the cheapest one."""
+    return {**user_data, **cheapest_answers(steps, choices)}
+
+
+def canary_budget(seconds: float) -> StepBudget:
+    """Step budget that caps every wait of the canary by the time left of ``seconds`` overall."""
+    return StepBudget({}, default_s=seconds, total_s=seconds)
+
+
+def block_heavy_resources(context: BrowserContext):
+    """Abort image, media and font requests of every page and frame of ``context``."""
+    def handle(route: Route):
+        if route.request.resource_type in HEAVY_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    context.route("**/*", handle)
@@ -0,0 +1,76 @@
+"""
+Lazy page-object facade for the MEDVi qualification flow.
+
+``FlowContext`` exposes every page object as an attribute named after its
+fixture (``flow.goal_weight``, ``flow.gpl`` …). A page module is imported and its
+page object constructed only on first access, then cached in a slot, so tests
+and segments only pay for the pages they actually reach.
+"""
+import importlib
+from typing import Dict, Tuple
+
+from playwright.sync_api import Page
+
+from utils.answer_ledger import AnswerLedger
+
+# Fixture name -> (module, class). Nothing here is imported until it is used.
+PAGE_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "home_page": ("pages.home_page", "HomePage"),
+    "height_weight_page": ("pages.height_weight_page", "HeightWeightPage"),
+    "goal_weight": ("pages.goal_weight_page", "GoalWeightPage"),
+    "gender_and_age": ("pages.gender_age_page", "GenderAndAgePage"),
+    "experience_illness": ("pages.experience_illness_page", "ExperienceIllnessPage"),
+    "priority": ("pages.priority_page", "PriorityPage"),
+    "rank": ("pages.rank_page", "RankPage"),
+    "metabolic_graph": ("pages.metabolic_graph_page", "MetabolicGraphPage"),
+    "gpl": ("pages.glp1_page", "GLP1Page"),
+    "frank_new_man": ("pages.frank_new_man_page", "FrankNewManPage"),
+    "reasons": ("pages.reasons_page", "ReasonsPage"),
+    "lose_weight": ("pages.lose_weight_page", "LoseWeightPage"),
+    "analyze_metabolism": ("pages.analyze_metabolism_page", "AnalyzeMetabolismPage"),
+    "sleep_check": ("pages.sleep_check_page", "SleepCheckPage"),
+    "sleep_hours": ("pages.sleep_hours_page", "SleepHoursPage"),
+    "body_review": ("pages.body_review_page", "BodyReviewPage"),
+    "health_conditions": ("pages.health_conditions_page", "HealthConditionsPage"),
+    "additional_health_questions": ("pages.additional_health_questions_page", "AdditionalHealthQuestionsPage"),
+    "taken_medication": ("pages.taken_medication_page", "TakenMedicationPage"),
+    "glp1_medicine": ("pages.glp1_medicine_page", "GLP1MedicinePage"),
+    "last_three_month_medication": ("pages.last_three_month_medication_page", "lastThreeMonthMedicationPage"),
+    "surgery_weight_loss": ("pages.surgery_weight_loss_page", "SurgeryWeightLossPage"),
+    "weight_loss_program": ("pages.weight_loss_program_page", "WeightLossProgramPage"),
+    "clinically_appropriate": ("pages.clinically_appropriate_page", "ClinicallyAppropriatePage"),
+    "weight_change_last_year": ("pages.weight_change_last_year_page", "WeightChangeLastYearPage"),
+    "average_blood_pressure_range": ("pages.average_blood_pressure_range_page", "AverageBloodPressureRangePage"),
+    "body_changing_img": ("pages.body_changing_img_page", "BodyChangingImgPage"),
+    "average_resting_heart_rate": ("pages.average_resting_heart_rate_page", "AverageRestingHeartRatePage"),
+    "best_medicine_match": ("pages.best_medicine_match_page", "BestMedicineMatchPage"),
+    "currently_taking_medicine": ("pages.currently_taking_medicine_page", "CurrentlyTakingMedicinePage"),
+    "understand_state_of_mind": ("pages.understand_state_of_mind_page", "UnderstandStateOfMindPage"),
+    "info_shared_with_medical_team": ("pages.info_shared_with_medical_team_page", "InfoSharedWithMedicalTeamPage"),
+    "your_need": ("pages.your_need_page", "YourNeedPage"),
+    "date_of_birth": ("pages.date_of_birth_page", "DateOfBirthPage"),
+    "your_medical_review": ("pages.your_medical_review_page", "YourMedicalReviewPage"),
+    "check_eligibility": ("pages.check_eligibility_page", "CheckEligibilityPage"),
+    "submission_form": ("pages.submission_form_page", "SubmissionFormPage"),
+}
+
+
+class FlowContext:
+    """Page objects of one flow run, constructed lazily and cached per attribute."""
+
+    __slots__ = ("page", "ledger") + tuple(PAGE_REGISTRY)
+
+    def __init__(self, page: Page):
+        self.page = page
+        # Answers entered through any page object of this run (see utils.answer_ledger)
+        self.ledger = AnswerLedger.for_page(page)
+
+    def __getattr__(self, name):
+        # Only reached while the slot is still empty, i.e. on first access
+        try:
+            module_name, class_name = PAGE_REGISTRY[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no page object '{name}'") from None
+        page_object = getattr(importlib.import_module(module_name), class_name)(self.page)
+        setattr(self, name, page_object)
+        return page_object
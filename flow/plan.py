@@ -0,0 +1,328 @@
+"""
+Compiler from the declarative flow spec (``flow.spec``) to an execution plan.
+
+The spec lists screens; each names its page object (a ``FlowContext`` attribute)
+and the calls made on it, with arguments bound to ``user_data`` keys and optional
+branch conditions. ``compile_flow`` validates the spec — contiguous step numbers,
+known page objects, existing methods, argument counts, answering methods for
+``Answer`` ops — and builds ``Step`` objects whose ``run`` executes those calls.
+
+Validation has to import every page module, so its outcome is cached in
+``.medvi_plan_cache.json`` under a fingerprint of the spec and of the files of the
+page modules and the repo modules they import (``BasePage``, the answer ledger
+that marks answering methods, …): as long as none of them changes, compiling is
+pure Python and page modules stay lazily imported.
+
+    python -m flow.plan            # validate and print the plan (bindings, branches)
+"""
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from flow.context import PAGE_REGISTRY
+
+CACHE_PATH = Path(os.getenv("MEDVI_PLAN_CACHE", ".medvi_plan_cache.json"))
+
+DO = "do"
+VERIFY = "verify"
+ANSWER = "answer"
+
+
+class FlowSpecError(ValueError):
+    """The flow spec is inconsistent with itself or with the page objects."""
+
+
+# ---------------------- Spec Language ---------------------- #
+
+class Data(NamedTuple):
+    """Bind an argument to ``user_data[key]`` (the whole ``user_data`` when ``key`` is None)."""
+    key: Optional[str] = None
+
+    def resolve(self, user_data: Dict) -> Any:
+        return user_data if self.key is None else user_data[self.key]
+
+
+class Derived(NamedTuple):
+    """Bind an argument to ``func(user_data)``; ``reads`` lists the keys it uses."""
+    func: Callable[[Dict], Any]
+    reads: Tuple[str, ...] = ()
+
+    def resolve(self, user_data: Dict) -> Any:
+        return self.func(user_data)
+
+    def __repr__(self) -> str:
+        return f"Derived({self.func.__module__}.{self.func.__qualname__}, {self.reads!r})"
+
+
+class Equals(NamedTuple):
+    """Branch condition ``user_data[key] == value`` (case-insensitive)."""
+    key: str
+    value: str
+
+    def __call__(self, user_data: Dict) -> bool:
+        return str(user_data[self.key]).lower() == self.value.lower()
+
+
+class Not(NamedTuple):
+    condition: Any
+
+    def __call__(self, user_data: Dict) -> bool:
+        return not self.condition(user_data)
+
+
+class Op(NamedTuple):
+    kind: str
+    method: str
+    args: Tuple[Any, ...]
+    when: Optional[Callable[[Dict], bool]] = None
+
+
+def Do(method: str, *args, when=None) -> Op:
+    """Navigation or waiting call."""
+    return Op(DO, method, args, when)
+
+
+def Verify(method: str, *args, when=None) -> Op:
+    """Check without side effects on the answers; skippable."""
+    return Op(VERIFY, method, args, when)
+
+
+def Answer(method: str, *args, when=None) -> Op:
+    """Call of an answering method (recorded in the answer ledger)."""
+    return Op(ANSWER, method, args, when)
+
+
+NEXT = Do("hit_next_button")
+
+
+class Screen(NamedTuple):
+    number: int
+    title: str
+    page: str
+    ops: Tuple[Op, ...]
+    when: Optional[Callable[[Dict], bool]] = None
+
+
+def screen(number: int, title: str, page: str, *ops: Op, when=None) -> Screen:
+    """A step; with ``when`` the whole screen only appears for matching personas."""
+    return Screen(number, title, page, ops, when)
+
+
+# ---------------------- Plan ---------------------- #
+
+def _resolve(arg, user_data: Dict):
+    return arg.resolve(user_data) if isinstance(arg, (Data, Derived)) else arg
+
+
+def condition_key(condition) -> Optional[str]:
+    """``user_data`` key an ``Equals``/``Not`` condition tests."""
+    while isinstance(condition, Not):
+        condition = condition.condition
+    return condition.key if isinstance(condition, Equals) else None
+
+
+def _reads(op: Op) -> FrozenSet[str]:
+    keys = set()
+    for arg in op.args:
+        if isinstance(arg, Data):
+            keys.add(arg.key or "*")
+        elif isinstance(arg, Derived):
+            keys.update(arg.reads)
+    if condition_key(op.when):
+        keys.add(condition_key(op.when))
+    return frozenset(keys)
+
+
+class Step(NamedTuple):
+    number: int
+    title: str
+    run: Callable[..., None]
+    page: str = ""
+    ops: Tuple[Op, ...] = ()
+    when: Optional[Callable[[Dict], bool]] = None
+
+    @property
+    def reads(self) -> FrozenSet[str]:
+        """``user_data`` keys the step depends on (``*`` = all of it)."""
+        keys = frozenset().union(*(_reads(op) for op in self.ops))
+        return keys | {condition_key(self.when)} if condition_key(self.when) else keys
+
+    @property
+    def branches(self) -> bool:
+        return self.when is not None or any(op.when is not None for op in self.ops)
+
+    @property
+    def verify_only(self) -> bool:
+        """Nothing but checks and the 'Next' click (skippable once its screen is trusted)."""
+        return all(op.kind == VERIFY or op == NEXT for op in self.ops)
+
+
+def _runner(page: str, ops: Tuple[Op, ...], when):
+    def run(pages, user_data, verify: bool = True):
+        if when is not None and not when(user_data):
+            return
+        page_object = getattr(pages, page)
+        for op in ops:
+            if op.kind == VERIFY and not verify:
+                continue
+            if op.when is not None and not op.when(user_data):
+                continue
+            getattr(page_object, op.method)(*(_resolve(arg, user_data) for arg in op.args))
+    return run
+
+
+class Plan(NamedTuple):
+    steps: Tuple[Step, ...]
+    fingerprint: str
+
+    def select(self, first: int = 1, last: Optional[int] = None, skip: Iterable[int] = ()) -> List[Step]:
+        """Steps ``first``..``last`` (inclusive) minus the ``skip`` numbers."""
+        last = last or self.steps[-1].number
+        skip = set(skip)
+        return [s for s in self.steps if first <= s.number <= last and s.number not in skip]
+
+    def prefix_key(self, number: int) -> str:
+        """Digest of steps 1..``number``: equal keys mean plans share that prefix (and its checkpoints)."""
+        prefix = [(s.number, s.page, s.ops, s.when) for s in self.steps if s.number <= number]
+        return hashlib.sha1(repr(prefix).encode("utf-8")).hexdigest()[:16]
+
+    def reads(self, first: int = 1, last: Optional[int] = None) -> FrozenSet[str]:
+        return frozenset().union(*(s.reads for s in self.select(first, last)))
+
+
+# ---------------------- Compiler ---------------------- #
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _module_file(module_name: str) -> Optional[Path]:
+    """Source file of ``module_name`` if it is a module of this repo (found without importing anything)."""
+    base = ROOT.joinpath(*module_name.split("."))
+    for path in (base.with_name(base.name + ".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+def _imported_names(path: Path) -> Iterable[str]:
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+            # ``from utils import wait_model`` imports a module, not a name
+            yield from (f"{node.module}.{alias.name}" for alias in node.names)
+
+
+def module_files(module_names: Iterable[str]) -> Dict[str, Path]:
+    """Files of ``module_names`` and of every repo module they import, transitively."""
+    files, pending = {}, list(module_names)
+    while pending:
+        module_name = pending.pop()
+        if module_name in files:
+            continue
+        path = _module_file(module_name)
+        if path is None:
+            continue
+        files[module_name] = path
+        pending.extend(_imported_names(path))
+    return files
+
+
+def page_modules(screens: Sequence[Screen]) -> Dict[str, Path]:
+    """``module_files`` of the page modules ``screens`` refer to."""
+    return module_files({PAGE_REGISTRY[s.page][0] for s in screens if s.page in PAGE_REGISTRY})
+
+
+def fingerprint(screens: Sequence[Screen], files: Optional[Dict[str, Path]] = None) -> str:
+    """
+    Digest of the spec and of ``files`` (by default the page modules and the repo
+    modules they import). Raises OSError when one of the files is gone.
+    """
+    digest = hashlib.sha1(repr(tuple(screens)).encode("utf-8"))
+    for module_name, path in sorted((page_modules(screens) if files is None else files).items()):
+        stat = path.stat()
+        digest.update(f"{module_name}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def validate(screens: Sequence[Screen]):
+    """Raise FlowSpecError on the first inconsistency; imports the page modules."""
+    numbers = [s.number for s in screens]
+    if numbers != list(range(1, len(screens) + 1)):
+        raise FlowSpecError(f"Step numbers must run 1..{len(screens)} in order, got {numbers}")
+    for s in screens:
+        where = f"Step {s.number} ({s.title})"
+        if s.page not in PAGE_REGISTRY:
+            raise FlowSpecError(f"{where}: unknown page object '{s.page}'")
+        module_name, class_name = PAGE_REGISTRY[s.page]
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for op in s.ops:
+            method = getattr(cls, op.method, None)
+            if not callable(method):
+                raise FlowSpecError(f"{where}: {class_name} has no method '{op.method}'")
+            if op.kind == ANSWER and not hasattr(method, "__answer_key__"):
+                raise FlowSpecError(f"{where}: {class_name}.{op.method} is not an answering method")
+            try:
+                inspect.signature(method).bind(None, *op.args)
+            except TypeError as e:
+                raise FlowSpecError(f"{where}: {class_name}.{op.method}{op.args!r}: {e}") from None
+
+
+def _cached(screens: Sequence[Screen]) -> Optional[str]:
+    """
+    Fingerprint of the last validation if nothing it covered has changed. The module
+    list is cached with it: a new import can only appear in a file that changed.
+    """
+    try:
+        cache = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        files = {name: Path(path) for name, path in cache["modules"].items()}
+        key = fingerprint(screens, files)
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+    return key if cache.get("validated") == key else None
+
+
+def _store(key: str, files: Dict[str, Path]):
+    tmp = CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"validated": key, "modules": {n: str(p) for n, p in files.items()}}),
+                       encoding="utf-8")
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        pass  # read-only checkout: validate again next time
+
+
+def compile_flow(screens: Sequence[Screen]) -> Plan:
+    """Validate ``screens`` (unless cached) and build the execution plan."""
+    key = _cached(screens)
+    if key is None:
+        files = page_modules(screens)
+        key = fingerprint(screens, files)
+        validate(screens)
+        _store(key, files)
+    steps = tuple(Step(s.number, s.title, _runner(s.page, s.ops, s.when), s.page, s.ops, s.when)
+                  for s in screens)
+    return Plan(steps, key)
+
+
+def main():
+    # Run as a script this module is __main__; use the flow.plan the spec was built with
+    from flow import plan as compiler
+    from flow.spec import FLOW
+
+    compiler.validate(FLOW)
+    plan = compiler.compile_flow(FLOW)
+    for s in plan.steps:
+        flags = ("branch " if s.branches else "") + ("verify-only" if s.verify_only else "")
+        print(f"{s.number:>3}  {s.page:<32} {flags:<19} {', '.join(sorted(s.reads)) or '-'}")
+    print(f"✅ {len(plan.steps)} steps valid, reading {len(plan.reads())} user_data keys")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Replay recorded answer ledgers against the live form.
+
+A ledger (``reports/answer_ledger.jsonl``, see ``utils.answer_ledger``) holds every
+answer a test entered, keyed by ``PageClass.method``. Replaying runs the regular
+``flow.steps`` with a page-object facade that feeds each answering method its
+recorded value instead of the step's ``user_data`` argument, so a failed run is
+reproduced on exactly the same path. The steps' ``Verify`` calls are skipped
+unless ``--verify`` is given; every other call runs as recorded. ``--stop-at``
+ends after a step and ``--checkpoint-at`` saves the checkpoint of the segment
+ending at that step (with the recorded persona) for the segment tests to resume
+from.
+
+    python -m flow.replay reports/answer_ledger.jsonl [--test NODEID] [--stop-at 20]
+"""
+import argparse
+import inspect
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import Page, sync_playwright
+
+from flow.context import FlowContext
+from flow.segments import SEGMENTS, Segment
+from flow.steps import STEPS
+from utils.answer_ledger import PERSONA_KEY
+from utils.checkpoint import CheckpointStore
+
+log = logging.getLogger("Replay")
+
+
+def load_ledgers(path: str) -> Dict[str, List[dict]]:
+    """Answers of a ledger stream grouped by test id, in recorded order."""
+    ledgers: Dict[str, List[dict]] = defaultdict(list)
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            answer = json.loads(line)
+            ledgers[answer.get("test", path)].append(answer)
+    return dict(ledgers)
+
+
+class _ReplayPage:
+    """One page object whose answering methods take their values from the ledger."""
+
+    def __init__(self, page_object, answers: Dict[str, Deque]):
+        self._page_object = page_object
+        self._answers = answers
+
+    def __getattr__(self, name):
+        method = getattr(self._page_object, name)
+        key = getattr(method, "__answer_key__", None)
+        if key is not None:
+            return lambda *args, **kwargs: self._answer(key, method)
+        return method
+
+    def _answer(self, key: str, method):
+        recorded = self._answers.get(key)
+        if not recorded:
+            # The recorded run never answered this (branch not taken or never reached)
+            log.info(f"⏭️ No recorded answer for {key}, skipped")
+            return None
+        value = recorded.popleft()
+        if value is None:
+            return method()
+        parameters = [p for p in inspect.signature(method).parameters.values()
+                      if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        if isinstance(value, list) and len(parameters) > 1:
+            return method(*value)
+        return method(value)
+
+
+class ReplayContext:
+    """``FlowContext`` stand-in handing out ``_ReplayPage`` wrappers."""
+
+    def __init__(self, page: Page, answers: List[dict]):
+        self._flow = FlowContext(page)
+        self._answers: Dict[str, Deque] = defaultdict(deque)
+        for answer in answers:
+            self._answers[answer["key"]].append(answer["value"])
+        self.page = page
+        self.ledger = self._flow.ledger
+
+    def __getattr__(self, name):
+        wrapper = _ReplayPage(getattr(self._flow, name), self._answers)
+        setattr(self, name, wrapper)
+        return wrapper
+
+
+class _ReplayData(dict):
+    """
+    ``user_data`` of a replay: the recorded persona when the stream has one (used by
+    ``--verify`` checks); answers come from the ledger, so missing keys read as "".
+    """
+
+    def __missing__(self, key):
+        return ""
+
+
+class ReplayResult(NamedTuple):
+    test: str
+    passed: bool
+    last_step: int
+    seconds: float
+    error: Optional[str]
+
+
+class ReplayFailed(Exception):
+    def __init__(self, step: int, error: Exception):
+        super().__init__(f"Step {step}: {error}")
+        self.step = step
+
+
+def checkpoint_segment(step: int) -> Segment:
+    """The segment ending at ``step``, whose checkpoint ``--checkpoint-at step`` writes."""
+    segment = next((s for s in SEGMENTS if s.last == step), None)
+    if segment is None:
+        raise ValueError(f"Step {step} does not end a segment; use one of {[s.last for s in SEGMENTS]}")
+    return segment
+
+
+def replay(page: Page, answers: List[dict], verify: bool = False, stop_at: Optional[int] = None,
+           checkpoint_at: Optional[int] = None, checkpoints: Optional[CheckpointStore] = None) -> int:
+    """Drive the flow on ``page`` from ``answers``; returns the last step that ran."""
+    persona = next((a["value"] for a in answers if a["key"] == PERSONA_KEY), {})
+    segment = checkpoint_segment(checkpoint_at) if checkpoint_at is not None else None
+    if segment is not None and not persona:
+        # Segment tests resume from the checkpoint's user_data, the ledger answers alone cannot stand in
+        raise ValueError(f"No recorded {PERSONA_KEY!r} in this ledger, cannot write checkpoint '{segment.name}'")
+    pages = ReplayContext(page, [a for a in answers if a["key"] != PERSONA_KEY])
+    user_data = _ReplayData(persona)
+    last = stop_at or STEPS[-1].number
+    for s in STEPS:
+        if s.number > last:
+            break
+        log.info(f"▶️ Step {s.number}: {s.title}")
+        try:
+            s.run(pages, user_data, verify=verify)
+        except Exception as e:
+            raise ReplayFailed(s.number, e) from e
+        if segment is not None and s.number == segment.last:
+            (checkpoints or CheckpointStore()).save(segment.name, page, dict(persona), segment.version)
+    return last
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-drive the MEDVi flow from recorded answer ledgers.")
+    parser.add_argument("ledgers", nargs="+", help="Answer ledger JSONL files")
+    parser.add_argument("--test", help="Only replay the ledger of this test id")
+    parser.add_argument("--verify", action="store_true", help="Also run the verify-only page-object calls")
+    parser.add_argument("--stop-at", type=int, help="Stop after this step")
+    parser.add_argument("--checkpoint-at", type=int,
+                        help="Save the checkpoint of the segment ending at this step (e.g. 10 writes 'intro')")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+    if args.checkpoint_at is not None:
+        try:
+            checkpoint_segment(args.checkpoint_at)
+        except ValueError as e:
+            parser.error(str(e))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    runs = [(test, answers) for path in args.ledgers for test, answers in load_ledgers(path).items()
+            if args.test is None or test == args.test]
+    results: List[ReplayResult] = []
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch(headless=not args.headed)
+        for test, answers in runs:
+            context = browser.new_context()
+            page = context.new_page()
+            started = time.perf_counter()
+            try:
+                last = replay(page, answers, args.verify, args.stop_at, args.checkpoint_at)
+                results.append(ReplayResult(test, True, last, time.perf_counter() - started, None))
+            except ReplayFailed as e:
+                results.append(ReplayResult(test, False, e.step, time.perf_counter() - started, str(e.__cause__)))
+            except ValueError as e:
+                results.append(ReplayResult(test, False, 0, time.perf_counter() - started, str(e)))
+            finally:
+                context.close()
+        browser.close()
+
+    for result in results:
+        status = "✅" if result.passed else f"❌ step {result.last_step}: {(result.error or '').split(chr(10))[0]}"
+        print(f"{result.seconds:7.1f}s  {result.test}  {status}")
+    failed = sum(not result.passed for result in results)
+    print(f"{len(results) - failed}/{len(results)} ledgers replayed")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
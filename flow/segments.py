@@ -0,0 +1,114 @@
+"""
+Segments of the MEDVi qualification flow.
+
+A segment is a contiguous run of steps from ``flow.steps``. Each segment starts
+from the checkpoint of the segment it depends on, so a failure only re-runs its
+own segment instead of the whole 37-step test. Checkpoints outlive the session
+(the end-to-end test and every driven prefix refresh them) and are versioned by
+the flow prefix they were taken after, so segments do not wait for each other:
+under xdist they spread over the workers, and one that finds no current
+checkpoint drives its prefix itself.
+"""
+import logging
+from typing import List, NamedTuple, Optional
+
+import allure
+
+from flow.steps import PLAN, run_steps
+from utils.base_page import BasePage
+from utils.checkpoint import CheckpointStore
+
+# Short on purpose: a wrong landing screen should fall back to driving the prefix
+# instead of burning the generic 10s timeout.
+PROBE_TIMEOUT = 5000
+
+
+class Segment(NamedTuple):
+    name: str
+    first: int
+    last: int
+    depends: Optional[str]
+    # XPath of an element inside the iframe that is only shown on the first
+    # screen of the segment — used to confirm a restored checkpoint landed there.
+    probe: Optional[str]
+
+    @property
+    def version(self) -> str:
+        """Version of the checkpoint taken after this segment (changes with any step up to ``last``)."""
+        return PLAN.prefix_key(self.last)
+
+
+SEGMENTS: List[Segment] = [
+    Segment("intro", 1, 10, None, None),
+    Segment(
+        "metabolic_info", 11, 16, "intro",
+        "//span[contains(text(), 'Improving your life requires ')]",
+    ),
+    Segment(
+        "health_history", 17, 20, "metabolic_info",
+        "//span[contains(normalize-space(.), 'Do any of these apply to you?')]",
+    ),
+    Segment(
+        "medication", 21, 30, "health_history",
+        "//span[text() ='Within the last 3 months, have you taken opiate pain medications and/or opiate-based street drugs?']",
+    ),
+    Segment(
+        "review", 31, 35, "medication",
+        "//div[normalize-space(text())=\"I'm Ready!\"]",
+    ),
+    Segment(
+        "submission", 36, 37, "review",
+        "//*[text() ='how can you be reached if necessary?']",
+    ),
+]
+
+SEGMENTS_BY_NAME = {s.name: s for s in SEGMENTS}
+DEPENDENCIES = {s.depends for s in SEGMENTS if s.depends}
+
+
+def run_segments(flow, user_data, last: int, checkpoints: CheckpointStore):
+    """Run steps 1..``last`` segment by segment, saving the checkpoint after each one a segment depends on."""
+    for segment in SEGMENTS:
+        if segment.first > last:
+            break
+        run_steps(flow, user_data, segment.first, min(segment.last, last))
+        if segment.last <= last and segment.name in DEPENDENCIES:
+            checkpoints.save(segment.name, flow.page, user_data, segment.version)
+
+
+def restore_checkpoint(segment: Segment, page, checkpoint: dict) -> bool:
+    """
+    Open the checkpoint's URL on ``page`` (whose context was created from the
+    checkpoint's storage state) and confirm it lands on the first screen of ``segment``.
+    """
+    log = logging.getLogger("Segments")
+    try:
+        page.goto(checkpoint["url"], timeout=60000, wait_until="domcontentloaded")
+        page.frame_locator(BasePage.IFRAME_SELECTOR).locator(segment.probe).wait_for(
+            state="visible", timeout=PROBE_TIMEOUT
+        )
+    except Exception as e:
+        log.warning(f"⚠️ Checkpoint '{segment.depends}' did not restore: {e}. Driving prefix…")
+        return False
+    log.info(f"♻️ Segment '{segment.name}' resumed from checkpoint '{segment.depends}'")
+    return True
+
+
+def start_segment(segment: Segment, flow, user_data, checkpoint: Optional[dict],
+                  checkpoints: CheckpointStore) -> dict:
+    """
+    Bring ``flow.page`` to the first screen of ``segment`` and return the user data to use.
+
+    ``checkpoint`` is the restored checkpoint of the segment it depends on (see
+    ``restore_checkpoint``); without one, the page starts from a clean context and
+    the preceding steps are driven from the start with the given ``user_data``,
+    saving the checkpoints passed on the way for the segments still to start.
+    """
+    if segment.depends is None:
+        return user_data
+    if checkpoint is not None:
+        return checkpoint["user_data"]
+
+    with allure.step(f"Drive steps 1-{segment.first - 1} to reach segment '{segment.name}'"):
+        run_segments(flow, user_data, segment.first - 1, checkpoints)
+    return user_data
@@ -0,0 +1,217 @@
+"""
+Declarative definition of the MEDVi qualification flow.
+
+One ``screen`` per step: the page object it runs on (a ``FlowContext`` attribute)
+and the calls made on it, in order. ``Data("key")`` binds an argument to
+``user_data["key"]``, ``when=`` makes a call conditional on the persona.
+``flow.plan.compile_flow`` validates this list and turns it into ``flow.steps.STEPS``.
+"""
+from pathlib import Path
+
+from flow.plan import NEXT, Answer, Data, Derived, Do, Equals, Not, Verify, screen
+from utils.eligibility_oracle import predict
+
+GLP1_PHOTO = str(Path(__file__).resolve().parents[1] / "data" / "shery_1.jpg")
+GLP1_TAKEN = "Yes, I've taken GLP-1 medication"
+
+# Answers the persona can give for every key a branch condition tests
+BRANCH_CHOICES = {
+    "taken_medication": (GLP1_TAKEN, "No", "Yes, I've taken a different medication for weight loss"),
+    "last_three_month_medication": ("Yes", "No"),
+    "surgery_weight_loss": ("Yes", "No"),
+    "weight_loss_program": ("Yes", "No"),
+}
+
+
+def outcome_message(user_data):
+    """Submission message the eligibility oracle predicts for the persona."""
+    return predict(user_data).message
+
+
+def _yes_no_details(method: str, key: str, details: str):
+    """Answer 'Yes' plus free-text details, or plain 'No', depending on ``user_data[key]``."""
+    return (
+        Answer(method, Data(key), details, when=Equals(key, "yes")),
+        Answer(method, "No", when=Not(Equals(key, "yes"))),
+    )
+
+
+FLOW = (
+    screen(1, "Navigate to MEDVi and start Assessment flow", "home_page",
+           Do("open"),
+           Do("click_get_started")),
+    screen(2, "Fill height and weight details", "height_weight_page",
+           Do("wait_for_iframe_ready"),
+           Verify("verify_height_weight_page_heading_and_image_displayed"),
+           Verify("verify_what_is_your_height_and_weight_question_displayed"),
+           Answer("select_feet", Data("feet")),
+           Answer("select_inches", Data("inches")),
+           Answer("add_weight", Data("weight")),
+           NEXT),
+    screen(3, "Set goal weight", "goal_weight",
+           Verify("verify_goal_weight_page_heading_displayed"),
+           Answer("add_goal_weight", Data("goal_weight")),
+           NEXT),
+    screen(4, "Select gender and age", "gender_and_age",
+           Verify("verify_gender_and_age_content_visible"),
+           Answer("select_gender", Data("gender")),
+           Answer("select_age", Data("age")),
+           NEXT),
+    screen(5, "Select experience illness", "experience_illness",
+           Verify("verify_experience_illness_content_visible"),
+           Answer("select_experience_illness", Data("experience_illness")),
+           NEXT),
+    screen(6, "Set priority goal", "priority",
+           Verify("verify_priority_content_visible"),
+           Answer("select_goal", Data("priority")),
+           NEXT),
+    screen(7, "Verify ranking section", "rank",
+           Verify("verify_rank_content_visible"),
+           Verify("verify_rank"),
+           NEXT),
+    screen(8, "Verify metabolic graph", "metabolic_graph",
+           Verify("verify_metabolic_graph_content_visible"),
+           Verify("verify_graph"),
+           NEXT),
+    screen(9, "Verify testimonial section", "frank_new_man",
+           Verify("verify_recommendation_visible"),
+           NEXT),
+    screen(10, "Verify GLP-1 informational content", "gpl",
+           Verify("verify_glp1_content"),
+           Verify("wait_for_glp1_graph"),
+           Verify("verify_glp1_content"),
+           NEXT),
+    screen(11, "Select reasons for weight loss", "reasons",
+           Verify("verify_reasons_heading_visible"),
+           Answer("select_reason", Data("reason")),
+           NEXT),
+    screen(12, "Choose weight loss expectations", "lose_weight",
+           Verify("verify_lose_weight_heading"),
+           Answer("select_lose_weight", Data("lose_weight")),
+           NEXT),
+    screen(13, "Verify 'Analyze Metabolism' content", "analyze_metabolism",
+           Verify("verify_analyze_metabolism_content"),
+           NEXT),
+    screen(14, "Complete sleep routine check", "sleep_check",
+           Verify("verify_sleep_routine_heading_visible"),
+           Answer("select_sleep_routine", Data("sleep")),
+           NEXT),
+    screen(15, "Set sleep hours", "sleep_hours",
+           Verify("verify_sleep_heading_and_image"),
+           Answer("select_sleep_hours", Data("sleep_hours")),
+           NEXT),
+    screen(16, "Verify body review content", "body_review",
+           Verify("verify_body_review_content"),
+           NEXT),
+    screen(17, "Verify and select health conditions", "health_conditions",
+           Verify("verify_health_conditions_content"),
+           Answer("verify_and_select_conditions", Data("health_conditions")),
+           NEXT),
+    screen(18, "Complete additional health questions", "additional_health_questions",
+           Verify("verify_page_headings"),
+           Verify("verify_all_conditions_visible"),
+           Answer("select_conditions", [
+               "Sleep apnea",
+               "Hypertension (high blood pressure)",
+               "None of these",
+           ]),
+           NEXT),
+    screen(19, "Select taken medication", "taken_medication",
+           Answer("select_taken_medication", Data("taken_medication")),
+           NEXT),
+    screen(20, "Enter GLP-1 medicine details", "glp1_medicine",
+           Answer("enter_name_dose_frequency"),
+           Answer("enter_last_dose_days", Data("last_dose_days")),
+           Answer("enter_starting_weight"),
+           Do("upload_glp1_photo", GLP1_PHOTO),
+           Do("agree_to_move_forward"),
+           NEXT,
+           when=Equals("taken_medication", GLP1_TAKEN)),
+    screen(21, "Tell me last three month medication you took or not", "last_three_month_medication",
+           Verify("verify_last_three_month_medication_heading"),
+           *_yes_no_details("select_last_three_month_medication_option",
+                            "last_three_month_medication", "Panadol"),
+           NEXT),
+    screen(22, "Tell me surgery weight loss you had or not", "surgery_weight_loss",
+           Verify("verify_surgery_weight_loss_heading"),
+           *_yes_no_details("select_surgery_weight_loss_option",
+                            "surgery_weight_loss", "Laser treatment in 2024"),
+           NEXT),
+    screen(23, "Tell me weight loss program you had or not", "weight_loss_program",
+           Verify("verify_weight_loss_program_heading"),
+           *_yes_no_details("select_weight_loss_program_option",
+                            "weight_loss_program", "Weight Watchers"),
+           NEXT),
+    screen(24, "Select clinically appropriate option", "clinically_appropriate",
+           Verify("verify_clinically_appropriate_heading"),
+           Answer("select_clinically_appropriate_option", Data("clinically_appropriate")),
+           NEXT),
+    screen(25, "Select weight change last year option", "weight_change_last_year",
+           Verify("verify_weight_change_last_year_heading"),
+           Answer("select_weight_change_last_year_option", Data("weight_change_last_year")),
+           NEXT),
+    screen(26, "Verify body changing img heading and image", "body_changing_img",
+           Verify("verify_body_changing_img_heading"),
+           NEXT),
+    screen(27, "Select average blood pressure range option", "average_blood_pressure_range",
+           Verify("verify_average_blood_pressure_range_heading"),
+           Answer("select_average_blood_pressure_range_option"),
+           NEXT),
+    screen(28, "Select average resting heart rate option", "average_resting_heart_rate",
+           Verify("verify_average_resting_heart_rate_heading"),
+           Answer("select_average_resting_heart_rate_option"),
+           NEXT),
+    screen(29, "Select best medicine match option", "best_medicine_match",
+           Verify("verify_best_medicine_match_heading"),
+           Answer("select_best_medicine_match", Data("best_medicine_match")),
+           Answer("select_glp1_tablet_or_injection", Data("glp1_tablet_or_injection")),
+           NEXT),
+    screen(30, "Select currently taking medicine option", "currently_taking_medicine",
+           Verify("verify_currently_taking_medicine_heading_and_image_displayed"),
+           Answer("select_currently_taking_medicine_option", Data("currently_taking_medicine")),
+           NEXT),
+    screen(31, "Select understand state of mind option", "understand_state_of_mind",
+           Verify("verify_understand_state_of_mind_heading", Data("goal_weight")),
+           Answer("select_understand_state_of_mind_option", Data("understand_state_of_mind")),
+           NEXT),
+    screen(32, "Select info shared with medical team option", "info_shared_with_medical_team",
+           Verify("verify_info_shared_with_medical_team_heading_displayed"),
+           Answer("select_info_shared_with_medical_team_option", Data("info_shared_with_medical_team")),
+           NEXT),
+    screen(33, "Select multiple 'Your Need' options", "your_need",
+           Verify("verify_your_need_heading_displayed"),
+           Verify("verify_all_options_visible"),
+           Answer("select_multiple_options", [
+               "Maintaining muscle mass as I lose weight",
+               "Improving cognitive function and mental clarity",
+               "Improving sleep quality",
+           ]),
+           NEXT),
+    screen(34, "Select date of birth", "date_of_birth",
+           Verify("verify_date_of_birth_heading_displayed"),
+           Answer("select_month", "November"),
+           Answer("select_day", "23"),
+           Answer("add_year", "1995"),
+           NEXT),
+    screen(35, "Verify your medical review content", "your_medical_review",
+           Verify("verify_your_medical_review_heading_displayed"),
+           Verify("verify_your_medical_review_content_displayed"),
+           Verify("verify_review_values", Data()),
+           Answer("add_first_name", "Shahriyar"),
+           Answer("add_last_name", "Abid"),
+           Answer("select_shipping_state", "AZ"),
+           NEXT),
+    screen(36, "Check Eligibility", "check_eligibility",
+           Verify("verify_check_eligibility_content_displayed"),
+           Answer("add_email", "testqashahriyar@gmail.com"),
+           Answer("add_phone", "2025553600"),
+           Verify("verify_image_displayed"),
+           NEXT),
+    screen(37, "Verify submission form page heading displayed", "submission_form",
+           Verify("verify_submission_form_page_heading_displayed",
+                  Derived(outcome_message, ("health_conditions",))),
+           Verify("verify_review_matches_answers"),
+           Do("verify_edit_info_is_working"),
+           Do("hit_check_eligibility_button"),
+           Do("hit_submit_button")),
+)
@@ -0,0 +1,62 @@
+"""
+Steps of the MEDVi qualification flow.
+
+The flow itself is declared in ``flow.spec`` and compiled by ``flow.plan`` into
+``PLAN``; ``STEPS`` are its steps, each with a ``run(pages, user_data)`` where
+``pages`` is the ``FlowContext`` exposing the page objects by fixture name
+(``pages.goal_weight`` …). The end-to-end test and the segment tests both drive
+the flow through ``run_steps``, so the order and the page-object calls live in
+exactly one place.
+
+A step that ends with the 'Next' click returns once the screen bridge reports the
+following screen, so the next step starts on a form that has already moved on
+instead of each page object's first wait absorbing the transition.
+"""
+import logging
+from typing import Callable, Dict, Iterable, List
+
+import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from flow.plan import NEXT, Step, compile_flow
+from flow.spec import FLOW
+
+PLAN = compile_flow(FLOW)
+STEPS: List[Step] = list(PLAN.steps)
+
+# Called as ``listener(pages, step)`` right before each step runs (e.g. golden snapshots).
+STEP_LISTENERS: List[Callable[[object, Step], None]] = []
+
+log = logging.getLogger(__name__)
+
+
+def run_steps(pages, user_data: Dict[str, str], first: int = 1, last: int = None,
+              skip: Iterable[int] = (), verify: bool = True):
+    """
+    Run steps ``first``..``last`` (inclusive), each inside its own Allure step.
+    Step numbers in ``skip`` are left out; ``verify=False`` skips the verify-only calls.
+    """
+    for s in PLAN.select(first, last, skip):
+        with allure.step(f"Step {s.number}: {s.title}"):
+            for listener in STEP_LISTENERS:
+                listener(pages, s)
+            advances = _advances(s, user_data)
+            previous = getattr(pages, s.page).current_screen() if advances else None
+            s.run(pages, user_data, verify=verify)
+            if advances:
+                _wait_for_next_screen(getattr(pages, s.page), previous)
+
+
+def _advances(step: Step, user_data: Dict[str, str]) -> bool:
+    """Whether ``step`` will end with the 'Next' click for this persona."""
+    if not step.ops or step.ops[-1] != NEXT:
+        return False
+    return step.when is None or step.when(user_data)
+
+
+def _wait_for_next_screen(page_object, previous):
+    try:
+        page_object.wait_for_next_screen(previous)
+    except PlaywrightTimeoutError as e:
+        # The next page object's own waits still decide whether the flow is stuck
+        log.warning(f"⚠️ {e}")
@@ -1,14 +1,21 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 from typing import List
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class AdditionalHealthQuestionsPage(BasePage):
     """Handles the 'Additional Health Questions' step in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_conditions": "Do any of these apply to you?"}
+
+    SCREEN = """
+    - text "A few more health questions"
+    - text "Do any of these apply to you?"
+    """
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -19,10 +26,12 @@ class AdditionalHealthQuestionsPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -57,10 +66,7 @@ class AdditionalHealthQuestionsPage(BasePage):
 
     def _verify_page_headings(self):
         self.log.info("🔍 Verifying page headings...")
-        main_heading = self.frame.locator("//span[normalize-space(text())='A few more health questions']")
-        sub_heading = self.frame.locator("//span[normalize-space(text())='Do any of these apply to you?']")
-        expect(main_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(sub_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.verify_screen()
 
     def _verify_all_conditions_visible(self):
         self.log.info("🔍 Verifying all conditions are visible...")
@@ -68,10 +74,11 @@ class AdditionalHealthQuestionsPage(BasePage):
         missing_conditions = []
 
         for condition in conditions:
-            quote = '"' if "'" in condition else "'"
-            locator = self.frame.locator(f"//div[normalize-space(text())={quote}{condition}{quote}]")
+            locator = self.locator("option", text=condition)
             try:
-                expect(locator).to_be_visible(timeout=7000)
+                self.expect_visible(locator, 7000)
+            except BudgetExceeded:
+                raise
             except Exception:
                 missing_conditions.append(condition)
                 self.log.warning(f"⚠️ Condition not visible: {condition}")
@@ -90,21 +97,22 @@ class AdditionalHealthQuestionsPage(BasePage):
                 self.log.warning(f"⚠️ Invalid condition '{selection}' (skipped)")
                 continue
 
-            quote = '"' if "'" in selection else "'"
-            locator = self.frame.locator(f"//div[normalize-space(text())={quote}{selection}{quote}]")
+            locator = self.locator("option", text=selection)
 
             try:
-                locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+                self.wait_visible(locator)
                 locator.scroll_into_view_if_needed()
                 locator.click()
-                expect(locator).to_be_visible(timeout=5000)
+                self.expect_visible(locator, 5000)
                 self.log.info(f"✅ Selected: {selection}")
+            except BudgetExceeded:
+                raise
             except Exception as e:
                 self.log.error(f"❌ Failed to select '{selection}': {e}")
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
 
     # ---------------------- Internal Helpers ---------------------- #
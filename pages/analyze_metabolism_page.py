@@ -1,13 +1,17 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class AnalyzeMetabolismPage(BasePage):
     """Handles the 'Analyze Metabolism' step in the MEDVi Typeform flow."""
 
+    LOCATORS = {
+        "analyze_text": "//p[contains(normalize-space(.), 'analyze your metabolism')]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +22,12 @@ class AnalyzeMetabolismPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -44,12 +50,10 @@ class AnalyzeMetabolismPage(BasePage):
 
     def _verify_analyze_metabolism_content(self):
         self.log.info("🔍 Verifying analyze metabolism content...")
-        analyze_text = self.frame.locator(
-            "//p[contains(normalize-space(.), 'analyze your metabolism')]"
-        )
-        expect(analyze_text).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        analyze_text = self.locator("analyze_text")
+        self.expect_visible(analyze_text)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,32 +1,28 @@
-from playwright.sync_api import Page, expect
-import logging
+from playwright.sync_api import Page
 import allure
+from utils.base_page import BasePage
 
 
-class AverageBloodPressureRangePage:
+class AverageBloodPressureRangePage(BasePage):
     """Handles the 'Additional Health Questions' step in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    LOCATORS = {
+        "image": "img[src*='3d858dffa6d6_1.png']",
+        "heading": "//span[text() ='What is your average blood pressure range?']",
+    }
 
     def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("AverageBloodPressureRangePage")
-
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
-    
+        super().__init__(page)
+
     @allure.step("Verify average blood pressure range heading and image")
     def verify_average_blood_pressure_range_heading(self):
         self.log.info(f"💊 Verifying image displayed:")
-        verify_image_displayed = self.frame.locator("img[src*='3d858dffa6d6_1.png']")
-        expect(verify_image_displayed).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        verify_image_displayed = self.locator("image")
+        self.expect_visible(verify_image_displayed)
         self.log.info(f"✅ Image displayed verified successfully")
 
         self.log.info(f"💊 Verifying average blood pressure range heading:")
-        is_visible = self.frame.locator("//span[text() ='What is your average blood pressure range?']").is_visible()
+        is_visible = self.locator("heading").is_visible()
         if is_visible:
             print("✅ Average blood pressure range heading is visible on the page")
         else:
@@ -36,8 +32,8 @@ class AverageBloodPressureRangePage:
     def select_average_blood_pressure_range_option(self):
         self.log.info(f"💊 Selecting average blood pressure range option:")
         # Click Yes or No
-        option_locator = self.frame.locator("//div[normalize-space(text())='<120/80 (Normal)']")
-        option_locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        option_locator = self.locator("option", text="<120/80 (Normal)")
+        self.wait_visible(option_locator)
         option_locator.scroll_into_view_if_needed()
         option_locator.click()
         self.log.info(f"✅ Selected option: <120/80 (Normal)")
@@ -45,7 +41,7 @@ class AverageBloodPressureRangePage:
     @allure.step("Click 'Next' button")
     def hit_next_button(self):
         """Click the 'Next' button."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
         self.log.info("➡️ Clicked 'Next' button")
\ No newline at end of file
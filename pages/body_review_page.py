@@ -1,13 +1,19 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class BodyReviewPage(BasePage):
     """Handles the 'Body Review' step in the MEDVi Typeform flow."""
 
+    LOCATORS = {
+        "heading": "//h2[contains(@class, 'ql-align-center')]",
+        "text_content": "//p[contains(@class, 'ql-align-center')]",
+        "image": "img[src*='/13.png']",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +24,12 @@ class BodyReviewPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -44,18 +52,14 @@ class BodyReviewPage(BasePage):
 
     def _verify_body_review_content(self):
         self.log.info("🔍 Verifying Body Review content...")
-        heading = self.frame.locator(
-            "//h2[contains(@class, 'ql-align-center')]"
-        )
-        text_content = self.frame.locator(
-            "//p[contains(@class, 'ql-align-center')]"
-        )
-        image = self.frame.locator("img[src*='/13.png']")
-        expect(text_content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(image).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        text_content = self.locator("text_content")
+        image = self.locator("image")
+        self.expect_visible(text_content)
+        self.expect_visible(heading)
+        self.expect_visible(image)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,35 +1,32 @@
-from playwright.sync_api import Page, expect
-import logging
+from playwright.sync_api import Page
 import allure
+from utils.base_page import BasePage
 
 
-class ClinicallyAppropriatePage:
+class ClinicallyAppropriatePage(BasePage):
     """Handles the 'Additional Health Questions' step in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    REVIEW_QUESTIONS = {"select_clinically_appropriate_option": "If clinically appropriate"}
+
+    LOCATORS = {
+        "heading": "//span[normalize-space(text())='If clinically appropriate, are you willing to:']",
+    }
 
     def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("ClinicallyAppropriatePage")
-
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
-    
+        super().__init__(page)
+
     @allure.step("Verify clinically appropriate heading")
     def verify_clinically_appropriate_heading(self):
         self.log.info(f"💊 Verifying clinically appropriate heading:")
-        verify_surgery_weight_loss_heading = self.frame.locator("//span[normalize-space(text())='If clinically appropriate, are you willing to:']")
-        expect(verify_surgery_weight_loss_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        verify_surgery_weight_loss_heading = self.locator("heading")
+        self.expect_visible(verify_surgery_weight_loss_heading)
         self.log.info(f"✅ Clinically appropriate heading verified successfully")
 
     @allure.step("Select clinically appropriate option")
     def select_clinically_appropriate_option(self, option: str):
         self.log.info(f"💊 Selecting clinically appropriate option: {option}")
-        option_locator = self.frame.locator(f"//div[normalize-space(text())='{option}']")
-        option_locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        option_locator = self.locator("option", text=option)
+        self.wait_visible(option_locator)
         option_locator.scroll_into_view_if_needed()
         option_locator.click()
         self.log.info(f"✅ Selected clinically appropriate option: {option}")
@@ -37,7 +34,7 @@ class ClinicallyAppropriatePage:
     @allure.step("Click 'Next' button")
     def hit_next_button(self):
         """Click the 'Next' button."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
         self.log.info("➡️ Clicked 'Next' button")
\ No newline at end of file
@@ -1,35 +1,33 @@
-import logging
 import allure
 from playwright.sync_api import Page, expect
+from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
-class DateOfBirthPage:
+class DateOfBirthPage(BasePage):
     """Handles the 'Date of Birth' step in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    REVIEW_QUESTIONS = {
+        "select_day": "date of birth",
+        "select_month": "date of birth",
+        "add_year": "date of birth",
+    }
 
-    def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("DateOfBirthPage") 
+    SCREEN = """
+    - text "What is your date of birth?"
+    - heading "Month"
+    - heading "Day"
+    - heading "Year"
+    """
 
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
+    def __init__(self, page: Page):
+        super().__init__(page)
 
     @allure.step("Verify date of birth heading displayed")
     def verify_date_of_birth_heading_displayed(self):
         """Verify the date of birth heading displayed."""
         self.log.info("🔍 Verifying date of birth heading displayed...")
-        heading = self.frame.locator("//span[text() ='What is your date of birth?']")
-        label_month = self.frame.locator("//h3[text() ='Month']")
-        label_day = self.frame.locator("//h3[text() ='Day']")
-        label_year = self.frame.locator("//h3[text() ='Year']")
-        expect(label_month).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(label_day).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(label_year).to_be_visible(timeout=self.DEFAULT_TIMEOUT)    
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.verify_screen()
         self.log.info("✅ Date of birth heading displayed verified successfully")
     
     def _retry_action(self, func, retries=3, delay=2):
@@ -37,10 +35,12 @@ class DateOfBirthPage:
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -64,23 +64,23 @@ class DateOfBirthPage:
         self.log.info(f"✅ Filled year: {value}")
 
     def _select_dropdown(self, position: int, value: str):
-        dropdown = self.frame.locator(f"(//div[@data-cy='dropdown-component'])[{position}]//input")
-        dropdown.wait_for(state="visible", timeout=10000)
+        dropdown = self.locator("dropdown_input", index=position)
+        self.wait_visible(dropdown, 10000)
         dropdown.click()
         dropdown.fill(value)
         self.page.keyboard.press("Enter")
 
     def _fill_year(self, value: str):
-        year_input = self.frame.locator("(//input[@data-cy='input-component'])[1]")
-        year_input.wait_for(state="visible", timeout=10000)
+        year_input = self.locator("input", index=1)
+        self.wait_visible(year_input, 10000)
         year_input.fill(value)
         expect(year_input).to_have_value(value)
 
     @allure.step("Click 'Next' button on date of birth page")
     def hit_next_button(self):
         """Click the 'Next' button to continue."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
         self.log.info("➡️ Clicked 'Next' button")
         
\ No newline at end of file
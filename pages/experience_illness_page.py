@@ -1,13 +1,15 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class ExperienceIllnessPage(BasePage):
     """Handles 'Experience Illness' step interactions in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_experience_illness": "experience any of the following"}
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +20,12 @@ class ExperienceIllnessPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -31,8 +35,8 @@ class ExperienceIllnessPage(BasePage):
     def verify_experience_illness_content_visible(self):
         """Verify the experience illness content is visible."""
         self.log.info("🔍 Verifying experience illness content is visible...")
-        content = self.frame.locator("//*[normalize-space(text())='Do you experience any of the following?']")
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        content = self.locator("text", text="Do you experience any of the following?")
+        self.expect_visible(content)
         self.log.info("✅ Experience illness content is visible verified successfully")
 
     @allure.step("Select experience illness option")
@@ -53,16 +57,15 @@ class ExperienceIllnessPage(BasePage):
         clean_value = experience_illness_value.strip()
         self.log.info(f"🩺 Selecting experience illness: '{clean_value}'")
 
-        safe_value = self.escape_xpath_text(clean_value)
-        option_locator = self.frame.locator(f"//div[normalize-space(text())={safe_value}]")
+        option_locator = self.locator("option", text=clean_value)
 
-        option_locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        self.wait_visible(option_locator)
         option_locator.scroll_into_view_if_needed()
-        expect(option_locator).to_be_visible(timeout=5000)
+        self.expect_visible(option_locator, 5000)
         option_locator.click()
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
 
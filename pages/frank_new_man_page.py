@@ -1,13 +1,17 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class FrankNewManPage(BasePage):
     """Handles testimonial verification in the MEDVi Typeform flow."""
 
+    LOCATORS = {
+        "recommendation": "//h2[contains(@class, 'ql-align-center')] | //p[contains(@class, 'ql-align-center')]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +22,12 @@ class FrankNewManPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -45,13 +51,11 @@ class FrankNewManPage(BasePage):
     def _verify_recommendation(self):
         self.log.info("🔍 Verifying testimonial visibility...")
         # Combine both locators (h2 + p) into one
-        recommendation_locator = self.frame.locator(
-            "//h2[contains(@class, 'ql-align-center')] | //p[contains(@class, 'ql-align-center')]"
-        )
+        recommendation_locator = self.locator("recommendation")
         # Wait for visibility
-        expect(recommendation_locator.first).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.expect_visible(recommendation_locator.first)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,13 +1,29 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class GenderAndAgePage(BasePage):
     """Handles gender and age selection interactions in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {
+        "select_gender": "male or female",
+        "select_age": "age range",
+    }
+
+    SCREEN = """
+    - text /^Medication can be tailored to/
+    - text "Are you male or female?"
+    - text "What is your age range?"
+    """
+
+    LOCATORS = {
+        "listbox": "//div[@role = 'listbox']",
+        "option_containing": "//div[contains(text(), {text})]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +34,12 @@ class GenderAndAgePage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -31,12 +49,7 @@ class GenderAndAgePage(BasePage):
     def verify_gender_and_age_content_visible(self):
         """Verify the gender and age content is visible."""
         self.log.info("🔍 Verifying gender and age content is visible...")
-        content = self.frame.locator("//span[text() ='Medication can be tailored to ']")
-        option_1 = self.frame.locator("//span[normalize-space(text())='Are you male or female?']")
-        option_2 = self.frame.locator("//span[normalize-space(text())='What is your age range?']")
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(option_1).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(option_2).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.verify_screen()
         self.log.info("✅ Gender and age content is visible verified successfully")
 
     @allure.step("Select gender")
@@ -61,19 +74,19 @@ class GenderAndAgePage(BasePage):
 
     def _select_gender(self, gender: str):
         self.log.info(f"👤 Selecting gender: {gender}")
-        gender_locator = self.frame.locator(f"//div[normalize-space(text())='{gender}']")
-        gender_locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        gender_locator = self.locator("option", text=gender)
+        self.wait_visible(gender_locator)
         gender_locator.scroll_into_view_if_needed()
         gender_locator.click()
 
     def _select_age(self, age: str):
         self.log.info(f"🎂 Selecting age range: {age}")
-        dropdown = self.frame.locator("(//div[@data-cy='dropdown-component'])[1]//input")
+        dropdown = self.locator("dropdown_input", index=1)
         dropdown.scroll_into_view_if_needed()
         dropdown.click(force=True)
-        listbox = self.frame.locator("//div[@role = 'listbox']")
+        listbox = self.locator("listbox")
         listbox.scroll_into_view_if_needed()
-        expect(listbox).to_be_visible(timeout=5000)
+        self.expect_visible(listbox, 5000)
 
         # Common text patterns that might appear in the dropdown
         search_terms = [age]
@@ -84,7 +97,7 @@ class GenderAndAgePage(BasePage):
 
         found = False
         for term in search_terms:
-            option = self.frame.locator(f"//div[contains(text(), '{term}')]")
+            option = self.locator("option_containing", text=term)
             if option.count() > 0:
                 option.first.click()
                 found = True
@@ -96,6 +109,6 @@ class GenderAndAgePage(BasePage):
             raise RuntimeError(msg)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
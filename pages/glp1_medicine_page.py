@@ -1,51 +1,51 @@
 
-from playwright.sync_api import Page, expect
-import logging
+from playwright.sync_api import Page
 import allure
+from utils.base_page import BasePage
 
 
-class GLP1MedicinePage:
+class GLP1MedicinePage(BasePage):
     """Handles GLP-1 medicine step interactions in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    REVIEW_QUESTIONS = {
+        "name_dose_frequency": "name, dose, and frequency",
+        "enter_last_dose_days": "last dose",
+        "starting_weight": "starting weight",
+    }
+
+    LOCATORS = {
+        "name_dose_heading": "//span[text() ='Please list the name, dose, and frequency of your GLP-1 medication.']",
+        "name_dose_frequency": "//*[@id='widget-qbjC']//textarea",
+        "last_dose_heading": "//span[text() ='When was your last dose of medication?']",
+        "last_dose_option": "//div[text()={text}]",
+        "starting_weight_heading": "//span[text() ='What was your starting weight in pounds?']",
+        "upload_photo_heading": "//h3[text() ='Please take or upload a photo of your GLP-1 medication']",
+        "upload_input": "(//input[@type='file'])[1]",
+        "agree_to_move_forward_heading": "//span[text() ='Do you agree to only obtain weight loss medication through this program moving forward?']",
+    }
 
     def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("GLP1MedicinePage")
+        super().__init__(page)
 
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
-    
-    def escape_xpath_text(self, text: str) -> str:
-        if "'" not in text:
-            return f"'{text}'"
-        if '"' not in text:
-            return f'"{text}"'
-        parts = text.split("'")
-        return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
-    
     @allure.step("Enter name dose frequency")
     def enter_name_dose_frequency(self):
         """Enter name dose frequency."""
         self.log.info(f"💊 Entering name dose frequency:")
-        verify_name_dose_heading = self.frame.locator("//span[text() ='Please list the name, dose, and frequency of your GLP-1 medication.']")
-        expect(verify_name_dose_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        name_dose_frequency = self.frame.locator("//*[@id='widget-qbjC']//textarea")
-        name_dose_frequency.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
-        name_dose_frequency.fill("Panadol 100mg")
+        verify_name_dose_heading = self.locator("name_dose_heading")
+        self.expect_visible(verify_name_dose_heading)
+        name_dose_frequency = self.locator("name_dose_frequency")
+        self.wait_visible(name_dose_frequency)
+        self.fill(name_dose_frequency, "Panadol 100mg", "name_dose_frequency")
         self.log.info(f"✅ Name dose frequency entered successfully")
 
     @allure.step("Enter last dose days")
     def enter_last_dose_days(self, last_dose_days: str):    
         """Selects the option for last dose days dynamically."""
         self.log.info(f"💉 Selecting last dose days: '{last_dose_days}'")
-        verify_last_dose_heading = self.frame.locator("//span[text() ='When was your last dose of medication?']")
-        expect(verify_last_dose_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        option_locator = self.frame.locator(f"//div[text()='{last_dose_days}']")
-        option_locator.wait_for(state="visible", timeout=10000)
+        verify_last_dose_heading = self.locator("last_dose_heading")
+        self.expect_visible(verify_last_dose_heading)
+        option_locator = self.locator("last_dose_option", text=last_dose_days)
+        self.wait_visible(option_locator, 10000)
         option_locator.scroll_into_view_if_needed()
         option_locator.click()
 
@@ -55,34 +55,34 @@ class GLP1MedicinePage:
     def enter_starting_weight(self):
         """Enter starting weight."""
         self.log.info(f"💊 Entering starting weight:")
-        verify_starting_weight_heading = self.frame.locator("//span[text() ='What was your starting weight in pounds?']")
-        expect(verify_starting_weight_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        starting_weight = self.frame.locator("(//input[@data-cy='input-component'])[1]")
-        starting_weight.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
-        starting_weight.fill("90")
+        verify_starting_weight_heading = self.locator("starting_weight_heading")
+        self.expect_visible(verify_starting_weight_heading)
+        starting_weight = self.locator("input", index=1)
+        self.wait_visible(starting_weight)
+        self.fill(starting_weight, "90", "starting_weight")
         self.log.info(f"✅ Starting weight entered successfully")
 
     @allure.step("Upload GLP-1 medication photo")
     def upload_glp1_photo(self, file_path: str):
         """Uploads a GLP-1 medication photo file."""
-        verify_upload_glp1_photo_heading = self.frame.locator("//h3[text() ='Please take or upload a photo of your GLP-1 medication']")
+        verify_upload_glp1_photo_heading = self.locator("upload_photo_heading")
         verify_upload_glp1_photo_heading.scroll_into_view_if_needed()
-        expect(verify_upload_glp1_photo_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.expect_visible(verify_upload_glp1_photo_heading)
         self.log.info(f"📸 Uploading medication photo: {file_path}")
-        upload_input = self.frame.locator("(//input[@type='file'])[1]")
+        upload_input = self.locator("upload_input")
         upload_input.set_input_files(file_path)
-        expect(upload_input).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.expect_visible(upload_input)
         self.log.info("✅ Photo uploaded successfully")
 
     @allure.step("Do you agree to move forward with his program")
     def agree_to_move_forward(self):
         """Agree to move forward with the program."""
         self.log.info("💊 Agreeing to move forward with the program.")
-        verify_agree_to_move_forward_heading = self.frame.locator("//span[text() ='Do you agree to only obtain weight loss medication through this program moving forward?']")
+        verify_agree_to_move_forward_heading = self.locator("agree_to_move_forward_heading")
         verify_agree_to_move_forward_heading.scroll_into_view_if_needed()
-        expect(verify_agree_to_move_forward_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        agree_to_move_forward = self.frame.locator("//div[normalize-space(text())='Yes']")
-        agree_to_move_forward.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        self.expect_visible(verify_agree_to_move_forward_heading)
+        agree_to_move_forward = self.locator("option", text="Yes")
+        self.wait_visible(agree_to_move_forward)
         agree_to_move_forward.click()
         self.log.info("✅ Agreed to move forward with the program.")
 
@@ -90,8 +90,8 @@ class GLP1MedicinePage:
     @allure.step("Click 'Next' button")
     def hit_next_button(self):
         """Click the 'Next' button."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click(force=True)
         self.log.info("➡️ Clicked 'Next' button")
-        self.page.wait_for_timeout(1000)
\ No newline at end of file
+        self.page.wait_for_timeout(self.budgeted(1000))
\ No newline at end of file
@@ -1,13 +1,19 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class GLP1Page(BasePage):
     """Handles GLP-1 informational section in the MEDVi Typeform flow."""
 
+    LOCATORS = {
+        "graph_image": "img[src*='ChatGPT-Image-Mar-27-2025-01_16_53-PM.png']",
+        "content_heading": "text=How will GLP-1 work for you?",
+        "week": "//p[contains(text(), {text})]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +24,12 @@ class GLP1Page(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,46 +58,41 @@ class GLP1Page(BasePage):
 
     def _wait_for_glp1_graph(self, max_wait: int):
         self.log.info("🔄 Waiting for GLP-1 graph to appear...")
-        glp1_image = self.frame.locator(
-            "img[src*='ChatGPT-Image-Mar-27-2025-01_16_53-PM.png']"
-        )
+        glp1_image = lambda: self.locator("graph_image")
         try:
-            expect(glp1_image).to_be_visible(timeout=max_wait)
+            # A stalled iframe is reloaded by the frame watchdog long before max_wait
+            self.expect_visible(glp1_image(), max_wait)
+        except BudgetExceeded:
+            raise
         except Exception as e:
             self.log.warning(f"⚠️ GLP-1 graph not visible yet: {e}. Reloading iframe…")
             try:
-                self.page.evaluate(
-                    f"document.querySelector('{self.IFRAME_SELECTOR}').src = "
-                    f"document.querySelector('{self.IFRAME_SELECTOR}').src"
-                )
-                self.page.wait_for_timeout(4000)
-                expect(glp1_image).to_be_visible(timeout=max_wait)
+                self.reload_frame()
+                self.expect_visible(glp1_image(), max_wait)
                 self.log.info("✅ GLP-1 graph became visible after iframe reload")
+            except BudgetExceeded:
+                raise
             except Exception as reload_error:
                 msg = f"❌ GLP-1 graph failed to load after reload: {reload_error}"
                 self.log.error(msg)
                 raise TimeoutError(msg)
+        self.verify_image_hash("ChatGPT-Image-Mar-27-2025-01_16_53-PM.png")
 
     def _verify_glp1_content(self):
         self.log.info("🔍 Verifying GLP-1 informational content...")
         elements = [
-            self.frame.locator("text=How will GLP-1 work for you?"),
-            self.frame.locator("xpath=//p[contains(text(), 'Week 1-4')]"),
-            self.frame.locator("xpath=//p[contains(text(), 'Week 4-8')]"),
-            self.frame.locator("xpath=//p[contains(text(), 'Week 9+')]"),
+            self.locator("content_heading"),
+            self.locator("week", text="Week 1-4"),
+            self.locator("week", text="Week 4-8"),
+            self.locator("week", text="Week 9+"),
         ]
 
-        missing = []
-        for el in elements:
-            try:
-                expect(el).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-            except Exception as e:
-                missing.append(str(e))
-
-        if missing:
-            self.log.warning(f"⚠️ Some GLP-1 content not visible:\n" + "\n".join(missing))
+        descriptions = ["How will GLP-1 work for you?", "Week 1-4", "Week 4-8", "Week 9+"]
+        with self.soft_assert("GLP-1 content") as soft:
+            for el, description in zip(elements, descriptions):
+                soft.visible(el, description)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,14 +1,21 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 from typing import List
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class HealthConditionsPage(BasePage):
     """Handles the 'Health Conditions' step in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"verify_and_select_conditions": "Do any of these apply to you?"}
+
+    SCREEN = """
+    - text /Your answers are completely confidential and protected by HIPAA/
+    - text /Do any of these apply to you[?]/
+    """
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -19,10 +26,12 @@ class HealthConditionsPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -51,14 +60,7 @@ class HealthConditionsPage(BasePage):
 
     def _verify_health_conditions_content(self):
         self.log.info("🔍 Verifying Health Conditions content...")
-        disclaimer = self.frame.locator(
-            "//p[contains(normalize-space(.), 'Your answers are completely confidential and protected by HIPAA')]"
-        )
-        question_text = self.frame.locator(
-            "//span[contains(normalize-space(.), 'Do any of these apply to you?')]"
-        )
-        expect(disclaimer).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(question_text).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.verify_screen()
 
     def _verify_and_select_conditions(self, selections: List[str]):
         self.log.info("🩺 Verifying and selecting health conditions...")
@@ -72,25 +74,28 @@ class HealthConditionsPage(BasePage):
             "None of these",
         ]
 
+        with self.soft_assert("Health condition options") as soft:
+            soft.texts_visible(self, valid_conditions)
+
         for selection in selections:
             if selection not in valid_conditions:
                 self.log.warning(f"⚠️ Invalid condition '{selection}' (skipped)")
                 continue
-
-            safe_value = self.escape_xpath_text(selection)
-            locator = self.frame.locator(
-                f"//div[normalize-space(text())={safe_value}]"
-            )
+            if selection in soft.failures:
+                self.log.error(f"❌ Failed to select '{selection}': option not visible")
+                continue
 
             try:
-                locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+                locator = self.find_by_text(selection)
                 locator.scroll_into_view_if_needed()
                 locator.click()
                 self.log.info(f"✅ Selected: {selection}")
+            except BudgetExceeded:
+                raise
             except Exception as e:
                 self.log.error(f"❌ Failed to select '{selection}': {e}")
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
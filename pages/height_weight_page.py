@@ -1,31 +1,24 @@
 from playwright.sync_api import Page, expect
-import logging, time
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
-<<<<<<< HEAD
 class HeightWeightPage(BasePage):
+    REVIEW_QUESTIONS = {
+        "select_feet": "height",
+        "select_inches": "height",
+        "add_weight": "height and weight",
+    }
+
+    LOCATORS = {
+        "heading": "//span[text()= 'Reach your goal weight fast ']",
+        "image": "img[src*='11b763525bc6_2.png']",
+        "question": "//span[normalize-space(text())='What is your height and weight?']",
+    }
 
     def __init__(self, page: Page):
         super().__init__(page)
-=======
-
-class HeightWeightPage:
-    """Handles height and weight form interactions in the MEDVi Typeform iframe."""
-
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
-
-    def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("GoalWeightPage")      
-    
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
->>>>>>> 05e40f9d1bfb7fa324d475e2337bb12ea415a04e
 
     # ----------------------- Helpers -----------------------
 
@@ -34,10 +27,12 @@ class HeightWeightPage:
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -49,30 +44,28 @@ class HeightWeightPage:
 
         for attempt in range(1, max_retries + 1):
             try:
-<<<<<<< HEAD
                 # 1) Ensure iframe element is present
                 self.page.wait_for_selector(
                     self.IFRAME_SELECTOR, state="attached", timeout=self.DEFAULT_TIMEOUT
                 )
 
                 # 2) Ensure a known control inside iframe is visible (feet dropdown)
-                feet_input = self.frame.locator("(//div[@data-cy='dropdown-component'])[1]//input")
-                feet_input.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+                feet_input = self.locator("dropdown_input", index=1)
+                self.wait_visible(feet_input)
 
                 self.log.info("✅ Iframe loaded and first control visible")
-=======
-                self.page.wait_for_selector(self.IFRAME_SELECTOR, state="attached", timeout=10000)
-                # Just access the property to confirm the iframe is ready
-                _ = self.frame
-                self.log.info("✅ Iframe loaded and form visible!")
->>>>>>> 05e40f9d1bfb7fa324d475e2337bb12ea415a04e
                 return
+            except BudgetExceeded:
+                raise
             except Exception as e:
                 self.log.warning(f"⚠️ Iframe not ready (Attempt {attempt}/{max_retries}): {e}")
                 if attempt < max_retries:
-                    # Light recovery: reload page (or you could reassign iframe src)
-                    self.page.reload()
-                    time.sleep(3)
+                    # Stalls inside the iframe are already recovered by the frame watchdog;
+                    # reload just the iframe if it is there, the whole page otherwise
+                    if self.page.query_selector(self.IFRAME_SELECTOR) is not None:
+                        self.reload_frame()
+                    else:
+                        self.page.reload(wait_until="domcontentloaded", timeout=self.DEFAULT_TIMEOUT)
                 else:
                     raise TimeoutError("❌ Iframe failed to load after multiple retries.") from e
 
@@ -83,18 +76,19 @@ class HeightWeightPage:
     def verify_height_weight_page_heading_and_image_displayed(self):
         """Verify the height and weight page heading and image displayed."""
         self.log.info("🔍 Verifying height and weight page heading and image displayed...")
-        heading = self.frame.locator("//span[text()= 'Reach your goal weight fast ']")
-        image = self.frame.locator("img[src*='11b763525bc6_2.png']")
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(image).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        image = self.locator("image")
+        self.expect_visible(heading)
+        self.expect_visible(image)
+        self.verify_image_hash("11b763525bc6_2.png")
         self.log.info("✅ Height and weight page heading and image displayed verified successfully")
 
     @allure.step("Verify what is your height and weight question displayed")
     def verify_what_is_your_height_and_weight_question_displayed(self):
         """Verify the 'What is your height and weight?' question is visible."""
         self.log.info("🔍 Verifying what is your height and weight question displayed...")
-        question = self.frame.locator("//span[normalize-space(text())='What is your height and weight?']")
-        expect(question).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        question = self.locator("question")
+        self.expect_visible(question)
         self.log.info("✅ 'What is your height and weight?' question displayed successfully")
 
 
@@ -125,19 +119,19 @@ class HeightWeightPage:
     # ----------------------- Internal Methods -----------------------
 
     def _select_dropdown(self, position: int, value: str):
-        dropdown = self.frame.locator(f"(//div[@data-cy='dropdown-component'])[{position}]//input")
-        dropdown.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        dropdown = self.locator("dropdown_input", index=position)
+        self.wait_visible(dropdown)
         dropdown.click()
         dropdown.fill(value)
         self.page.keyboard.press("Enter")
 
     def _fill_input(self, value: str):
-        weight_input = self.frame.locator("(//input[@data-cy='input-component'])[1]")
-        weight_input.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        weight_input = self.locator("input", index=1)
+        self.wait_visible(weight_input)
         weight_input.fill(value)
         expect(weight_input).to_have_value(value, timeout=self.DEFAULT_TIMEOUT)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,8 +1,10 @@
 from playwright.sync_api import Page, expect
 from config.config import BASE_URL
-import logging, time
+import logging
 import allure
 
+from utils.step_budget import BudgetExceeded, cap
+
 
 class HomePage:
 
@@ -17,10 +19,12 @@ class HomePage:
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(cap(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -31,7 +35,7 @@ class HomePage:
     def open(self):
         """Open the MEDVi base URL and verify page load."""
         self.log.info(f"🌐 Navigating to: {BASE_URL}")
-        self.page.goto(BASE_URL, timeout=60000, wait_until="domcontentloaded")
+        self.page.goto(BASE_URL, timeout=cap(60_000), wait_until="domcontentloaded")
         expect(self.page).to_have_url(BASE_URL)
         self.log.info("✅ Home page loaded successfully")
 
@@ -41,7 +45,7 @@ class HomePage:
         link = lambda: self.page.get_by_role("link", name="AM I QUALIFIED?")
 
         def click_link():
-            link().wait_for(state="visible", timeout=15000)
+            link().wait_for(state="visible", timeout=cap(15_000))
             link().click()
             self.log.info("✅ Clicked 'AM I QUALIFIED?' button")
 
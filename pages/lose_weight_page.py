@@ -1,13 +1,15 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class LoseWeightPage(BasePage):
     """Handles the 'Lose Weight' step in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_lose_weight": "pace"}
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +20,12 @@ class LoseWeightPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -49,22 +53,18 @@ class LoseWeightPage(BasePage):
 
     def _verify_lose_weight_heading(self):
         self.log.info("🔍 Verifying lose weight heading...")
-        heading = self.frame.locator(
-            "//*[normalize-space(text())='How is that pace for you?']"
-        )
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("text", text="How is that pace for you?")
+        self.expect_visible(heading)
 
     def _select_lose_weight(self, lose_weight_value: str):
         self.log.info(f"⚖️ Selecting lose weight option: {lose_weight_value}")
-        safe_value = self.escape_xpath_text(lose_weight_value)
-        locator_str = f"//div[normalize-space(text())={safe_value}]"
-        option = self.frame.locator(locator_str)
-        option.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        option = self.locator("option", text=lose_weight_value)
+        self.wait_visible(option)
         option.scroll_into_view_if_needed()
-        expect(option).to_be_visible(timeout=5000)
+        self.expect_visible(option, 5000)
         option.click()
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
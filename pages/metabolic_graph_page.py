@@ -1,8 +1,8 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class MetabolicGraphPage(BasePage):
@@ -18,10 +18,12 @@ class MetabolicGraphPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -32,8 +34,8 @@ class MetabolicGraphPage(BasePage):
     def verify_metabolic_graph_content_visible(self):
         """Verify the metabolic graph content is visible."""
         self.log.info("🔍 Verifying metabolic graph content is visible...")
-        content = self.frame.locator("//*[normalize-space(text())='metabolic science.']")
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        content = self.locator("text", text="metabolic science.")
+        self.expect_visible(content)
         self.log.info("✅ Metabolic graph content is visible verified successfully")
 
     @allure.step("Verify metabolic graph is visible")
@@ -52,10 +54,10 @@ class MetabolicGraphPage(BasePage):
 
     def _verify_graph(self):
         self.log.info("🔍 Verifying metabolic graph...")
-        graph_img = self.frame.locator("img[src*='withmedvi.png']")
-        expect(graph_img).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.verify_asset("withmedvi.png")
+        self.verify_image_hash("withmedvi.png")
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
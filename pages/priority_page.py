@@ -1,13 +1,15 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class PriorityPage(BasePage):
     """Handles 'Priority' step interactions in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_goal": "your priority"}
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +20,12 @@ class PriorityPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,18 +54,17 @@ class PriorityPage(BasePage):
 
     def _verify_priority_content_visible(self):
         self.log.info("🔍 Verifying priority content is visible...")
-        content = self.frame.locator("//*[normalize-space(text())='Which of these is your priority?']")
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        content = self.locator("text", text="Which of these is your priority?")
+        self.expect_visible(content)
 
     def _select_goal(self, goal_value: str):
         self.log.info(f"🎯 Selecting goal: {goal_value}")
-        safe_value = self.escape_xpath_text(goal_value)
-        goal_option = self.frame.locator(f"//div[normalize-space(text())={safe_value}]")
-        goal_option.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        goal_option = self.locator("option", text=goal_value)
+        self.wait_visible(goal_option)
         goal_option.click()
-        expect(goal_option).to_be_visible(timeout=3000)
+        self.expect_visible(goal_option, 3000)
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
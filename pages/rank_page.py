@@ -1,8 +1,8 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class RankPage(BasePage):
@@ -18,10 +18,12 @@ class RankPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,16 +52,15 @@ class RankPage(BasePage):
 
     def _verify_rank_content_visible(self):
         self.log.info("🔍 Verifying rank content is visible...")
-        content = self.frame.locator("//*[normalize-space(text())='ranked #1']")
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        content = self.locator("text", text="ranked #1")
+        self.expect_visible(content)
 
     def _verify_rank(self):
-        self.log.info("🏆 Verifying Forbes rank image visibility...")
-        rank_image = self.frame.locator("img[src*='forbes-number-1.png']")
-        rank_image.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
-        expect(rank_image).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        self.log.info("🏆 Verifying Forbes rank image asset...")
+        self.verify_asset("forbes-number-1.png")
+        self.verify_image_hash("forbes-number-1.png")
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,13 +1,19 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class ReasonsPage(BasePage):
     """Handles reasons selection in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_reason": "Improving your life requires"}
+
+    LOCATORS = {
+        "heading": "//span[contains(text(), 'Improving your life requires ')]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +24,12 @@ class ReasonsPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,17 +58,16 @@ class ReasonsPage(BasePage):
 
     def _verify_reasons_heading(self):
         self.log.info("🔍 Verifying reasons heading...")
-        heading = self.frame.locator("//span[contains(text(), 'Improving your life requires ')]")
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        self.expect_visible(heading)
 
     def _select_reason(self, reason: str):
         self.log.info(f"🎯 Selecting reason: {reason}")
-        safe_value = self.escape_xpath_text(reason)
-        reason_locator = self.frame.locator(f"//div[normalize-space(text())={safe_value}]")
-        reason_locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        reason_locator = self.locator("option", text=reason)
+        self.wait_visible(reason_locator)
         reason_locator.click()
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
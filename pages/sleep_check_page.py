@@ -1,13 +1,19 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class SleepCheckPage(BasePage):
     """Handles the 'Sleep Check' step in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_sleep_routine": "How you sleep"}
+
+    LOCATORS = {
+        "heading": "//span[contains(normalize-space(.), 'How you sleep tells us a lot about your')]",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +24,12 @@ class SleepCheckPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,22 +58,18 @@ class SleepCheckPage(BasePage):
 
     def _verify_sleep_routine_heading(self):
         self.log.info("🔍 Verifying sleep routine heading...")
-        heading = self.frame.locator(
-            "//span[contains(normalize-space(.), 'How you sleep tells us a lot about your')]"
-        )
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        self.expect_visible(heading)
 
     def _select_sleep_routine(self, sleep_value: str):
         self.log.info(f"😴 Selecting sleep routine: {sleep_value}")
-        quote = '"' if "'" in sleep_value else "'"
-        locator_str = f"//div[normalize-space(text())={quote}{sleep_value}{quote}]"
-        sleep_option = self.frame.locator(locator_str)
-        sleep_option.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        sleep_option = self.locator("option", text=sleep_value)
+        self.wait_visible(sleep_option)
         sleep_option.scroll_into_view_if_needed()
-        expect(sleep_option).to_be_visible(timeout=5000)
+        self.expect_visible(sleep_option, 5000)
         sleep_option.click()
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
@@ -1,13 +1,19 @@
-from playwright.sync_api import Page, expect
-import logging, time
+from playwright.sync_api import Page
 import allure
 # pyright: ignore[reportMissingImports]
 from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
 class SleepHoursPage(BasePage):
     """Handles the 'Sleep Hours' step in the MEDVi Typeform flow."""
 
+    REVIEW_QUESTIONS = {"select_sleep_hours": "hours of sleep"}
+
+    LOCATORS = {
+        "image": "img[src*='id-1tAZd12DZCus/widgetid-k1Xy/hHZFcPL7X59pJZtoxUx5JW/gallaghergallagher_Romantic_lifestyle_photography_style_warm__cdfcbe67-e11e-45d2-8ef5-2f0a6d85ca4c_3.png']",
+    }
+
     def __init__(self, page: Page):
         super().__init__(page)
 
@@ -18,10 +24,12 @@ class SleepHoursPage(BasePage):
         for attempt in range(1, retries + 1):
             try:
                 return func()
+            except BudgetExceeded:
+                raise  # the step is out of time, retrying cannot help
             except Exception as e:
                 if attempt < retries:
                     self.log.warning(f"🔁 Attempt {attempt}/{retries} failed: {e}. Retrying in {delay}s…")
-                    time.sleep(delay)
+                    self.page.wait_for_timeout(self.budgeted(delay * 1000))
                 else:
                     self.log.error(f"❌ All {retries} attempts failed: {e}")
                     raise
@@ -50,26 +58,20 @@ class SleepHoursPage(BasePage):
 
     def _verify_sleep_heading_and_image(self):
         self.log.info("🔍 Verifying sleep heading and image...")
-        sleep_heading = self.frame.locator(
-            "//*[normalize-space(text())='How many hours of sleep do you usually get each night?']"
-        )
-        sleep_image = self.frame.locator(
-            "img[src*='id-1tAZd12DZCus/widgetid-k1Xy/hHZFcPL7X59pJZtoxUx5JW/gallaghergallagher_Romantic_lifestyle_photography_style_warm__cdfcbe67-e11e-45d2-8ef5-2f0a6d85ca4c_3.png']"
-        )
-        expect(sleep_heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(sleep_image).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        sleep_heading = self.locator("text", text="How many hours of sleep do you usually get each night?")
+        sleep_image = self.locator("image")
+        self.expect_visible(sleep_heading)
+        self.expect_visible(sleep_image)
 
     def _select_sleep_hours(self, sleep_hours: str):
         self.log.info(f"😴 Selecting sleep hours option: {sleep_hours}")
-        safe_value = self.escape_xpath_text(sleep_hours)
-        locator_str = f"//div[normalize-space(text())={safe_value}]"
-        sleep_option = self.frame.locator(locator_str)
-        sleep_option.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        sleep_option = self.locator("option", text=sleep_hours)
+        self.wait_visible(sleep_option)
         sleep_option.scroll_into_view_if_needed()
-        expect(sleep_option).to_be_visible(timeout=5000)
+        self.expect_visible(sleep_option, 5000)
         sleep_option.click()
 
     def _click_next(self):
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
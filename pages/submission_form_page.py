@@ -1,53 +1,70 @@
-import logging
 import allure
-from playwright.sync_api import Page, expect
+from typing import Optional
+from playwright.sync_api import Page
+from utils.answer_ledger import AnswerLedger, extract_review_table, reconcile
+from utils.base_page import BasePage
 
-class SubmissionFormPage:
+class SubmissionFormPage(BasePage):
     """Handles the 'Submission Form' step in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    LOCATORS = {
+        "heading": "//h1[text()= 'Please review your submission.']",
+        "outcome": "//p[text()= {text}]",
+        "edit_button": "(//*[text() = 'Edit'])[{index}]",
+        "submit_button": "//*[text()= 'Submit']",
+    }
 
     def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("SubmissionFormPage")
+        super().__init__(page)
     
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
-
     @allure.step("Verify submission form page heading displayed")
-    def verify_submission_form_page_heading_displayed(self):
-        """Verify the submission form page heading displayed."""
+    def verify_submission_form_page_heading_displayed(self, outcome_message: Optional[str]):
+        """Verify the heading and the outcome message predicted for the persona (if it has one)."""
         self.log.info("🔍 Verifying submission form page heading displayed...")
-        heading = self.frame.locator("//h1[text()= 'Please review your submission.']")
-        content = self.frame.locator("//p[text()= 'You have indicated a health condition which prevents you from being prescribed.']")
-        expect(heading).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
-        expect(content).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        self.expect_visible(heading)
+        if outcome_message:
+            content = self.locator("outcome", text=outcome_message)
+            self.expect_visible(content)
         self.log.info("✅ Submission form page heading and content displayed verified successfully")
 
+    @allure.step("Verify review answers match the entered answers")
+    def verify_review_matches_answers(self):
+        """Diff the whole review table against the answer ledger of this run in one pass."""
+        self.log.info("🔍 Reconciling review table with entered answers...")
+        self.expect_visible(self.locator("edit_button", index=1))
+        rows = extract_review_table(self.frame)
+        result = reconcile(AnswerLedger.for_page(self.page).latest(), rows)
+        table = "\n".join(f"{question}: {answer}" for question, answer in rows)
+        allure.attach(table, name="Review table", attachment_type=allure.attachment_type.TEXT)
+        if result.unaccounted:
+            self.log.info(f"ℹ️ {len(result.unaccounted)} review rows without a recorded answer")
+        with self.soft_assert("Review answers") as soft:
+            for problem in result.problems:
+                soft.fail(problem)
+        self.log.info(f"✅ {len(result.matched)} answers reconciled against {len(rows)} review rows")
+
     @allure.step("Verify Edit info is working")
     def verify_edit_info_is_working(self):
         """Verify the edit info is working."""
         self.log.info("🔍 Verifying edit info is working...")
-        edit_info_button = self.frame.locator("(//*[text() = 'Edit'])[28]")
-        expect(edit_info_button).to_be_visible(timeout=self.DEFAULT_TIMEOUT)
+        edit_info_button = self.locator("edit_button", index=28)
+        self.expect_visible(edit_info_button)
         edit_info_button.click()
         self.log.info("✅ Edit info is working verified successfully")
 
     @allure.step("Click 'check eligibility' button on submission form page")
     def hit_check_eligibility_button(self):
         """Click the 'check eligibility' button to continue."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
         self.log.info("➡️ Clicked 'check eligibility' button")
 
     @allure.step("Click 'Submit' button on submission form page")
     def hit_submit_button(self):
         """Click the 'Submit' button to continue."""
-        submit_button = self.frame.locator("//*[text()= 'Submit']")
-        submit_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        submit_button = self.locator("submit_button")
+        self.wait_visible(submit_button)
         submit_button.click()
         self.log.info("➡️ Clicked 'Submit' button")
\ No newline at end of file
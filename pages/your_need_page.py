@@ -1,39 +1,27 @@
-import logging
 import allure
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page
+from utils.base_page import BasePage
+from utils.step_budget import BudgetExceeded
 
 
-class YourNeedPage:
+class YourNeedPage(BasePage):
     """Handles the 'Your Need' step in the MEDVi Typeform flow."""
 
-    IFRAME_SELECTOR = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT = 10000
+    REVIEW_QUESTIONS = {"select_multiple_options": "interested in"}
 
-    def __init__(self, page: Page):
-        self.page = page
-        self.log = logging.getLogger("YourNeedPage")
-
-    @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
+    LOCATORS = {
+        "heading": "//span[contains(normalize-space(.), 'Please select the following options that you are interested in')]",
+    }
 
-    @staticmethod
-    def escape_xpath_text(text: str) -> str:
-        """Safely escape text for XPath."""
-        if "'" not in text:
-            return f"'{text}'"
-        if '"' not in text:
-            return f'"{text}"'
-        parts = text.split("'")
-        return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+    def __init__(self, page: Page):
+        super().__init__(page)
 
     @allure.step("Verify your need and medicine heading displayed")
     def verify_your_need_heading_displayed(self):
         """Verify the your need heading displayed."""
         self.log.info("🔍 Verifying your need heading displayed...")
-        heading = self.frame.locator("//span[contains(normalize-space(.), 'Please select the following options that you are interested in')]")
-        heading.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        heading = self.locator("heading")
+        self.wait_visible(heading)
         heading_text = heading.text_content()
         self.log.info(f"✅ Your need and medicine heading text content: {heading_text}")
     
@@ -54,23 +42,8 @@ class YourNeedPage:
 
         self.log.info("🔍 Verifying all options are visible...")
 
-        all_visible = True
-        for option in options:
-            safe_value = self.escape_xpath_text(option)
-            locator = self.frame.locator(f"//div[normalize-space(text())={safe_value}]")
-
-            try:
-                locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
-                expect(locator).to_be_visible(timeout=5000)
-                self.log.info(f"✅ Visible: {option}")
-            except Exception as e:
-                all_visible = False
-                self.log.warning(f"⚠️ Option not visible: {option} | Error: {e}")
-
-        if all_visible:
-            self.log.info("🎯 All options are visible on the page.")
-        else:
-            self.log.warning("⚠️ Some options are not visible on the page.")
+        with self.soft_assert("'Your Need' options") as soft:
+            soft.texts_visible(self, options)
 
     @allure.step("Select multiple 'Understand State of Mind' options")
     def select_multiple_options(self, options_to_select: list[str]):
@@ -78,21 +51,20 @@ class YourNeedPage:
         self.log.info(f"🧠 Selecting multiple state-of-mind options: {options_to_select}")
 
         for option_text in options_to_select:
-            safe_value = self.escape_xpath_text(option_text)
-            locator = self.frame.locator(f"//div[normalize-space(text())={safe_value}]")
-
             for attempt in range(3):  # Retry up to 3 times per option
                 try:
-                    locator.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+                    locator = self.find_by_text(option_text)
                     locator.scroll_into_view_if_needed()
                     locator.click(force=True)
                     self.log.info(f"✅ Selected: {option_text}")
                     break  # Exit retry loop if successful
+                except BudgetExceeded:
+                    raise
                 except Exception as e:
                     self.log.warning(f"⚠️ Attempt {attempt + 1}: Failed to select '{option_text}' ({e})")
                     # Small pause + reattach frame for dynamic reloads
-                    self.page.wait_for_timeout(2000)
-                    self.frame  # refresh frame locator reference
+                    self.page.wait_for_timeout(self.budgeted(2000))
+                    self.refresh_frame()  # re-resolve the frame after dynamic reloads
             else:
                 self.log.error(f"❌ Could not select '{option_text}' after 3 retries")
 
@@ -100,7 +72,7 @@ class YourNeedPage:
     @allure.step("Click 'Next' button on your need page")
     def hit_next_button(self):
         """Click the 'Next' button to continue."""
-        next_button = self.frame.locator("//button[@data-cy='button-component']")
-        next_button.wait_for(state="visible", timeout=self.DEFAULT_TIMEOUT)
+        next_button = self.locator("next_button")
+        self.wait_visible(next_button)
         next_button.click()
         self.log.info("➡️ Clicked 'Next' button")
\ No newline at end of file
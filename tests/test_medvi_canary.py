@@ -0,0 +1,42 @@
+import time
+import pytest
+import allure
+from flow.canary import block_heavy_resources, canary_budget, canary_data
+from flow.spec import BRANCH_CHOICES
+from flow.steps import STEPS, run_steps
+from utils import step_budget
+
+
+@allure.title("MEDVi Shortest-Path Canary")
+@allure.description("Reaches the submission screen on the cheapest branch path, with verification off and heavy resources blocked.")
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.smoke
+@pytest.mark.ui
+@pytest.mark.medvi_no_watchdog  # blocked images must not read as a stalled iframe
+def test_medvi_canary(flow, user_data, request):
+    """Drive the shortest path of the flow within the canary time budget."""
+    allure.dynamic.label("feature", "Canary")
+    budget = request.config.getoption("--medvi-canary-budget")
+    data = canary_data(user_data, STEPS, BRANCH_CHOICES)
+    allure.attach(
+        "\n".join(f"{key}: {data[key]}" for key in BRANCH_CHOICES),
+        name="Canary branch answers",
+        attachment_type=allure.attachment_type.TEXT,
+    )
+    block_heavy_resources(flow.page.context)
+
+    deadlines = canary_budget(budget)
+    previous, step_budget.ACTIVE = step_budget.ACTIVE, deadlines
+    started = time.perf_counter()
+    try:
+        for step in STEPS:
+            deadlines.enter(step.number, step.title)
+            run_steps(flow, data, step.number, step.number, verify=False)
+        over = deadlines.finish()
+    finally:
+        step_budget.ACTIVE = previous
+        allure.attach(deadlines.report(), name="Canary budget", attachment_type=allure.attachment_type.TEXT)
+    elapsed = time.perf_counter() - started
+    if over:
+        pytest.fail(f"❌ Canary over budget: {elapsed:.1f}s > {budget:.0f}s\n{deadlines.report()}")
+    print(f"⏱️ Canary reached the submission in {elapsed:.1f}s (budget {budget:.0f}s)")
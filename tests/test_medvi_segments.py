@@ -0,0 +1,28 @@
+import pytest
+import allure
+from flow.segments import DEPENDENCIES, SEGMENTS, start_segment
+from flow.steps import run_steps
+
+
+@allure.title("MEDVi Qualification Flow Segment")
+@allure.description("Runs one segment of the 'Am I Qualified?' flow, resuming from the checkpoint of the segment before it.")
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.ui
+@pytest.mark.regression
+@pytest.mark.skipif("not config.getoption('--medvi-segments')", reason="enable with --medvi-segments")
+@pytest.mark.parametrize(
+    "segment",
+    [pytest.param(s, id=s.name, marks=pytest.mark.medvi_segment(s.name)) for s in SEGMENTS],
+)
+def test_medvi_segment(segment, flow, user_data, checkpoints, request):
+    """Run one segment of the MEDVi application flow."""
+    allure.dynamic.label("feature", "Assessment Flow")
+    allure.dynamic.label("owner", "Muhammad Shahriyar")
+    allure.dynamic.label("epic", "MEDVi Assessment Journey")
+    allure.dynamic.label("story", segment.name)
+
+    segment_data = start_segment(segment, flow, user_data, request.node.medvi_checkpoint, checkpoints)
+    run_steps(flow, segment_data, segment.first, segment.last)
+
+    if segment.name in DEPENDENCIES:
+        checkpoints.save(segment.name, flow.page, segment_data, segment.version)
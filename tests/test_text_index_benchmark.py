@@ -0,0 +1,31 @@
+import json
+import pytest
+import allure
+from flow.steps import run_steps
+from utils.text_index import benchmark
+
+# The experience-illness screen: one heading plus four options
+BENCHMARK_TEXTS = [
+    "Do you experience any of the following?",
+    "Hair Loss",
+    "Skin Issues",
+    "Cognition Issues",
+    "None of these",
+]
+
+
+@allure.title("Text index vs. XPath selection latency")
+@allure.description("Compares lookups through the in-iframe text index with the text-matching XPath locators.")
+@pytest.mark.ui
+@pytest.mark.slow
+# Evaluated before fixture setup, so a skipped benchmark never starts a browser
+@pytest.mark.skipif("not config.getoption('--medvi-bench-text-index')", reason="enable with --medvi-bench-text-index")
+def test_text_index_benchmark(flow, user_data):
+    """Benchmark text lookups on the experience illness screen."""
+    allure.dynamic.label("feature", "Performance")
+
+    run_steps(flow, user_data, last=4)
+    result = benchmark(flow.experience_illness, BENCHMARK_TEXTS)
+
+    allure.attach(json.dumps(result, indent=2), name="Text lookup latency", attachment_type=allure.attachment_type.JSON)
+    print(f"⏱️ XPath {result['xpath_ms']} ms vs. text index {result['index_ms']} ms per lookup")
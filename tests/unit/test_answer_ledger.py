@@ -0,0 +1,86 @@
+import pytest
+
+from pages.gender_age_page import GenderAndAgePage
+from utils.answer_ledger import REVIEW_QUESTIONS, reconcile
+
+pytestmark = pytest.mark.unit
+
+QUESTIONS = {
+    "SurgeryWeightLossPage.select_surgery_weight_loss_option": "weight loss surgeries",
+    "WeightLossProgramPage.select_weight_loss_program_option": "weight loss programs",
+    "lastThreeMonthMedicationPage.select_last_three_month_medication_option": "opiate",
+    "DateOfBirthPage.select_day": "date of birth",
+    "DateOfBirthPage.select_month": "date of birth",
+    "DateOfBirthPage.add_year": "date of birth",
+    "HealthConditionsPage.verify_and_select_conditions": "Do any of these apply to you?",
+    "AdditionalHealthQuestionsPage.select_conditions": "Do any of these apply to you?",
+}
+
+ROWS = [
+    ("Have you had prior weight loss surgeries?", "No"),
+    ("How about weight loss programs?", "Yes"),
+    ("Within the last 3 months, have you taken opiate pain medications?", "No"),
+    ("What is your date of birth?", "03/14/1990"),
+]
+
+
+def test_duplicated_answers_are_checked_against_their_own_question():
+    latest = {
+        "SurgeryWeightLossPage.select_surgery_weight_loss_option": "No",
+        "WeightLossProgramPage.select_weight_loss_program_option": "Yes",
+        "lastThreeMonthMedicationPage.select_last_three_month_medication_option": "No",
+    }
+    result = reconcile(latest, ROWS, QUESTIONS)
+    assert result.problems == []
+    assert result.matched["WeightLossProgramPage.select_weight_loss_program_option"] == ROWS[1][0]
+
+
+def test_swapped_yes_no_is_a_mismatch_even_if_another_row_shows_the_value():
+    latest = {
+        "SurgeryWeightLossPage.select_surgery_weight_loss_option": "Yes",      # review: No
+        "WeightLossProgramPage.select_weight_loss_program_option": "No",       # review: Yes
+    }
+    result = reconcile(latest, ROWS, QUESTIONS)
+    assert result.matched == {}
+    assert result.mismatched == {
+        "SurgeryWeightLossPage.select_surgery_weight_loss_option": ("Yes", "No"),
+        "WeightLossProgramPage.select_weight_loss_program_option": ("No", "Yes"),
+    }
+
+
+def test_parts_of_a_combined_answer_only_match_within_their_row():
+    latest = {"DateOfBirthPage.select_day": "14", "DateOfBirthPage.select_month": "03",
+              "DateOfBirthPage.add_year": "1990"}
+    assert reconcile(latest, ROWS, QUESTIONS).problems == []
+
+    latest["DateOfBirthPage.add_year"] = "1991"
+    rows = ROWS + [("Current weight", "1991")]
+    result = reconcile(latest, rows, QUESTIONS)
+    assert list(result.mismatched) == ["DateOfBirthPage.add_year"]
+
+
+def test_question_asked_twice_pairs_rows_in_order():
+    rows = [("Do any of these apply to you?", "None of the above"),
+            ("Do any of these apply to you?", "Gout, Depression")]
+    latest = {"HealthConditionsPage.verify_and_select_conditions": ["None of the above"],
+              "AdditionalHealthQuestionsPage.select_conditions": ["Gout", "Depression"]}
+    result = reconcile(latest, rows, QUESTIONS)
+    assert result.problems == []
+    assert result.unaccounted == []
+
+
+def test_missing_question_unmapped_key_and_valueless_clicks():
+    latest = {
+        "SurgeryWeightLossPage.select_surgery_weight_loss_option": "No",
+        "DateOfBirthPage.add_year": "1990",
+        "NewPage.select_thing": "Yes",
+        "AverageBloodPressureRangePage.select_average_blood_pressure_range_option": None,
+    }
+    result = reconcile(latest, ROWS[:1], QUESTIONS)
+    assert result.missing == {"DateOfBirthPage.add_year": "date of birth"}
+    assert result.unmapped == {"NewPage.select_thing": "Yes"}
+    assert len(result.problems) == 2
+
+
+def test_page_objects_register_their_review_questions():
+    assert REVIEW_QUESTIONS[f"{GenderAndAgePage.__name__}.select_gender"] == "male or female"
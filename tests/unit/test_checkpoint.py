@@ -0,0 +1,34 @@
+import pytest
+
+from utils.checkpoint import CheckpointStore
+
+pytestmark = pytest.mark.unit
+
+
+class _Context:
+    def storage_state(self):
+        return {"cookies": [], "origins": []}
+
+
+class _Page:
+    url = "https://example.test/form"
+    context = _Context()
+
+
+def test_load_only_returns_the_current_version(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    store.save("intro", _Page(), {"gender": "male"}, "v1")
+    assert store.load("intro", "v1")["user_data"] == {"gender": "male"}
+    assert store.load("intro", "v2") is None
+    assert store.load("missing", "v1") is None
+
+
+def test_prune_removes_stale_and_unreadable_checkpoints(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    store.save("intro", _Page(), {}, "v1")
+    store.save("review", _Page(), {}, "old")
+    store.path("medication").write_text("{not json", encoding="utf-8")
+    store.prune({"intro": "v1", "review": "new", "medication": "v1", "missing": "v1"})
+    assert store.path("intro").exists()
+    assert not store.path("review").exists()
+    assert not store.path("medication").exists()
@@ -0,0 +1,107 @@
+import pytest
+
+from utils import circuit_breaker
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, is_infrastructure_failure
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "breaker.json")
+
+
+def _breakers(state_file, *workers):
+    return [CircuitBreaker(state_file, worker, threshold=3, cooldown_s=60) for worker in workers]
+
+
+def test_opens_after_threshold_consecutive_infrastructure_failures(state_file, clock):
+    gw0, gw1 = _breakers(state_file, "gw0", "gw1")
+    gw0.reset()
+    assert gw0.record(True, "net::ERR_NAME_NOT_RESOLVED") == CLOSED
+    assert gw1.record(True, "net::ERR_NAME_NOT_RESOLVED") == CLOSED
+    assert gw0.record(True, "net::ERR_NAME_NOT_RESOLVED\nmore") == OPEN
+    assert gw1.admit().startswith("Circuit breaker open after 3")
+    assert gw0.state()["trips"] == 1
+    assert gw0.state()["last_error"] == "net::ERR_NAME_NOT_RESOLVED"
+
+
+def test_other_outcomes_reset_the_count(state_file, clock):
+    gw0, = _breakers(state_file, "gw0")
+    gw0.reset()
+    gw0.record(True, "timeout")
+    gw0.record(True, "timeout")
+    assert gw0.record(False) == CLOSED
+    assert gw0.record(True, "timeout") == CLOSED
+    assert gw0.state()["failures"] == 1
+
+
+def test_half_open_admits_one_probe_and_closes_on_success(state_file, clock):
+    gw0, gw1 = _breakers(state_file, "gw0", "gw1")
+    gw0.reset()
+    for _ in range(3):
+        gw0.record(True, "timeout")
+    clock[0] += 61
+    assert gw1.admit() is None                      # gw1 probes
+    assert gw1.state()["state"] == HALF_OPEN
+    assert "probe running on gw1" in gw0.admit()
+    assert gw1.record(False) == CLOSED
+    assert gw0.admit() is None
+
+
+def test_failed_probe_reopens_for_a_new_cooldown(state_file, clock):
+    gw0, gw1 = _breakers(state_file, "gw0", "gw1")
+    gw0.reset()
+    for _ in range(3):
+        gw0.record(True, "timeout")
+    clock[0] += 61
+    assert gw0.admit() is None
+    assert gw0.record(True, "timeout") == OPEN
+    assert gw1.admit() is not None
+    assert gw0.state()["trips"] == 2
+    clock[0] += 61
+    assert gw1.admit() is None
+
+
+def test_lost_probe_is_taken_over_after_the_cooldown(state_file, clock):
+    gw0, gw1 = _breakers(state_file, "gw0", "gw1")
+    gw0.reset()
+    for _ in range(3):
+        gw0.record(True, "timeout")
+    clock[0] += 61
+    assert gw0.admit() is None
+    clock[0] += 61                                   # gw0 never reported back
+    assert gw1.admit() is None
+    assert gw1.state()["probe"] == "gw1"
+
+
+class _Entry:
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+
+
+class _ExcInfo:
+    def __init__(self, value, *entries):
+        self.value = value
+        self.traceback = list(entries)
+
+
+def test_classifier_network_errors_and_infrastructure_calls():
+    assert is_infrastructure_failure(_ExcInfo(Exception("page.goto: net::ERR_CONNECTION_REFUSED")))
+    assert is_infrastructure_failure(_ExcInfo(Exception("NS_ERROR_NET_RESET")))
+    assert is_infrastructure_failure(_ExcInfo(
+        TimeoutError("Timeout 60000ms exceeded"), _Entry("/repo/pages/home_page.py", "open"),
+    ))
+    assert not is_infrastructure_failure(_ExcInfo(
+        AssertionError("Locator expected to be visible"),
+        _Entry("/repo/tests/test_medvi_app.py", "test_medvi_flow"),
+        _Entry("/repo/pages/goal_weight_page.py", "add_goal_weight"),
+    ))
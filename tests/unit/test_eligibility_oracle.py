@@ -0,0 +1,48 @@
+import itertools
+
+import pytest
+
+from utils.eligibility_oracle import (
+    BRANCH_RULES, DISQUALIFIED, DISQUALIFYING_CONDITIONS, ELIGIBLE, predict, predict_many,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _personas():
+    conditions = [[], ["Gout"], [DISQUALIFYING_CONDITIONS[0]], ["Depression", DISQUALIFYING_CONDITIONS[-1]]]
+    answers = [("Yes", "No", None)] * len(BRANCH_RULES)
+    personas = []
+    for health, values in itertools.product(conditions, itertools.product(*answers)):
+        persona = {"health_conditions": health}
+        for (_, field, shown), value in zip(BRANCH_RULES, values):
+            if value == "Yes":
+                persona[field] = shown[0]
+            elif value == "No":
+                persona[field] = "No"
+        personas.append(persona)
+    personas.append({})  # no answers at all
+    return personas
+
+
+def test_predict_many_agrees_with_predict():
+    personas = _personas()
+    batch = predict_many(personas)
+    outcomes = {outcome: set(batch.indices(bits)) for outcome, bits in batch.outcomes.items()}
+    branches = {screen: set(batch.indices(bits)) for screen, bits in batch.branches.items()}
+
+    for i, persona in enumerate(personas):
+        expected = predict(persona)
+        assert {o for o, members in outcomes.items() if i in members} == {expected.outcome}, persona
+        assert tuple(s for s, _, _ in BRANCH_RULES if i in branches[s]) == expected.branch_screens, persona
+
+
+def test_predict_many_counts():
+    personas = [{"health_conditions": [DISQUALIFYING_CONDITIONS[2]]}, {"health_conditions": ["Gout"]}, {}]
+    assert predict_many(personas).counts() == {DISQUALIFIED: 1, ELIGIBLE: 2}
+
+
+def test_predict_many_of_no_personas():
+    batch = predict_many([])
+    assert batch.counts() == {DISQUALIFIED: 0, ELIGIBLE: 0}
+    assert all(bits == 0 for bits in batch.branches.values())
@@ -0,0 +1,51 @@
+import pytest
+
+from utils.frame_watchdog import FrameWatchdog
+
+pytestmark = pytest.mark.unit
+
+
+class _Context:
+    def on(self, event, handler):
+        pass
+
+    def expose_binding(self, name, handler):
+        pass
+
+    def add_init_script(self, script):
+        pass
+
+
+class _Request:
+    resource_type = "image"
+
+    def __init__(self, failure=None):
+        self.url = "https://form.typeform.com/image.png"
+        self.failure = failure
+
+
+def _stalled(watchdog, *requests):
+    watchdog._inflight.update(requests)
+    watchdog._last_progress -= 10   # long past stall_ms
+    return watchdog
+
+
+def test_aborted_requests_are_not_failures():
+    watchdog = FrameWatchdog(_Context(), "iframe", stall_ms=1000)
+    request = _Request("net::ERR_ABORTED")
+    _stalled(watchdog, request)._on_request_failed(request)
+    assert watchdog.failed is None
+    assert watchdog.stall() is None
+
+
+def test_failure_stalls_until_a_later_request_succeeds():
+    watchdog = FrameWatchdog(_Context(), "iframe", stall_ms=1000)
+    failed, later = _Request("net::ERR_CONNECTION_RESET"), _Request()
+    _stalled(watchdog, failed, later)._on_request_failed(failed)
+    watchdog._last_progress -= 10
+    assert "ERR_CONNECTION_RESET" in watchdog.stall()
+
+    watchdog._on_request_done(later)
+    watchdog._last_progress -= 10
+    assert watchdog.failed is None
+    assert watchdog.stall() is None
@@ -0,0 +1,44 @@
+import importlib
+import pkgutil
+import string
+
+import pytest
+
+import pages
+from pages.taken_medication_page import TakenMedicationPage
+from utils.base_page import BasePage
+from utils.locator_registry import compile_locators, escape_xpath_text, format_selector
+
+pytestmark = pytest.mark.unit
+
+
+def test_escape_xpath_text_quotes():
+    assert escape_xpath_text("Yes") == "'Yes'"
+    assert escape_xpath_text("We're") == '"We\'re"'
+    assert escape_xpath_text("""a'b"c""") == "concat('a', \"'\", 'b\"c')"
+
+
+def test_format_selector_escapes_text_and_keeps_positions_numeric():
+    assert format_selector("//div[text()={text}]", text="I'm") == '//div[text()="I\'m"]'
+    assert format_selector("(//input)[{index}]", index=2) == "(//input)[2]"
+
+
+def test_compile_locators_merges_along_the_mro():
+    compiled = compile_locators(TakenMedicationPage)
+    assert compiled["next_button"] == "xpath=//button[@data-cy='button-component']"
+    assert compiled["option_radio"].startswith("xpath=//div[normalize-space(text())={text}]")
+
+
+def _page_classes():
+    for module in pkgutil.iter_modules(pages.__path__):
+        for obj in vars(importlib.import_module(f"pages.{module.name}")).values():
+            if isinstance(obj, type) and issubclass(obj, BasePage) and obj is not BasePage:
+                yield obj
+
+
+def test_every_page_locator_formats():
+    for cls in set(_page_classes()):
+        for name, selector in cls._compiled_locators.items():
+            fields = {field for _, field, _, _ in string.Formatter().parse(selector) if field}
+            assert fields <= {"text", "index"}, f"{cls.__name__}.{name}"
+            format_selector(selector, **{field: 1 if field == "index" else "x" for field in fields})
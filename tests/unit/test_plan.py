@@ -0,0 +1,80 @@
+import os
+import re
+import sys
+
+import pytest
+
+from flow import plan
+from flow.plan import NEXT, Answer, Data, Do, Equals, FlowSpecError, Verify, compile_flow, screen
+
+pytestmark = pytest.mark.unit
+
+SPEC = (
+    screen(1, "Open", "home_page", Do("open"), Do("click_get_started")),
+    screen(2, "Goal weight", "goal_weight",
+           Verify("verify_goal_weight_page_heading_displayed"),
+           Answer("add_goal_weight", Data("goal_weight")),
+           NEXT),
+    screen(3, "Gender", "gender_and_age",
+           Answer("select_gender", Data("gender")),
+           NEXT,
+           when=Equals("gender", "male")),
+)
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    path = tmp_path / "plan_cache.json"
+    monkeypatch.setattr(plan, "CACHE_PATH", path)
+    return path
+
+
+def test_compile_valid_spec():
+    compiled = compile_flow(SPEC)
+    assert [s.number for s in compiled.steps] == [1, 2, 3]
+    assert compiled.steps[1].reads == {"goal_weight"}
+    assert compiled.steps[2].branches and not compiled.steps[1].branches
+    assert compile_flow(SPEC).fingerprint == compiled.fingerprint   # served from the cache
+
+
+@pytest.mark.parametrize("spec, error", [
+    (SPEC[:1] + SPEC[2:], "Step numbers must run 1..2"),
+    (SPEC[:2] + (screen(3, "Nowhere", "no_such_page", NEXT),), "unknown page object 'no_such_page'"),
+    (SPEC[:2] + (screen(3, "Gender", "gender_and_age", Do("no_such_method")),), "has no method 'no_such_method'"),
+    (SPEC[:2] + (screen(3, "Gender", "gender_and_age", Answer("hit_next_button")),), "is not an answering method"),
+    (SPEC[:2] + (screen(3, "Gender", "gender_and_age", Answer("select_gender")),), "select_gender()"),
+])
+def test_validate_rejects_inconsistent_specs(spec, error):
+    with pytest.raises(FlowSpecError, match=re.escape(error)):
+        compile_flow(spec)
+
+
+def test_select_and_prefix_key():
+    compiled = compile_flow(SPEC)
+    assert [s.number for s in compiled.select(2)] == [2, 3]
+    assert [s.number for s in compiled.select(1, 2)] == [1, 2]
+    assert [s.number for s in compiled.select(skip=[2])] == [1, 3]
+
+    changed = compile_flow(SPEC[:2] + (screen(3, "Gender", "gender_and_age", NEXT),))
+    assert changed.prefix_key(2) == compiled.prefix_key(2)
+    assert changed.prefix_key(3) != compiled.prefix_key(3)
+
+
+def test_fingerprint_covers_modules_the_pages_import():
+    files = plan.page_modules(SPEC)
+    assert {"pages.goal_weight_page", "utils.base_page", "utils.answer_ledger"} <= set(files)
+
+    before = plan.fingerprint(SPEC, files)
+    stat = files["utils.answer_ledger"].stat()
+    os.utime(files["utils.answer_ledger"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    try:
+        assert plan.fingerprint(SPEC, files) != before
+    finally:
+        os.utime(files["utils.answer_ledger"], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_fingerprint_imports_no_third_party_package(monkeypatch):
+    monkeypatch.delitem(sys.modules, "PIL", raising=False)
+    files = plan.page_modules(SPEC + (screen(4, "GLP-1", "gpl", NEXT),))
+    assert "utils.image_hash" in files
+    assert "PIL" not in sys.modules
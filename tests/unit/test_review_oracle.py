@@ -0,0 +1,46 @@
+import pytest
+
+from utils.review_oracle import (
+    BMI, CURRENT_WEIGHT, GOAL_WEIGHT, bmi, check_review, expected_review, extract_pairs,
+)
+
+pytestmark = pytest.mark.unit
+
+PERSONA = {"feet": "5", "inches": "10", "weight": "180", "goal_weight": "160"}
+
+
+def test_bmi_from_imperial_height_and_weight():
+    assert bmi(5, 10, 180) == pytest.approx(25.82, abs=0.01)
+    assert expected_review(PERSONA) == (bmi(5, 10, 180), 180.0, 160.0)
+
+
+def test_extract_pairs_inline_and_following_nodes():
+    texts = ["Your Medical Review", "BMI: 25.8", "Current Weight", "lbs", "180 lbs",
+             "Goal Weight", "Current Weight", "160"]
+    assert extract_pairs(texts) == {BMI: "25.8", CURRENT_WEIGHT: "180 lbs"}
+
+
+def test_matching_review_has_no_problems():
+    pairs = {BMI: "25.8", CURRENT_WEIGHT: "180 lbs", GOAL_WEIGHT: "160 lbs"}
+    assert check_review(expected_review(PERSONA), pairs) == []
+
+
+def test_tolerance_follows_the_displayed_precision():
+    expected = expected_review(PERSONA)   # BMI 25.82
+    assert check_review(expected, {BMI: "26", CURRENT_WEIGHT: "180", GOAL_WEIGHT: "160"}) == []
+    assert check_review(expected, {BMI: "25,9", CURRENT_WEIGHT: "180", GOAL_WEIGHT: "160"}) == []
+    problems = check_review(expected, {BMI: "26.0", CURRENT_WEIGHT: "180", GOAL_WEIGHT: "160"})
+    assert problems == ["BMI: shows '26.0', expected 25.82 (±0.15)"]
+
+
+def test_wrong_bmi_and_weight_are_reported():
+    pairs = {BMI: "27.4", CURRENT_WEIGHT: "181 lbs", GOAL_WEIGHT: "160 lbs"}
+    problems = check_review(expected_review(PERSONA), pairs)
+    assert [p.split(":")[0] for p in problems] == [BMI, CURRENT_WEIGHT]
+
+
+def test_missing_row_is_reported():
+    pairs = {BMI: "25.8", CURRENT_WEIGHT: "180 lbs", GOAL_WEIGHT: "n/a"}
+    problems = check_review(expected_review(PERSONA), pairs)
+    assert problems == [f"{GOAL_WEIGHT}: no value found"]
+    assert check_review(expected_review(PERSONA), {})[0] == f"{BMI}: no value found"
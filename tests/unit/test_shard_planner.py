@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from utils import shard_planner
+from utils.shard_planner import assign_shards, load_durations, load_history_ids, plan_shards
+
+pytestmark = pytest.mark.unit
+
+
+def _loads(shards, durations):
+    loads = {}
+    for node_id, index in shards.items():
+        loads[index] = loads.get(index, 0) + durations[node_id]
+    return loads
+
+
+def test_plan_shards_puts_longest_tests_on_lightest_shard():
+    durations = {"a": 8, "b": 7, "c": 6, "d": 5, "e": 4}
+    shards = plan_shards(durations, 2)
+    assert [s["tests"] for s in shards] == [["a", "d", "e"], ["b", "c"]]
+    assert sorted(s["estimated_ms"] for s in shards) == [13, 17]
+
+
+def test_assign_shards_keeps_plan_and_balances_unplanned_tests():
+    durations = {"t::a": 900, "t::b": 500, "t::c": 400}
+    plan = {"nodes": 2, "shards": plan_shards(durations, 2), "durations": durations}
+    collected = ["t::a", "t::b", "t::c", "t::new[1]", "t::new[2]"]
+    shards = assign_shards(collected, plan, 2)
+
+    assert {n: shards[n] for n in durations} == {"t::a": 1, "t::b": 2, "t::c": 2}
+    # Unseen tests fall back to the median and go where the load is lowest
+    assert shards["t::new[1]"] == 1 and shards["t::new[2]"] == 2
+    loads = _loads(shards, {**durations, "t::new[1]": 500, "t::new[2]": 500})
+    assert max(loads.values()) - min(loads.values()) <= 500
+
+
+def test_assign_shards_without_plan_is_stable_and_in_range():
+    node_ids = [f"t::p[{i}]" for i in range(50)]
+    first, second = assign_shards(node_ids, None, 4), assign_shards(list(reversed(node_ids)), None, 4)
+    assert first == second
+    assert set(first.values()) <= {1, 2, 3, 4}
+
+
+def test_history_is_mapped_through_previous_plan_after_clean_alluredir(tmp_path):
+    history = tmp_path / "history"
+    history.mkdir()
+    (history / "history.json").write_text(json.dumps({
+        "h1": {"items": [{"time": {"duration": 1000}}, {"time": {"duration": 3000}}]},
+    }))
+    plan = {"history_ids": {"h1": "tests/test_x.py::test_a"}}
+    ids = load_history_ids(str(tmp_path / "empty-results"), str(tmp_path / "no-report"), plan)
+    assert load_durations(str(tmp_path / "empty-results"), str(history), ids) == {"tests/test_x.py::test_a": 2000}
+
+
+def test_run_totals_from_duration_trend(tmp_path):
+    (tmp_path / "duration-trend.json").write_text(json.dumps([{"data": {"duration": 5000}}, {"data": {}}]))
+    assert shard_planner.load_run_totals(str(tmp_path)) == [5000]
@@ -0,0 +1,94 @@
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils import wait_model
+from utils.base_page import BasePage
+from utils.wait_model import FLOOR_MS, MARGIN_FACTOR, MARGIN_MS, MIN_SAMPLES, WaitModel, percentile
+
+pytestmark = pytest.mark.unit
+
+
+def test_percentile_is_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 95) == 95
+    assert percentile([7], 95) == 7
+    assert percentile([5, 1, 3], 50) == 3
+
+
+def test_learned_needs_min_samples():
+    model = WaitModel()
+    for _ in range(MIN_SAMPLES - 1):
+        model.observe("k", 1000)
+    assert model.learned("k") is None
+    model.observe("k", 1000)
+    assert model.learned("k") == int(1000 * (1 + MARGIN_FACTOR) + MARGIN_MS)
+
+
+def test_learned_never_below_floor():
+    model = WaitModel({"k": [10] * MIN_SAMPLES})
+    assert model.learned("k") == FLOOR_MS
+
+
+def test_timeout_for_is_capped_by_call_site():
+    model = WaitModel({"k": [4000] * MIN_SAMPLES})
+    assert model.timeout_for("k", 10_000) == model.learned("k")
+    assert model.timeout_for("k", 2000) == 2000
+    assert model.timeout_for("unknown", 10_000) == 10_000
+
+
+def test_miss_widens_key_to_call_site_timeout():
+    model = WaitModel({"k": [100] * MIN_SAMPLES, "other": [100] * MIN_SAMPLES})
+    model.miss("k")
+    assert model.misses == {"k": 1}
+    assert model.timeout_for("k", 10_000) == 10_000
+    assert model.timeout_for("other", 10_000) == FLOOR_MS
+    assert model.waits["k"] == [100] * MIN_SAMPLES   # no made-up observation
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "model.json")
+    model = WaitModel({"k": [1.5, 2.5]})
+    model.save(path)
+    assert WaitModel.load(path).waits == {"k": [1.5, 2.5]}
+    assert WaitModel.load(str(tmp_path / "missing.json")).waits == {}
+
+
+class _Context:
+    pass
+
+
+class _Page:
+    context = _Context()   # no frame watchdog installed
+
+
+@pytest.fixture
+def model():
+    wait_model.ACTIVE = WaitModel({"BasePage:sel": [50] * MIN_SAMPLES})
+    yield wait_model.ACTIVE
+    wait_model.ACTIVE = None
+
+
+def test_timed_wait_keeps_waiting_after_a_missed_learned_timeout(model):
+    page = BasePage(_Page())
+    calls = []
+
+    def wait(ms):
+        calls.append(ms)
+        if len(calls) == 1:
+            raise PlaywrightTimeoutError("slow this time")
+
+    page._timed_wait("sel", 10_000, wait)
+    assert calls == [FLOOR_MS, 10_000 - FLOOR_MS]
+    assert model.misses == {"BasePage:sel": 1}
+    assert len(model.waits["BasePage:sel"]) == MIN_SAMPLES + 1
+
+
+def test_timed_wait_fails_once_the_call_site_timeout_is_spent(model):
+    page = BasePage(_Page())
+
+    def wait(ms):
+        raise PlaywrightTimeoutError("never shows")
+
+    with pytest.raises(PlaywrightTimeoutError):
+        page._timed_wait("sel", 10_000, wait)
+    assert model.waits["BasePage:sel"] == [50] * MIN_SAMPLES
@@ -0,0 +1,208 @@
+"""
+Ledger of the answers page objects entered, and its reconciliation with the review table.
+
+``BasePage`` wraps every answering method (``select_*``, ``add_*``, ``enter_*``,
+``verify_and_select_*``) of its subclasses so that a successful call appends
+``(question key, value)`` to the ledger of the page it ran on; free-text inputs
+outside those methods go through ``BasePage.fill``. The
+ledger is exposed as ``FlowContext.ledger``, attached to the Allure result and
+streamed as JSONL (one answer per line) for tooling that validates or replays
+runs. On the submission screen ``extract_review_table`` reads the whole review
+table as ``(question, answer)`` pairs in one ``evaluate`` and ``reconcile`` diffs
+them against the ledger, instead of one locator per row.
+
+Each page object declares under which review question its answers appear
+(``REVIEW_QUESTIONS``: method or ``fill`` key -> text that question contains);
+``record_answers`` collects them as ``PageClass.key`` into ``REVIEW_QUESTIONS``
+here, so every answer is compared with the row of its own question only.
+"""
+import functools
+import json
+import re
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from playwright.sync_api import Frame, Page
+
+RECORDED_PREFIXES = ("select_", "add_", "enter_", "verify_and_select_")
+# Key of the ``user_data`` entry conftest appends after a test, for replays that verify
+PERSONA_KEY = "user_data"
+
+# ``PageClass.key`` -> text (case-insensitive) of the review question its answer is listed under
+REVIEW_QUESTIONS: Dict[str, str] = {}
+
+
+class Answer:
+    """One entered answer; ``key`` is ``PageClass.method``."""
+
+    __slots__ = ("key", "value", "timestamp")
+
+    def __init__(self, key: str, value, timestamp: float):
+        self.key = key
+        self.value = value
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return f"Answer({self.key!r}, {self.value!r})"
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"key": self.key, "value": self.value, "timestamp": round(self.timestamp, 3)}
+
+
+class AnswerLedger:
+    """Append-only answers of one page, in the order they were entered."""
+
+    _ledgers = weakref.WeakKeyDictionary()
+
+    def __init__(self):
+        self.answers: List[Answer] = []
+
+    @classmethod
+    def for_page(cls, page: Page) -> "AnswerLedger":
+        ledger = cls._ledgers.get(page)
+        if ledger is None:
+            ledger = cls._ledgers[page] = cls()
+        return ledger
+
+    def record(self, key: str, value):
+        self.answers.append(Answer(key, value, time.time()))
+
+    def latest(self) -> Dict[str, object]:
+        """Last value per question key (a re-selected answer replaces the earlier one)."""
+        return {answer.key: answer.value for answer in self.answers}
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def to_jsonl(self, **extra) -> str:
+        """One JSON object per answer, each with the ``extra`` fields (e.g. the test id)."""
+        return "".join(json.dumps({**extra, **answer.to_dict()}, ensure_ascii=False) + "\n"
+                       for answer in self.answers)
+
+    def append_to(self, path: str, **extra):
+        """Append the answers to the JSONL stream at ``path``."""
+        if not self.answers:
+            return
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as stream:
+            stream.write(self.to_jsonl(**extra))
+
+
+def recorded(key: str, method):
+    """Wrap a page-object method so its successful calls land in the page's ledger."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        values = [value for value in (*args, *kwargs.values()) if value is not None]
+        AnswerLedger.for_page(self.page).record(key, values[0] if len(values) == 1 else values or None)
+        return result
+    wrapper.__answer_key__ = key
+    return wrapper
+
+
+def record_answers(cls):
+    """Wrap the answering methods (``RECORDED_PREFIXES``) ``cls`` defines itself and register its review questions."""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith(RECORDED_PREFIXES) and callable(attr) and not hasattr(attr, "__answer_key__"):
+            setattr(cls, name, recorded(f"{cls.__name__}.{name}", attr))
+    for key, question in vars(cls).get("REVIEW_QUESTIONS", {}).items():
+        REVIEW_QUESTIONS[f"{cls.__name__}.{key}"] = question
+
+
+# ---------------------- Review Table ---------------------- #
+
+REVIEW_TABLE_SCRIPT = """
+() => {
+  const norm = (s) => (s || "").replace(/\\s+/g, " ").trim();
+  const ownText = (el) => {
+    let text = "";
+    for (const child of el.childNodes) if (child.nodeType === Node.TEXT_NODE) text += child.nodeValue;
+    return norm(text);
+  };
+  const lines = (el) => (el.innerText || "").split("\\n").map(norm).filter((l) => l && l !== "Edit");
+  const edits = [...document.querySelectorAll("body *")].filter((el) => ownText(el) === "Edit");
+  const rows = [];
+  for (const edit of edits) {
+    // Smallest ancestor holding a question and an answer, without reaching the next row's Edit
+    let row = edit.parentElement;
+    while (row && row.parentElement && lines(row).length < 2) {
+      const parent = row.parentElement;
+      if (edits.some((other) => other !== edit && parent.contains(other))) break;
+      row = parent;
+    }
+    const text = row ? lines(row) : [];
+    if (text.length) rows.push([text[0], text.slice(1).join(", ")]);
+  }
+  return rows;
+}
+"""
+
+
+def extract_review_table(frame: Frame) -> List[Tuple[str, str]]:
+    """``(question, answer)`` per row of the submission review, in one round trip."""
+    return [(question, answer) for question, answer in frame.evaluate(REVIEW_TABLE_SCRIPT)]
+
+
+class Reconciliation(NamedTuple):
+    matched: Dict[str, str]                     # ledger key -> review question it was found under
+    missing: Dict[str, str]                     # ledger key -> declared question not on the review
+    mismatched: Dict[str, Tuple[object, str]]   # ledger key -> (entered value, answer the review shows)
+    unmapped: Dict[str, object]                 # ledger key -> value, no review question declared
+    unaccounted: List[Tuple[str, str]]          # review rows no ledger answer points to
+
+    @property
+    def problems(self) -> List[str]:
+        return (
+            [f"{key}: question {question!r} not on the review" for key, question in self.missing.items()]
+            + [f"{key}: entered {value!r}, review shows {shown!r}" for key, (value, shown) in self.mismatched.items()]
+            + [f"{key}: {value!r} has no review question declared (REVIEW_QUESTIONS)"
+               for key, value in self.unmapped.items()]
+        )
+
+
+def _norm(text) -> str:
+    return re.sub(r"\s+", " ", str(text)).strip().casefold()
+
+
+def _shows(answer: str, value: str) -> bool:
+    """``value`` is the row's answer or a whole-word part of it (a height, a date, a list)."""
+    return answer == value or re.search(rf"(?<!\w){re.escape(value)}(?!\w)", answer) is not None
+
+
+def reconcile(latest: Dict[str, object], rows: List[Tuple[str, str]],
+              questions: Optional[Dict[str, str]] = None) -> Reconciliation:
+    """
+    Compare every ledger value with the answer of its own review question
+    (``questions``, default ``REVIEW_QUESTIONS``). Answers sharing a question (day,
+    month and year of one date) must all appear in the same row; a question asked
+    twice is matched against its rows in order. Keys that recorded no value
+    (option-less clicks) are skipped.
+    """
+    questions = REVIEW_QUESTIONS if questions is None else questions
+    table = [(_norm(question), _norm(answer)) for question, answer in rows]
+    used, matched, missing, mismatched, unmapped = set(), {}, {}, {}, {}
+    for key, value in latest.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        values = [_norm(v) for v in values if v is not None and _norm(v)]
+        if not values:
+            continue
+        if key not in questions:
+            unmapped[key] = value
+            continue
+        wanted = _norm(questions[key])
+        # Unused rows first, so a question asked twice pairs its rows with the answers in order
+        candidates = sorted((i for i, (question, _) in enumerate(table) if wanted in question), key=used.__contains__)
+        if not candidates:
+            missing[key] = questions[key]
+            continue
+        row = next((i for i in candidates if all(_shows(table[i][1], v) for v in values)), None)
+        if row is None:
+            row = next((i for i in candidates if i not in used), candidates[0])
+            mismatched[key] = (value, rows[row][1])
+        else:
+            matched[key] = rows[row][0]
+        used.add(row)
+    unaccounted = [row for i, row in enumerate(rows) if i not in used]
+    return Reconciliation(matched, missing, mismatched, unmapped, unaccounted)
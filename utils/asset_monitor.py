@@ -0,0 +1,82 @@
+"""
+Asset checks on network responses instead of rendered visibility.
+
+``AssetMonitor`` records the status, content type and size of every image/media/font
+response of a page from the moment the context is created, so assets that loaded
+before their step are still known. ``check`` asserts on a recorded response right
+away, or waits for the matching ``response`` event; no layout, paint or scroll
+position is involved.
+"""
+import weakref
+from typing import Dict, NamedTuple, Optional
+
+from playwright.sync_api import Page, Response
+
+ASSET_TYPES = ("image", "media", "font")
+
+
+class AssetResponse(NamedTuple):
+    url: str
+    status: int
+    content_type: str
+    size: Optional[int]     # None when the response has no Content-Length
+
+    @classmethod
+    def from_response(cls, response: Response) -> "AssetResponse":
+        headers = response.headers
+        length = headers.get("content-length")
+        return cls(response.url, response.status, headers.get("content-type", ""),
+                   int(length) if length and length.isdigit() else None)
+
+
+class AssetMonitor:
+    """Latest asset response per URL of one page."""
+
+    _monitors = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.responses: Dict[str, tuple] = {}   # url -> (AssetResponse, Response)
+        page.on("response", self._on_response)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "AssetMonitor":
+        monitor = cls._monitors.get(page)
+        if monitor is None:
+            monitor = cls._monitors[page] = cls(page)
+        return monitor
+
+    def _on_response(self, response: Response):
+        if response.request.resource_type in ASSET_TYPES:
+            self.responses[response.url] = (AssetResponse.from_response(response), response)
+
+    def find(self, pattern: str) -> Optional[tuple]:
+        for url, entry in reversed(list(self.responses.items())):
+            if pattern in url:
+                return entry
+        return None
+
+    def check(self, pattern: str, timeout: int, content_type: str = "image/", min_bytes: int = 1) -> AssetResponse:
+        """Assert the asset whose URL contains ``pattern`` loaded with the expected type and size."""
+        entry = self.find(pattern)
+        if entry is None:
+            response = self.page.wait_for_event(
+                "response", lambda r: pattern in r.url and r.request.resource_type in ASSET_TYPES, timeout=timeout
+            )
+            entry = self.responses.get(response.url) or (AssetResponse.from_response(response), response)
+        asset, response = entry
+
+        problems = []
+        if not (200 <= asset.status < 300 or asset.status == 304):
+            problems.append(f"status {asset.status}")
+        if content_type and not asset.content_type.startswith(content_type):
+            problems.append(f"content type '{asset.content_type}' is not {content_type}*")
+        size = asset.size
+        if size is None and asset.status != 304:
+            size = len(response.body())
+            asset = asset._replace(size=size)
+        if size is not None and size < min_bytes:
+            problems.append(f"{size} bytes < {min_bytes}")
+        if problems:
+            raise AssertionError(f"❌ Asset {asset.url}: " + ", ".join(problems))
+        return asset
@@ -1,7 +1,26 @@
 
-from playwright.sync_api import Page
+from playwright.sync_api import Frame, Locator, Page, TimeoutError as PlaywrightTimeoutError, expect
 import logging
-from typing import ClassVar, Optional
+import time
+from typing import ClassVar, Dict, Iterable, List, Optional, Union
+
+import allure
+
+from utils.answer_ledger import AnswerLedger, record_answers
+from utils.asset_monitor import AssetMonitor, AssetResponse
+from utils.frame_watchdog import FrameWatchdog
+from utils.locator_registry import FrameHandle, compile_locators, escape_xpath_text, format_selector
+from utils.screen_events import ScreenBridge, ScreenChanged
+from utils.screen_template import ScreenNode, missing_nodes, parse_template, render_diff, take_snapshot
+from utils.soft_assert import SoftAssertions
+from utils.step_budget import BudgetedTimeout, cap
+from utils import wait_model
+from utils.text_index import TEXT_INDEX_SCRIPT, tid_selector
+
+
+def _selector_of(locator: Locator) -> str:
+    # str() is "<Locator frame=<Frame ... url='…'> selector='…'>"; the URL varies between runs
+    return str(locator).rpartition(" selector=")[2].rstrip(">").strip("'\"")
 
 
 class BasePage:
@@ -9,23 +28,234 @@ class BasePage:
 
 
     IFRAME_SELECTOR: ClassVar[str] = "iframe[title='1tAZd12DZCus']"
-    DEFAULT_TIMEOUT: ClassVar[int] = 10_000
+    # Capped by the running step's deadline when a flow SLA budget is active (utils.step_budget)
+    DEFAULT_TIMEOUT: ClassVar[int] = BudgetedTimeout(10_000)
+    # Shared deadline of a soft_assert() block and what happens to its failures ("warn" or "fail")
+    SOFT_ASSERT_BUDGET: ClassVar[int] = 3_000
+    SOFT_ASSERT_POLICY: ClassVar[str] = "warn"
+    # Whether verify_asset() also waits for the <img> to be visible (second, slower tier)
+    VERIFY_ASSET_VISIBILITY: ClassVar[bool] = False
+    # Whether verify_image_hash() registers images (--medvi-image-hash; loads Pillow only then)
+    VERIFY_IMAGE_HASH: ClassVar[bool] = False
+
+    # Selectors shared by every Typeform screen; subclasses add their own.
+    # Placeholders such as {text} are filled with escaped XPath literals, {index} with a number.
+    LOCATORS: ClassVar[Dict[str, str]] = {
+        "next_button": "//button[@data-cy='button-component']",
+        "option": "//div[normalize-space(text())={text}]",
+        "text": "//*[normalize-space(text())={text}]",
+        "input": "(//input[@data-cy='input-component'])[{index}]",
+        "dropdown_input": "(//div[@data-cy='dropdown-component'])[{index}]//input",
+        "text_area": "//textarea[@data-cy='text-area']",
+        "long_answer": "//*[@data-cy='long-answer-component']//textarea",
+    }
+    _compiled_locators: ClassVar[Dict[str, str]]
+
+    # Answering method (or ``fill`` key) -> text of the submission review question it is listed under
+    REVIEW_QUESTIONS: ClassVar[Dict[str, str]] = {}
+
+    # Expected screen as an accessibility-style template (see utils.screen_template)
+    SCREEN: ClassVar[Optional[str]] = None
+    _screen_template: ClassVar[List[ScreenNode]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled_locators = compile_locators(cls)
+        cls._screen_template = parse_template(cls.SCREEN) if cls.SCREEN else []
+        record_answers(cls)
 
     def __init__(self, page: Page):
         self.page = page
         self.log = logging.getLogger(self.__class__.__name__)
 
     @property
-    def frame(self):
-        """Always return a fresh frame locator to avoid stale references."""
-        return self.page.frame_locator(self.IFRAME_SELECTOR)
+    def frame(self) -> Frame:
+        """The Typeform iframe, resolved once and re-resolved only after it navigates or detaches."""
+        return FrameHandle.for_page(self.page, self.IFRAME_SELECTOR).frame(self.DEFAULT_TIMEOUT)
+
+    def refresh_frame(self):
+        """Drop the cached frame and locators, e.g. after the iframe was reloaded."""
+        FrameHandle.for_page(self.page, self.IFRAME_SELECTOR).invalidate()
+
+    def reload_frame(self):
+        """Reload only the Typeform iframe (its ``src``) and drop the cached frame."""
+        watchdog = FrameWatchdog.get(self.page)
+        if watchdog is not None:
+            watchdog.reload_frame(self.page)
+            return
+        self.page.evaluate("(selector) => { const f = document.querySelector(selector); if (f) f.src = f.src; }",
+                           self.IFRAME_SELECTOR)
+        self.refresh_frame()
+
+    def locator(self, name: str, **params: Union[str, int]) -> Locator:
+        """Return the cached locator registered as ``name`` in ``LOCATORS``."""
+        selector = self._compiled_locators[name]
+        if params:
+            selector = format_selector(selector, **params)
+        return FrameHandle.for_page(self.page, self.IFRAME_SELECTOR).locator(selector, self.DEFAULT_TIMEOUT)
+
+    def soft_assert(self, name: str, budget: Optional[int] = None, policy: Optional[str] = None) -> SoftAssertions:
+        """
+        Block of checks evaluated together against one deadline of ``budget`` ms.
+
+            with self.soft_assert("GLP-1 content") as soft:
+                soft.visible(heading, "heading")
+        """
+        return SoftAssertions(
+            self.page,
+            name,
+            self.budgeted(self.SOFT_ASSERT_BUDGET if budget is None else budget),
+            policy or self.SOFT_ASSERT_POLICY,
+        )
+
+    @staticmethod
+    def budgeted(timeout_ms: int) -> int:
+        """``timeout_ms`` limited to what is left of the running step's SLA budget."""
+        return cap(timeout_ms)
+
+    def wait_visible(self, locator: Locator, timeout: Optional[int] = None):
+        """``locator.wait_for(state="visible")`` with a timeout learned from earlier waits (utils.wait_model)."""
+        self._timed_wait(locator, timeout, lambda ms: locator.wait_for(state="visible", timeout=ms))
+
+    def expect_visible(self, locator: Locator, timeout: Optional[int] = None):
+        """``expect(locator).to_be_visible()`` with a timeout learned from earlier waits (utils.wait_model)."""
+        self._timed_wait(locator, timeout, lambda ms: expect(locator).to_be_visible(timeout=ms))
+
+    def _timed_wait(self, locator: Locator, timeout: Optional[int], wait):
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        watchdog = FrameWatchdog.get(self.page)
+        if watchdog is not None:
+            unguarded = wait
+            wait = lambda ms: watchdog.guard(self.page, unguarded, ms)
+        model = wait_model.ACTIVE
+        if model is None:
+            return wait(timeout)
+        key = f"{self.__class__.__name__}:{_selector_of(locator)}"
+        adapted = model.timeout_for(key, timeout)
+        started = time.perf_counter()
+        try:
+            wait(adapted)
+        except (AssertionError, PlaywrightTimeoutError):
+            if adapted >= timeout:
+                raise
+            # The learned timeout is a prediction, not the contract: wait out the call site's timeout
+            self.log.warning(f"⏱️ {key} missed its learned {adapted} ms timeout, waiting up to {timeout} ms")
+            model.miss(key)
+            wait(self.budgeted(timeout - adapted))
+        model.observe(key, (time.perf_counter() - started) * 1000)
+
+    def fill(self, locator: Locator, value: str, key: str):
+        """Fill a free-text input and record ``value`` in the answer ledger as ``PageClass.key``."""
+        locator.fill(value)
+        AnswerLedger.for_page(self.page).record(f"{self.__class__.__name__}.{key}", value)
+
+    def verify_screen(self, timeout: Optional[int] = None):
+        """
+        Match one snapshot of the iframe against ``SCREEN``, re-taking it until the
+        template matches or ``timeout`` ms pass; fails with a structural diff.
+        """
+        if not self._screen_template:
+            raise NotImplementedError(f"{self.__class__.__name__} does not declare SCREEN")
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            snapshot = take_snapshot(self.frame)
+            if not missing_nodes(self._screen_template, snapshot):
+                self.log.info(f"✅ Screen matches template ({len(self._screen_template)} nodes)")
+                return
+            if time.perf_counter() >= deadline:
+                break
+            self.page.wait_for_timeout(200)
+
+        diff = render_diff(self._screen_template, snapshot)
+        allure.attach(diff, name=f"{self.__class__.__name__} screen diff", attachment_type=allure.attachment_type.TEXT)
+        raise AssertionError(f"❌ {self.__class__.__name__} screen does not match its template:\n{diff}")
+
+    def verify_asset(self, src_pattern: str, content_type: str = "image/", min_bytes: int = 1,
+                     visible: Optional[bool] = None, timeout: Optional[int] = None) -> AssetResponse:
+        """
+        Assert the asset whose URL contains ``src_pattern`` was served with a success
+        status, ``content_type`` and at least ``min_bytes``, as soon as its response is
+        known. With ``visible`` (default ``VERIFY_ASSET_VISIBILITY``) also expect the
+        ``<img>`` to be visible.
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        asset = AssetMonitor.for_page(self.page).check(src_pattern, timeout, content_type, min_bytes)
+        self.log.info(f"✅ Asset {src_pattern}: {asset.status}, {asset.content_type}, {asset.size} bytes")
+        if self.VERIFY_ASSET_VISIBILITY if visible is None else visible:
+            self.expect_visible(self.frame.locator(f"img[src*='{src_pattern}']"), timeout)
+        return asset
+
+    def verify_image_hash(self, src_pattern: str):
+        """
+        Register that the image whose URL contains ``src_pattern`` must match its
+        perceptual-hash reference; checked after the test body (--medvi-image-hash).
+        """
+        if not self.VERIFY_IMAGE_HASH:
+            return
+        from utils.image_hash import ImageVerifier
+
+        verifier = ImageVerifier.get(self.page)
+        if verifier is not None:
+            verifier.expect(src_pattern)
+
+    # ---- Screen events ----
+
+    def wait_for_screen(self, title: Optional[str] = None, question_id: Optional[str] = None,
+                        index: Optional[int] = None, timeout: Optional[int] = None) -> ScreenChanged:
+        """Wait until the form shows the screen whose title contains ``title`` (and/or id/index)."""
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        screen = ScreenBridge.for_page(self.page).wait_for_screen(self.frame, timeout, title, question_id, index)
+        self.log.info(f"📺 On screen {screen.index}: {screen.title or screen.question_id}")
+        return screen
+
+    def current_screen(self) -> Optional[ScreenChanged]:
+        """The screen the form showed last, as reported by the screen bridge."""
+        return ScreenBridge.for_page(self.page).last_screen()
+
+    def wait_for_next_screen(self, previous: Optional[ScreenChanged], timeout: Optional[int] = None) -> ScreenChanged:
+        """Wait until the form has moved on from ``previous`` (the screen before a 'Next' click)."""
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        screen = ScreenBridge.for_page(self.page).wait_for_next_screen(self.frame, timeout, previous)
+        self.log.info(f"📺 On screen {screen.index}: {screen.title or screen.question_id}")
+        return screen
+
+    # ---- Text index ----
+
+    def find_by_text(self, text: str, timeout: Optional[int] = None) -> Locator:
+        """
+        Locate the element whose own text equals ``text`` through the in-iframe text index.
+
+        Waits (without polling) until the index sees the text or ``timeout`` ms pass.
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else self.budgeted(timeout)
+        tid = self._index_call("find", text, timeout)
+        if not tid:
+            raise PlaywrightTimeoutError(f"❌ Text '{text}' not found in the iframe within {timeout} ms")
+        return self.frame.locator(tid_selector(tid))
+
+    def click_text(self, text: str, timeout: Optional[int] = None):
+        """Click the element whose own text equals ``text``."""
+        self.find_by_text(text, timeout).click()
+        self.log.info(f"✅ Clicked '{text}'")
+
+    def texts_visible(self, texts: Iterable[str]) -> Dict[str, bool]:
+        """Visibility of every text in one round trip, e.g. for a whole option list."""
+        return self._index_call("visible", list(texts))
+
+    def _index_call(self, method: str, *args):
+        """Call ``window.__medviTextIndex.<method>``, installing the index if the init script missed this frame."""
+        script = f"args => window.__medviTextIndex ? window.__medviTextIndex.{method}(...args) : '__missing__'"
+        result = self.frame.evaluate(script, list(args))
+        if result == "__missing__":
+            self.frame.evaluate(TEXT_INDEX_SCRIPT)
+            result = self.frame.evaluate(script, list(args))
+        return result
 
     @staticmethod
     def escape_xpath_text(text: str) -> str:
         """Safely escape text for XPath literal (handles both ' and ")."""
-        if "'" not in text:
-            return f"'{text}'"
-        if '"' not in text:
-            return f'"{text}"'
-        parts = text.split("'")
-        return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+        return escape_xpath_text(text)
+
+
+BasePage._compiled_locators = compile_locators(BasePage)
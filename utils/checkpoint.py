@@ -0,0 +1,68 @@
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from playwright.sync_api import Page
+
+
+class CheckpointStore:
+    """
+    Persist browser state at segment boundaries of the qualification flow.
+
+    A checkpoint holds the context storage state (cookies + localStorage of every
+    origin, including the Typeform iframe), the current URL and the ``user_data``
+    the flow was driven with, so a later segment can resume with the same persona.
+    Each checkpoint carries the version of the flow prefix it was taken after
+    (``Segment.version``): one written before the spec changed is never loaded.
+    Files are replaced atomically because xdist workers read them concurrently.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or os.getenv("MEDVI_CHECKPOINT_DIR", ".medvi_checkpoints"))
+        self.log = logging.getLogger("CheckpointStore")
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.json"
+
+    def save(self, name: str, page: Page, user_data: Dict[str, str], version: str):
+        """Write the checkpoint ``name`` (of flow prefix ``version``) from the current state of ``page``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        checkpoint = {
+            "segment": name,
+            "version": version,
+            "url": page.url,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "user_data": user_data,
+            "storage_state": page.context.storage_state(),
+        }
+        tmp = self.path(name).with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(checkpoint), encoding="utf-8")
+        os.replace(tmp, self.path(name))
+        self.log.info(f"💾 Checkpoint '{name}' saved")
+
+    def load(self, name: str, version: str) -> Optional[dict]:
+        """Return the checkpoint ``name``, or ``None`` if it was never written or is of another ``version``."""
+        try:
+            checkpoint = json.loads(self.path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get("version") != version:
+            self.log.info(f"🗑️ Checkpoint '{name}' is stale (flow changed since it was saved)")
+            return None
+        return checkpoint
+
+    def prune(self, versions: Dict[str, str]):
+        """Delete the checkpoints that are not of their current version in ``versions``."""
+        for name, version in versions.items():
+            try:
+                stale = json.loads(self.path(name).read_text(encoding="utf-8")).get("version") != version
+            except OSError:
+                continue
+            except ValueError:
+                stale = True
+            if stale:
+                self.path(name).unlink(missing_ok=True)
+                self.log.info(f"🗑️ Stale checkpoint '{name}' removed")
@@ -0,0 +1,139 @@
+"""
+Session-wide circuit breaker for MEDVi outages.
+
+When the site is down every UI test still pays the 60 s navigation timeout and
+the 'AM I QUALIFIED?' retries. The breaker counts consecutive infrastructure
+failures — navigation errors, timeouts while opening the site or attaching the
+Typeform iframe — across all xdist workers through one JSON state file guarded
+by a file lock. After ``threshold`` of them it opens and the remaining UI tests
+are skipped at setup. Once ``cooldown_s`` passed it goes half-open: exactly one
+test (on whichever worker asks first) runs as a probe; success closes the
+breaker, another infrastructure failure opens it for a new cooldown.
+
+Any other outcome (a pass, an assertion on the form) proves the site is up and
+resets the count.
+
+pytest.ini sets no ``--maxfail`` for this reason: stopping at the first failure
+would end the session before the breaker could open. The session header says so
+when ``--maxfail`` is given at or below the threshold.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+THRESHOLD = 3
+COOLDOWN_S = 60.0
+
+# (file, function) of the calls that only fail when the site itself is unavailable
+INFRA_CALLS = {
+    ("home_page.py", "open"),
+    ("home_page.py", "click_get_started"),
+    ("height_weight_page.py", "wait_for_iframe_ready"),
+    ("locator_registry.py", "_resolve"),
+}
+NETWORK_ERRORS = ("net::ERR_", "NS_ERROR_", "NS_BINDING_ABORTED")
+
+
+def is_infrastructure_failure(excinfo) -> bool:
+    """Whether a test's ``ExceptionInfo`` looks like an outage rather than a product bug."""
+    if any(marker in str(excinfo.value) for marker in NETWORK_ERRORS):
+        return True
+    return any((Path(str(entry.path)).name, entry.name) in INFRA_CALLS for entry in excinfo.traceback)
+
+
+@contextmanager
+def _locked(path: Path):
+    with open(f"{path}.lock", "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class CircuitBreaker:
+    """Breaker state shared by every worker of a session through ``path``."""
+
+    def __init__(self, path: str, worker: str = "main", threshold: int = THRESHOLD, cooldown_s: float = COOLDOWN_S):
+        self.path = Path(path)
+        self.worker = worker
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def reset(self):
+        with _locked(self.path):
+            self._write({"state": CLOSED, "failures": 0, "trips": 0})
+
+    def state(self) -> dict:
+        with _locked(self.path):
+            return self._read()
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"state": CLOSED, "failures": 0, "trips": 0}
+
+    def _write(self, state: dict):
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def admit(self) -> Optional[str]:
+        """None if the next test may run (possibly as the half-open probe), else why it is skipped."""
+        with _locked(self.path):
+            state = self._read()
+            now = time.time()
+            if state["state"] == CLOSED:
+                return None
+            if state["state"] == HALF_OPEN and state.get("probe") != self.worker \
+                    and now - state["probe_started"] < self.cooldown_s:
+                return f"Circuit breaker half-open, probe running on {state['probe']}"
+            if state["state"] == OPEN and now - state["opened_at"] < self.cooldown_s:
+                return (f"Circuit breaker open after {state['failures']} infrastructure failures "
+                        f"(last: {state.get('last_error', '?')}); retrying in "
+                        f"{self.cooldown_s - (now - state['opened_at']):.0f}s")
+            # Cooldown over (or the previous probe never reported back): this test probes
+            state.update(state=HALF_OPEN, probe=self.worker, probe_started=now)
+            self._write(state)
+            return None
+
+    def record(self, infrastructure_failure: bool, error: str = "") -> str:
+        """Count a finished test; returns the new state."""
+        with _locked(self.path):
+            state = self._read()
+            if not infrastructure_failure:
+                state.update(state=CLOSED, failures=0)
+                state.pop("probe", None)
+            else:
+                state["failures"] += 1
+                state["last_error"] = error.splitlines()[0][:200] if error else "?"
+                if state["state"] == HALF_OPEN or state["failures"] >= self.threshold:
+                    if state["state"] != OPEN:
+                        state["trips"] += 1
+                    state.update(state=OPEN, opened_at=time.time())
+                    state.pop("probe", None)
+            self._write(state)
+            return state["state"]
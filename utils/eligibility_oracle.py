@@ -0,0 +1,156 @@
+"""
+Rules oracle for the qualification outcome and the branch screens of a persona.
+
+A persona is the ``user_data`` dict (including ``health_conditions``). ``predict``
+answers for one persona; ``predict_many`` evaluates whole persona files
+column-wise: each rule becomes one Python int used as a bitset (bit ``i`` =
+persona ``i``), built by a single ``map`` over the column and packed through
+``int(..., 2)``, so no Python code runs per persona. That is what lets persona
+files be bucketed by expected outcome before a browser starts:
+
+    python -m utils.eligibility_oracle personas.jsonl --out-dir personas/by_outcome
+"""
+import argparse
+import json
+import time
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+DISQUALIFYING_CONDITIONS = (
+    "End-stage liver disease (cirrhosis)",
+    "End-stage kidney disease (on or about to be on dialysis)",
+    "Severe gastrointestinal condition (gastroparesis, blockage, inflammatory bowel disease)",
+    "Current diagnosis of or treatment for alcohol, opioid, or substance use disorder/dependence",
+    "Current suicidal thoughts and/or prior suicidal attempt",
+    "Cancer (active diagnosis, active treatment, or in remission or cancer-free for less than 5 continuous years - does not apply to non-melanoma skin cancer that was considered cured via simple excision)",
+)
+
+DISQUALIFIED = "disqualified_health_condition"
+ELIGIBLE = "eligible"
+
+# Copy the submission screen shows for each outcome (None: no outcome-specific text known)
+OUTCOME_MESSAGES = {
+    DISQUALIFIED: "You have indicated a health condition which prevents you from being prescribed.",
+    ELIGIBLE: None,
+}
+
+# Screens that only appear for some answers: (screen, field, answers that show it)
+BRANCH_RULES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("glp1_medicine", "taken_medication", ("Yes, I've taken GLP-1 medication",)),
+    ("last_three_month_medication_details", "last_three_month_medication", ("Yes",)),
+    ("surgery_weight_loss_details", "surgery_weight_loss", ("Yes",)),
+    ("weight_loss_program_details", "weight_loss_program", ("Yes",)),
+)
+
+
+class Prediction(NamedTuple):
+    outcome: str
+    message: Optional[str]
+    branch_screens: Tuple[str, ...]
+
+
+def predict(persona: Dict) -> Prediction:
+    """Expected outcome and branch screens of one persona."""
+    conditions = set(persona.get("health_conditions", ()))
+    outcome = DISQUALIFIED if conditions.intersection(DISQUALIFYING_CONDITIONS) else ELIGIBLE
+    branches = tuple(screen for screen, field, answers in BRANCH_RULES if persona.get(field) in answers)
+    return Prediction(outcome, OUTCOME_MESSAGES[outcome], branches)
+
+
+# ---------------------- Column-wise Evaluation ---------------------- #
+
+class _Columns:
+    """Bitsets (bit ``i`` = persona ``i``) over a persona list, one C-level ``map`` pass each."""
+
+    def __init__(self, personas: Sequence[Dict]):
+        self.personas = personas
+        self.count = len(personas)
+
+    def column(self, field: str, default=None) -> Iterator:
+        return map(dict.get, self.personas, repeat(field), repeat(default))
+
+    def any_of(self, field: str, values: Iterable) -> int:
+        """Personas whose ``field`` is one of ``values``."""
+        return _pack(map(frozenset(values).__contains__, self.column(field)))
+
+    def any_condition(self, conditions: Iterable[str]) -> int:
+        """Personas with at least one of ``conditions`` among their ``health_conditions``."""
+        unaffected = _pack(map(frozenset(conditions).isdisjoint, self.column("health_conditions", ())))
+        return ((1 << self.count) - 1) & ~unaffected
+
+
+_BINARY_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _pack(flags: Iterable[bool]) -> int:
+    """Truthy ``flags`` (persona order) as an int bitset, without a Python-level loop."""
+    data = bytes(flags)
+    return int(data[::-1].translate(_BINARY_DIGITS), 2) if data else 0
+
+
+class PredictionBatch(NamedTuple):
+    count: int
+    outcomes: Dict[str, int]    # outcome -> bitset of personas
+    branches: Dict[str, int]    # branch screen -> bitset of personas
+
+    def indices(self, bitset: int) -> List[int]:
+        """Persona indices set in ``bitset``."""
+        result, data = [], bitset.to_bytes(self.count // 8 + 1, "little")
+        for byte_index, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                result.append(byte_index * 8 + low.bit_length() - 1)
+                byte ^= low
+        return result
+
+    def counts(self) -> Dict[str, int]:
+        return {outcome: bin(bits).count("1") for outcome, bits in self.outcomes.items()}
+
+
+def predict_many(personas: Sequence[Dict]) -> PredictionBatch:
+    """Evaluate the rules for all ``personas`` at once."""
+    columns = _Columns(personas)
+    everyone = (1 << columns.count) - 1
+    disqualified = columns.any_condition(DISQUALIFYING_CONDITIONS)
+    branches = {screen: columns.any_of(field, answers) for screen, field, answers in BRANCH_RULES}
+    return PredictionBatch(
+        columns.count, {DISQUALIFIED: disqualified, ELIGIBLE: everyone & ~disqualified}, branches
+    )
+
+
+def bucket(personas: Sequence[Dict]) -> Dict[str, List[int]]:
+    """Persona indices grouped by expected outcome."""
+    batch = predict_many(personas)
+    return {outcome: batch.indices(bits) for outcome, bits in batch.outcomes.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bucket a persona file (JSONL) by expected qualification outcome.")
+    parser.add_argument("personas", help="JSONL file, one user_data dict per line")
+    parser.add_argument("--out-dir", help="Write <outcome>.jsonl files here")
+    args = parser.parse_args(argv)
+
+    lines = [line for line in Path(args.personas).read_text(encoding="utf-8").splitlines() if line.strip()]
+    personas = [json.loads(line) for line in lines]
+
+    started = time.perf_counter()
+    batch = predict_many(personas)
+    elapsed = time.perf_counter() - started
+    rate = len(personas) / elapsed if elapsed else float("inf")
+    for outcome, count in batch.counts().items():
+        print(f"{outcome:<32} {count:>10}")
+    print(f"⏱️ {len(personas)} personas in {elapsed:.3f}s ({rate:,.0f}/s)")
+
+    if args.out_dir:
+        out_dir = Path(args.out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for outcome, bits in batch.outcomes.items():
+            (out_dir / f"{outcome}.jsonl").write_text(
+                "".join(lines[i] + "\n" for i in batch.indices(bits)), encoding="utf-8"
+            )
+        print(f"📝 Buckets written to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Watchdog for a stalled Typeform iframe.
+
+A wait inside the iframe normally runs into its full timeout before anything
+reacts to a frame that stopped loading. The watchdog follows the iframe's
+progress instead — requests of its documents, scripts, styles and images
+starting and finishing, its document starting and reaching ``load``
+(``FRAME_PROGRESS_SCRIPT``), and DOM mutations — and ``guard`` runs a wait in
+short slices. When the frame is still loading (or a resource failed) and has
+made no progress for ``stall_ms``, only the iframe's ``src`` is reloaded and the
+wait goes on with the rest of its time. Aborted requests (a route that blocks
+images, a navigation cancelling its predecessor's loads) are not failures, and a
+failure is forgotten once a later request of the frame succeeds. Each recovery is logged with the time it
+saved compared to reacting only after the timeout.
+
+A frame that finished loading and sits idle is not stalled; waits on it fail the
+usual way.
+"""
+import logging
+import time
+import weakref
+from typing import Callable, List, NamedTuple, Optional
+
+from playwright.sync_api import BrowserContext, Frame, Page, Request, TimeoutError as PlaywrightTimeoutError
+
+from utils.locator_registry import FrameHandle
+
+BINDING_NAME = "__medviFrameProgress"
+STALL_MS = 4_000
+SLICE_MS = 500
+MAX_RECOVERIES = 2      # per wait
+# Long-polling XHR/fetch would look like a request that never progresses
+TRACKED_RESOURCES = ("document", "script", "stylesheet", "image", "font", "media")
+# ``Request.failure`` of requests cancelled on purpose (route.abort(), navigation), per browser
+ABORTED_FAILURES = ("net::ERR_ABORTED", "NS_BINDING_ABORTED", "cancelled")
+
+FRAME_PROGRESS_SCRIPT = """
+(() => {
+  if (window === window.top || window.__medviFrameProgress) return;
+  window.__medviFrameProgress = true;
+  const ping = (kind) => { try { window.%(binding)s(kind); } catch (e) {} };
+  ping("start");
+  window.addEventListener("load", () => ping("load"), { once: true });
+  let last = 0;
+  const observe = () => new MutationObserver(() => {
+    const now = Date.now();
+    if (now - last > 250) { last = now; ping("mutation"); }
+  }).observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+  if (document.documentElement) observe();
+  else document.addEventListener("DOMContentLoaded", observe, { once: true });
+})();
+""" % {"binding": BINDING_NAME}
+
+
+class Recovery(NamedTuple):
+    reason: str
+    stalled_ms: float   # time without progress when the stall was detected
+    waited_ms: float    # time into the wait when the frame was reloaded
+    saved_ms: float     # wait time left, i.e. how much later a timeout-driven recovery would have come
+
+
+class FrameWatchdog:
+    """Progress of the iframe of every page in one browser context."""
+
+    _watchdogs = weakref.WeakKeyDictionary()
+
+    def __init__(self, context: BrowserContext, selector: str, stall_ms: int):
+        self.selector = selector
+        self.stall_ms = stall_ms
+        self.recoveries: List[Recovery] = []
+        self.loading = False
+        self.failed: Optional[str] = None
+        self._inflight = set()
+        self._last_progress = time.monotonic()
+        self.log = logging.getLogger(self.__class__.__name__)
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_request_done)
+        context.on("requestfailed", self._on_request_failed)
+        context.expose_binding(BINDING_NAME, self._on_ping)
+        context.add_init_script(FRAME_PROGRESS_SCRIPT)
+
+    @classmethod
+    def install(cls, context: BrowserContext, selector: str, stall_ms: int = STALL_MS) -> "FrameWatchdog":
+        """Install the watchdog on ``context`` (before its pages navigate) and return it."""
+        watchdog = cls._watchdogs.get(context)
+        if watchdog is None:
+            watchdog = cls._watchdogs[context] = cls(context, selector, stall_ms)
+        return watchdog
+
+    @classmethod
+    def get(cls, page: Page) -> Optional["FrameWatchdog"]:
+        """The watchdog of ``page``'s context, None if it was not installed."""
+        return cls._watchdogs.get(page.context)
+
+    # ---------------------- Progress ---------------------- #
+
+    def _is_form_frame(self, frame: Frame) -> bool:
+        # Requests of nested frames count for the iframe they live in
+        while frame.parent_frame is not None and frame.parent_frame.parent_frame is not None:
+            frame = frame.parent_frame
+        if frame.parent_frame is None:
+            return False
+        current = FrameHandle.for_page(frame.page, self.selector).current
+        return current is None or frame is current
+
+    def _tracked(self, request: Request) -> bool:
+        try:
+            return request.resource_type in TRACKED_RESOURCES and self._is_form_frame(request.frame)
+        except Exception:
+            return False  # service worker requests have no frame
+
+    def _progress(self):
+        self._last_progress = time.monotonic()
+
+    def _on_request(self, request: Request):
+        if self._tracked(request):
+            self._inflight.add(request)
+            self._progress()
+
+    def _on_request_done(self, request: Request):
+        if request in self._inflight:
+            self._inflight.discard(request)
+            self.failed = None
+            self._progress()
+
+    def _on_request_failed(self, request: Request):
+        if request in self._inflight:
+            self._inflight.discard(request)
+            failure = request.failure or ""
+            if any(aborted in failure for aborted in ABORTED_FAILURES):
+                self._progress()
+                return
+            self.failed = f"{request.resource_type} {request.url[:80]} failed ({failure})"
+
+    def _on_ping(self, source, kind: str):
+        if not self._is_form_frame(source["frame"]):
+            return
+        if kind == "start":
+            self.loading, self.failed = True, None
+        elif kind == "load":
+            self.loading = False
+        self._progress()
+
+    def stall(self) -> Optional[str]:
+        """Why the iframe counts as stalled right now, None while it progresses or is idle."""
+        idle_ms = (time.monotonic() - self._last_progress) * 1000
+        if idle_ms < self.stall_ms:
+            return None
+        if self.failed:
+            return self.failed
+        if self._inflight:
+            return f"{len(self._inflight)} request(s) pending"
+        if self.loading:
+            return "document never reached 'load'"
+        return None
+
+    # ---------------------- Recovery ---------------------- #
+
+    def reload_frame(self, page: Page):
+        """Reload only the iframe (``src = src``), not the page around it."""
+        page.evaluate("(selector) => { const f = document.querySelector(selector); if (f) f.src = f.src; }",
+                      self.selector)
+        FrameHandle.for_page(page, self.selector).invalidate()
+        self._inflight.clear()
+        self.failed = None
+        self._progress()
+
+    def guard(self, page: Page, wait: Callable[[int], None], timeout: int):
+        """Run ``wait(ms)`` for up to ``timeout`` ms, reloading the iframe whenever it stalls."""
+        started = time.monotonic()
+        deadline = started + timeout / 1000
+        recoveries = 0
+        while True:
+            remaining = (deadline - time.monotonic()) * 1000
+            try:
+                return wait(max(1, int(min(remaining, SLICE_MS))))
+            except (AssertionError, PlaywrightTimeoutError):
+                if remaining <= SLICE_MS:
+                    raise
+            reason = self.stall()
+            if reason is None or recoveries >= MAX_RECOVERIES:
+                continue
+            now = time.monotonic()
+            recovery = Recovery(reason, (now - self._last_progress) * 1000,
+                                (now - started) * 1000, (deadline - now) * 1000)
+            self.reload_frame(page)
+            recoveries += 1
+            self.recoveries.append(recovery)
+            self.log.warning(
+                f"🐕 Iframe stalled ({recovery.reason}, {recovery.stalled_ms:.0f} ms without progress); "
+                f"reloaded its src after {recovery.waited_ms:.0f} ms, saving {recovery.saved_ms / 1000:.1f}s "
+                f"of the {timeout / 1000:.0f}s timeout"
+            )
+
+    def report(self) -> str:
+        rows = [f"{'waited ms':>9} {'stalled ms':>10} {'saved s':>8}  reason"]
+        rows += [f"{r.waited_ms:>9.0f} {r.stalled_ms:>10.0f} {r.saved_ms / 1000:>8.1f}  {r.reason}"
+                 for r in self.recoveries]
+        rows.append(f"total saved: {sum(r.saved_ms for r in self.recoveries) / 1000:.1f}s")
+        return "\n".join(rows)
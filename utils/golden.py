@@ -0,0 +1,100 @@
+"""
+Golden snapshots of every flow step's screen.
+
+Before each step the iframe's visible nodes (``utils.screen_template.take_snapshot``)
+are normalized to text lines, digits masked, and hashed. A step whose hash equals
+the stored golden is confirmed with one snapshot and a string comparison; only a
+differing hash waits for the screen to settle and produces a unified diff. All
+steps of a run are checked, so copy changes show up together instead of as one
+timeout at a time. Goldens live in one JSON file so changes are reviewable in git.
+"""
+import difflib
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.screen_template import take_snapshot
+
+DEFAULT_PATH = "goldens/steps.json"
+SETTLE_ATTEMPTS = 4
+SETTLE_INTERVAL_MS = 250
+
+_DIGITS = re.compile(r"\d+")
+
+
+def normalize(snapshot) -> List[str]:
+    """Snapshot nodes as ``role: text`` lines with numbers masked (BMI, weights, dates vary per run)."""
+    return [f"{node.role}: {_DIGITS.sub('#', node.name)}" for node in snapshot]
+
+
+def digest(lines: List[str]) -> str:
+    return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+class GoldenStore:
+    """Stored step hashes and lines, plus the mismatches found in this session."""
+
+    def __init__(self, path: str = DEFAULT_PATH, update: bool = False):
+        self.path = Path(path)
+        self.update = update
+        self.goldens: Dict[str, dict] = self._load()
+        self.mismatches: Dict[str, str] = {}
+        self.missing: List[str] = []
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def matches(self, key: str, lines: List[str]) -> bool:
+        golden = self.goldens.get(key)
+        return golden is not None and golden["hash"] == digest(lines)
+
+    def record(self, key: str, lines: List[str]) -> Optional[str]:
+        """Store ``lines`` as the golden (update mode) or return their diff against it."""
+        golden = self.goldens.get(key)
+        if self.update:
+            self.goldens[key] = {"hash": digest(lines), "lines": lines}
+            self._dirty = True
+            return None
+        if golden is None:
+            self.missing.append(key)
+            return None
+        diff = "\n".join(difflib.unified_diff(
+            golden["lines"], lines, fromfile=f"golden/{key}", tofile=f"actual/{key}", lineterm="", n=1,
+        ))
+        self.mismatches[key] = diff
+        return diff
+
+    def save(self):
+        """Write updated goldens, merging with entries other workers saved meanwhile."""
+        if not self._dirty:
+            return
+        merged = {**self._load(), **self.goldens}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def check_screen(store: GoldenStore, key: str, page, frame) -> Optional[str]:
+    """Compare the current screen with golden ``key``; returns the diff if it changed."""
+    lines = normalize(take_snapshot(frame))
+    if store.matches(key, lines):
+        return None
+    # Not the golden: let transitions finish so only real changes get reported
+    for _ in range(SETTLE_ATTEMPTS):
+        page.wait_for_timeout(SETTLE_INTERVAL_MS)
+        settled = normalize(take_snapshot(frame))
+        if store.matches(key, settled):
+            return None
+        if settled == lines:
+            break
+        lines = settled
+    return store.record(key, lines)
@@ -0,0 +1,187 @@
+"""
+Perceptual-hash verification of the form's images, from network response bodies.
+
+``ImageVerifier`` notes the image responses of a page without touching them in
+the event handler. Once a page object registers the image it expects
+(``BasePage.verify_image_hash``) the body of that one response is read on the
+test thread (or after the test body, if the image arrives later) and hashed
+(difference hash, 64 bits) on a thread pool, so steps never wait for the
+hashing. Hashes are cached on disk by URL + ETag; a cached image is not even
+downloaded from the response again. The comparison against the stored
+references runs once the test body finished, and a swapped creative fails the
+test then.
+"""
+import json
+import logging
+import os
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PIL import Image
+from playwright.sync_api import Page, Response
+
+DEFAULT_REFERENCES = "goldens/images.json"
+DEFAULT_CACHE = ".medvi_image_hashes.json"
+MAX_DISTANCE = 6  # of 64 bits; re-encoded or resized creatives stay well below
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-hash")
+
+
+def dhash(data: bytes, size: int = 8) -> str:
+    """Difference hash of an encoded image as 16 hex digits."""
+    image = Image.open(BytesIO(data))
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+        image = Image.alpha_composite(background, image)
+    pixels = image.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS).tobytes()
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left, right = pixels[row * (size + 1) + col], pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return f"{bits:0{size * size // 4}x}"
+
+
+def distance(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+class _JsonFile:
+    """Small JSON dict persisted atomically."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        try:
+            self.data: Dict[str, str] = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.data = {}
+        except ValueError as e:
+            raise ValueError(f"{self.path} is not valid JSON ({e}); fix or delete it") from None
+        self.dirty = False
+
+    def save(self):
+        """Write the entries, merged with those other workers saved meanwhile."""
+        if not self.dirty:
+            return
+        merged = {**_JsonFile(str(self.path)).data, **self.data}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+class ImageVerifier:
+    """Hash image responses of one page and check them against the references."""
+
+    _verifiers = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, references: str = DEFAULT_REFERENCES, cache: str = DEFAULT_CACHE,
+                 update: bool = False):
+        self.references = _JsonFile(references)
+        self.cache = _JsonFile(cache)
+        self.update = update
+        self.responses: Dict[str, Response] = {}  # url -> response not hashed yet
+        self.hashes: Dict[str, Future] = {}     # url -> future hash
+        self.expected: List[str] = []           # url substrings registered by page objects
+        self.rows: List[str] = []               # per-image outcome of the last resolve()
+        self.log = logging.getLogger(self.__class__.__name__)
+        page.on("response", self._on_response)
+        self._verifiers[page] = self
+
+    @classmethod
+    def get(cls, page: Page) -> Optional["ImageVerifier"]:
+        """The verifier attached to ``page``, if image hashing is enabled."""
+        return cls._verifiers.get(page)
+
+    def expect(self, pattern: str):
+        if pattern not in self.expected:
+            self.expected.append(pattern)
+        for url in [u for u in self.responses if pattern in u]:
+            self._hash(url)
+
+    # ---------------------- Capture ---------------------- #
+
+    def _wanted(self, url: str) -> bool:
+        # Update mode records every image; check mode only those with a reference
+        return self.update or any(pattern in url for pattern in self.references.data)
+
+    def _on_response(self, response: Response):
+        if response.request.resource_type != "image" or not response.ok or not self._wanted(response.url):
+            return
+        key = self._cache_key(response)
+        if key and key in self.cache.data:
+            future = Future()
+            future.set_result(self.cache.data[key])
+            self.hashes[response.url] = future
+        else:
+            # body() is a round trip to the browser; never in the event dispatcher
+            self.hashes.pop(response.url, None)
+            self.responses[response.url] = response
+
+    @staticmethod
+    def _cache_key(response: Response) -> Optional[str]:
+        etag = response.headers.get("etag")
+        return f"{response.url}|{etag}" if etag else None
+
+    def _hash(self, url: str):
+        """Read the body of the captured response of ``url`` and hash it on the pool."""
+        response = self.responses.pop(url)
+        try:
+            body = response.body()
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            self.hashes[url] = future
+            return
+        future = _EXECUTOR.submit(dhash, body)
+        key = self._cache_key(response)
+        if key:
+            future.add_done_callback(lambda f: self._cache(key, f))
+        self.hashes[url] = future
+
+    def _cache(self, key: str, future: Future):
+        if future.exception() is None:
+            self.cache.data[key] = future.result()
+            self.cache.dirty = True
+
+    # ---------------------- Verification ---------------------- #
+
+    def resolve(self) -> List[str]:
+        """Compare every expected image with its reference; returns the failures."""
+        failures, rows = [], []
+        for pattern in self.expected:
+            url = next((u for u in self.hashes if pattern in u), None)
+            if url is None:
+                url = next((u for u in self.responses if pattern in u), None)
+                if url is None:
+                    rows.append(f"{pattern}: response not captured")
+                    continue
+                self._hash(url)
+            try:
+                actual = self.hashes[url].result()
+            except Exception as e:
+                failures.append(f"{pattern}: could not hash image ({e})")
+                continue
+            if self.update:
+                self.references.data[pattern] = actual
+                self.references.dirty = True
+                rows.append(f"{pattern}: recorded {actual}")
+                continue
+            reference = self.references.data.get(pattern)
+            if reference is None:
+                rows.append(f"{pattern}: {actual} (no reference, record with --medvi-image-hash=update)")
+                continue
+            bits = distance(actual, reference)
+            rows.append(f"{pattern}: {actual} vs {reference}, distance {bits}")
+            if bits > MAX_DISTANCE:
+                failures.append(f"{pattern} changed (hash distance {bits} > {MAX_DISTANCE}, {url})")
+        self.expected.clear()
+        self.references.save()
+        self.cache.save()
+        self.rows = rows
+        return failures
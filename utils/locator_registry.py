@@ -0,0 +1,126 @@
+"""
+Locator registry for the MEDVi page objects.
+
+Selectors are declared per page class in ``LOCATORS`` and compiled once, when the
+class is defined. At run time every Playwright ``Page`` gets one ``FrameHandle``
+holding the resolved Typeform ``Frame`` and the ``Locator`` objects built on it;
+both are dropped only when that frame navigates or detaches, instead of calling
+``page.frame_locator(...)`` and rebuilding XPath strings on every access.
+
+``BasePage.LOCATORS`` holds the selectors shared by every screen (``next_button``,
+``option``, the form's inputs and dropdowns by position …); each page object adds
+its own and looks them all up through ``BasePage.locator(name, **params)``.
+"""
+import logging
+import time
+import weakref
+from functools import lru_cache
+from typing import Dict, Union
+
+from playwright.sync_api import Frame, Locator, Page
+
+
+def escape_xpath_text(text: str) -> str:
+    """Safely escape text for XPath literal (handles both ' and ")."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
+@lru_cache(maxsize=1024)
+def format_selector(template: str, **params: Union[str, int]) -> str:
+    """
+    Fill ``{name}`` placeholders of a compiled template with XPath-escaped literals,
+    or with plain numbers for ``int`` values (positions such as ``[{index}]``).
+    """
+    return template.format(**{
+        name: value if isinstance(value, int) else escape_xpath_text(value) for name, value in params.items()
+    })
+
+
+def compile_locators(cls) -> Dict[str, str]:
+    """Merge ``LOCATORS`` along the MRO (subclasses win) and make XPath explicit."""
+    compiled: Dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        for name, selector in vars(klass).get("LOCATORS", {}).items():
+            if selector.startswith(("//", "(//")):
+                selector = f"xpath={selector}"
+            compiled[name] = selector
+    return compiled
+
+
+class FrameHandle:
+    """The resolved iframe ``Frame`` of one page, plus the locators built on it."""
+
+    _handles: "weakref.WeakKeyDictionary[Page, FrameHandle]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, selector: str):
+        self.page = page
+        self.selector = selector
+        self.resolutions = 0
+        self.invalidations = 0
+        self._frame = None
+        self._locators: Dict[str, Locator] = {}
+        self.log = logging.getLogger("FrameHandle")
+        page.on("framenavigated", self._on_frame_event)
+        page.on("framedetached", self._on_frame_event)
+
+    @classmethod
+    def for_page(cls, page: Page, selector: str) -> "FrameHandle":
+        handle = cls._handles.get(page)
+        if handle is None:
+            handle = cls._handles[page] = cls(page, selector)
+        return handle
+
+    @classmethod
+    def stats(cls, page: Page) -> Dict[str, int]:
+        handle = cls._handles.get(page)
+        if handle is None:
+            return {"resolutions": 0, "invalidations": 0}
+        return {"resolutions": handle.resolutions, "invalidations": handle.invalidations}
+
+    @property
+    def current(self):
+        """The resolved ``Frame`` if any, without resolving it."""
+        return self._frame
+
+    def _on_frame_event(self, frame: Frame):
+        if frame is self._frame:
+            self.invalidate()
+
+    def invalidate(self):
+        if self._frame is not None:
+            self.invalidations += 1
+        self._frame = None
+        self._locators.clear()
+
+    def frame(self, timeout: int) -> Frame:
+        """Return the iframe's ``Frame``, resolving it only when missing or detached."""
+        if self._frame is None or self._frame.is_detached():
+            self._locators.clear()
+            self._frame = self._resolve(timeout)
+            self.resolutions += 1
+        return self._frame
+
+    def locator(self, selector: str, timeout: int) -> Locator:
+        """Return the cached ``Locator`` for ``selector`` on the current frame."""
+        frame = self.frame(timeout)
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = frame.locator(selector)
+        return locator
+
+    def _resolve(self, timeout: int) -> Frame:
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = max(1, int((deadline - time.monotonic()) * 1000))
+            element = self.page.wait_for_selector(self.selector, state="attached", timeout=remaining)
+            frame = element.content_frame()
+            if frame is not None:
+                return frame
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"❌ Iframe '{self.selector}' has no content frame after {timeout}ms")
+            self.page.wait_for_timeout(50)
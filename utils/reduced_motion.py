@@ -0,0 +1,53 @@
+"""
+Animation and transition suppression for the Typeform iframe.
+
+The scripts here are installed with ``BrowserContext.add_init_script`` so they run
+in every frame on every load, before the page's own scripts. Together with the
+context's ``reduced_motion="reduce"`` emulation they make screens actionable as
+soon as the DOM settles instead of after their enter/leave animations.
+"""
+import json
+
+NO_ANIMATION_CSS = """
+*, *::before, *::after {
+  animation-duration: 0s !important;
+  animation-delay: 0s !important;
+  transition-duration: 0s !important;
+  transition-delay: 0s !important;
+  scroll-behavior: auto !important;
+}
+"""
+
+NO_ANIMATION_SCRIPT = """
+(() => {
+  const css = %s;
+  const install = () => {
+    const style = document.createElement("style");
+    style.setAttribute("data-medvi", "no-animation");
+    style.textContent = css;
+    (document.head || document.documentElement).appendChild(style);
+  };
+  if (document.documentElement) install();
+  else document.addEventListener("DOMContentLoaded", install, { once: true });
+})();
+""" % json.dumps(NO_ANIMATION_CSS)
+
+
+def timer_speedup_script(factor: float) -> str:
+    """Init script dividing every ``setTimeout``/``setInterval`` delay by ``factor``."""
+    return """
+(() => {
+  const factor = %s;
+  const scale = (ms) => Math.max(0, (Number(ms) || 0) / factor);
+  const setTimeout_ = window.setTimeout, setInterval_ = window.setInterval;
+  window.setTimeout = function (fn, ms, ...args) { return setTimeout_.call(this, fn, scale(ms), ...args); };
+  window.setInterval = function (fn, ms, ...args) { return setInterval_.call(this, fn, scale(ms), ...args); };
+})();
+""" % float(factor)
+
+
+def install(context, timer_speedup: float = 1.0):
+    """Suppress animations in every frame of ``context``; speed up page timers when ``timer_speedup`` > 1."""
+    context.add_init_script(NO_ANIMATION_SCRIPT)
+    if timer_speedup > 1:
+        context.add_init_script(timer_speedup_script(timer_speedup))
@@ -0,0 +1,98 @@
+"""
+Consistency of the 'Your Medical Review' values with the persona that was entered.
+
+``expected_review`` computes BMI, current and goal weight from ``user_data`` once
+per distinct height/weight combination (memoized, so high-volume persona runs pay
+for the arithmetic only once). ``extract_pairs`` turns one screen snapshot
+(``utils.screen_template.take_snapshot``, a single ``evaluate``) into label/value
+pairs, and ``check_review`` compares them with a tolerance that follows the
+precision the screen displays.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+BMI = "BMI"
+CURRENT_WEIGHT = "Current Weight"
+GOAL_WEIGHT = "Goal Weight"
+REVIEW_LABELS = (BMI, CURRENT_WEIGHT, GOAL_WEIGHT)
+
+# Slack on top of display rounding, for BMI formulas that go through metric units
+BMI_TOLERANCE = 0.1
+LOOKAHEAD = 3  # nodes after a label that may hold its value
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)?")
+
+
+class ReviewExpectation(NamedTuple):
+    bmi: float
+    current_weight: float
+    goal_weight: float
+
+
+def bmi(feet: int, inches: int, pounds: float) -> float:
+    """Body-mass index from imperial height and weight."""
+    height = feet * 12 + inches
+    return 703 * pounds / (height * height)
+
+
+@lru_cache(maxsize=4096)
+def _expected(feet: int, inches: int, weight: float, goal_weight: float) -> ReviewExpectation:
+    return ReviewExpectation(bmi(feet, inches, weight), weight, goal_weight)
+
+
+def expected_review(persona: Dict) -> ReviewExpectation:
+    """Values the review screen should show for ``persona`` (a ``user_data`` dict)."""
+    return _expected(int(persona["feet"]), int(persona["inches"]),
+                     float(persona["weight"]), float(persona["goal_weight"]))
+
+
+def extract_pairs(texts: Sequence[str], labels: Sequence[str] = REVIEW_LABELS) -> Dict[str, str]:
+    """
+    Value text per label: the rest of the label's own node when it carries a number
+    (``BMI: 27.4``), otherwise the first numeric node within ``LOOKAHEAD`` nodes.
+    """
+    pairs = {}
+    for index, text in enumerate(texts):
+        label = next((l for l in labels if l not in pairs and text.startswith(l)), None)
+        if label is None:
+            continue
+        rest = text[len(label):]
+        if _NUMBER.search(rest):
+            pairs[label] = rest.strip(" :")
+            continue
+        for candidate in texts[index + 1:index + 1 + LOOKAHEAD]:
+            if any(candidate.startswith(l) for l in labels):
+                break
+            if _NUMBER.search(candidate):
+                pairs[label] = candidate
+                break
+    return pairs
+
+
+def parse_value(text: str) -> Optional[tuple]:
+    """First number in ``text`` and the number of decimals it was displayed with."""
+    match = _NUMBER.search(text)
+    if match is None:
+        return None
+    number = match.group().replace(",", ".")
+    decimals = len(number.split(".")[1]) if "." in number else 0
+    return float(number), decimals
+
+
+def check_review(expected: ReviewExpectation, pairs: Dict[str, str]) -> List[str]:
+    """Problems of the extracted ``pairs`` against ``expected``; empty when consistent."""
+    problems = []
+    for label, want, slack in ((BMI, expected.bmi, BMI_TOLERANCE),
+                               (CURRENT_WEIGHT, expected.current_weight, 0.0),
+                               (GOAL_WEIGHT, expected.goal_weight, 0.0)):
+        shown = pairs.get(label)
+        parsed = parse_value(shown) if shown is not None else None
+        if parsed is None:
+            problems.append(f"{label}: no value found")
+            continue
+        value, decimals = parsed
+        tolerance = 0.5 * 10 ** -decimals + slack
+        if abs(value - want) > tolerance + 1e-9:
+            problems.append(f"{label}: shows {shown!r}, expected {want:.2f} (±{tolerance:g})")
+    return problems
@@ -0,0 +1,190 @@
+"""
+Typeform screen-change events, pushed from the browser instead of polled for.
+
+``SCREEN_BRIDGE_SCRIPT`` runs in every frame of the context. Inside the Typeform
+iframe it watches the DOM (focused block, question heading, progress bar
+``aria-valuenow``) and reports a new screen whenever the question changes; in any
+frame it forwards Typeform ``postMessage`` events such as ``form-screen-changed``.
+Both reach Python through one ``expose_binding`` call as ``ScreenChanged`` events.
+
+Waiting for a screen is resolved by the observer itself (``waitFor`` returns a
+promise), so callers block on a single ``evaluate`` rather than a polling loop.
+"""
+import logging
+import weakref
+from typing import Callable, List, NamedTuple, Optional
+
+from playwright.sync_api import BrowserContext, Frame, Page, TimeoutError as PlaywrightTimeoutError
+
+BINDING_NAME = "__medviScreenChanged"
+
+
+class ScreenChanged(NamedTuple):
+    question_id: str
+    title: str
+    index: int
+    source: str         # "dom" or "postMessage"
+    timestamp: float    # browser clock, ms since epoch
+
+
+SCREEN_BRIDGE_SCRIPT = """
+(() => {
+  if (window.__medviScreens) return;
+  const emit = (screen) => { try { window.%(binding)s(screen); } catch (e) {} };
+
+  window.addEventListener("message", (event) => {
+    let data = event.data;
+    if (typeof data === "string") { try { data = JSON.parse(data); } catch (e) { return; } }
+    if (!data || typeof data.type !== "string" || !data.type.startsWith("form-")) return;
+    emit({ question_id: String(data.ref || data.type), title: "", index: -1,
+           source: "postMessage", timestamp: Date.now() });
+  });
+
+  if (window === window.top) return;
+
+  const norm = (s) => (s || "").replace(/\\s+/g, " ").trim();
+  const visible = (el) => { const r = el.getBoundingClientRect(); return r.width > 0 && r.height > 0; };
+  const HEADINGS = '[data-qa="question-title"], [role="heading"], h1, h2, h3, legend';
+
+  const titleOf = (root) => {
+    for (const el of root.querySelectorAll(HEADINGS)) if (visible(el) && norm(el.textContent)) return norm(el.textContent);
+    // Typeform renders most questions as plain spans; fall back to the first visible question text
+    for (const el of root.querySelectorAll("span, p")) {
+      const text = norm(el.textContent);
+      if (text.endsWith("?") && visible(el)) return text;
+    }
+    return "";
+  };
+
+  const current = () => {
+    const block = document.querySelector('[data-qa-focused="true"]') || document.body;
+    if (!block) return null;
+    const progress = document.querySelector('[role="progressbar"][aria-valuenow]');
+    const title = titleOf(block);
+    const id = block.getAttribute("data-qa-blockref") || block.id || title;
+    if (!id) return null;
+    return { question_id: id, title, index: progress ? Number(progress.getAttribute("aria-valuenow")) : -1 };
+  };
+
+  const screens = [];
+  const waiters = new Set();
+  const matches = (screen, want) =>
+    (!want.question_id || screen.question_id === want.question_id) &&
+    (!want.title || screen.title.includes(norm(want.title))) &&
+    (want.index == null || screen.index === want.index) &&
+    (!want.not_question_id || screen.question_id !== want.not_question_id);
+
+  let scheduled = false;
+  const check = () => {
+    scheduled = false;
+    const screen = current();
+    const last = screens[screens.length - 1];
+    if (!screen || (last && last.question_id === screen.question_id && last.title === screen.title)) return;
+    if (screen.index < 0) screen.index = screens.length;
+    Object.assign(screen, { source: "dom", timestamp: Date.now() });
+    screens.push(screen);
+    emit(screen);
+    for (const waiter of [...waiters]) if (matches(screen, waiter.want)) waiter.resolve(screen);
+  };
+  const schedule = () => { if (!scheduled) { scheduled = true; Promise.resolve().then(check); } };
+
+  window.__medviScreens = {
+    current: () => screens[screens.length - 1] || null,
+    // Resolve with the first screen (current or future) matching `want`, or null after `timeout` ms.
+    waitFor(want, timeout) {
+      const last = screens[screens.length - 1];
+      if (last && matches(last, want)) return Promise.resolve(last);
+      return new Promise((resolve) => {
+        const waiter = { want, resolve: (screen) => { waiters.delete(waiter); clearTimeout(timer); resolve(screen); } };
+        const timer = setTimeout(() => waiter.resolve(null), timeout);
+        waiters.add(waiter);
+      });
+    },
+  };
+
+  const start = () => {
+    new MutationObserver(schedule).observe(document.documentElement, {
+      childList: true, subtree: true, characterData: true, attributes: true,
+      attributeFilter: ["data-qa-focused", "aria-valuenow", "style", "class", "hidden"],
+    });
+    schedule();
+  };
+  if (document.documentElement) start();
+  else document.addEventListener("DOMContentLoaded", start, { once: true });
+})();
+""" % {"binding": BINDING_NAME}
+
+
+class ScreenBridge:
+    """Stream of ``ScreenChanged`` events for one browser context."""
+
+    _bridges = weakref.WeakKeyDictionary()
+
+    def __init__(self, context: BrowserContext):
+        self.events: List[ScreenChanged] = []
+        self._listeners: List[Callable[[ScreenChanged], None]] = []
+        self.log = logging.getLogger(self.__class__.__name__)
+        context.expose_binding(BINDING_NAME, self._on_screen)
+        context.add_init_script(SCREEN_BRIDGE_SCRIPT)
+
+    @classmethod
+    def install(cls, context: BrowserContext) -> "ScreenBridge":
+        """Install the bridge on ``context`` (before its pages navigate) and return it."""
+        bridge = cls._bridges.get(context)
+        if bridge is None:
+            bridge = cls._bridges[context] = cls(context)
+        return bridge
+
+    @classmethod
+    def for_page(cls, page: Page) -> "ScreenBridge":
+        """The bridge of ``page``'s context, installing it into already loaded frames if needed."""
+        bridge = cls._bridges.get(page.context)
+        if bridge is None:
+            bridge = cls.install(page.context)
+            for frame in page.frames:
+                frame.evaluate(SCREEN_BRIDGE_SCRIPT)
+        return bridge
+
+    def subscribe(self, listener: Callable[[ScreenChanged], None]):
+        """Call ``listener`` for every screen change delivered from now on."""
+        self._listeners.append(listener)
+
+    def wait_for_screen(self, frame: Frame, timeout: int, title: Optional[str] = None,
+                        question_id: Optional[str] = None, index: Optional[int] = None) -> ScreenChanged:
+        """Block until the iframe shows a screen matching all given fields (the current screen counts)."""
+        want = {"title": title, "question_id": question_id, "index": index}
+        return self._wait(frame, want, timeout, f"No screen matching {want}")
+
+    def last_screen(self) -> Optional[ScreenChanged]:
+        """The latest DOM screen delivered to Python, None before the form showed one."""
+        return next((e for e in reversed(self.events) if e.source == "dom"), None)
+
+    def wait_for_next_screen(self, frame: Frame, timeout: int, previous: Optional[ScreenChanged]) -> ScreenChanged:
+        """Block until the iframe shows a screen other than ``previous`` (any screen if None)."""
+        left = previous.question_id if previous else None
+        return self._wait(frame, {"not_question_id": left}, timeout, f"Form did not leave screen {left!r}")
+
+    def _wait(self, frame: Frame, want: dict, timeout: int, failure: str) -> ScreenChanged:
+        script = "([want, timeout]) => window.__medviScreens ? window.__medviScreens.waitFor(want, timeout) : false"
+        screen = frame.evaluate(script, [want, timeout])
+        if screen is False:
+            frame.evaluate(SCREEN_BRIDGE_SCRIPT)
+            screen = frame.evaluate(script, [want, timeout])
+        if not screen:
+            raise PlaywrightTimeoutError(f"❌ {failure} within {timeout} ms")
+        return ScreenChanged(**screen)
+
+    def timeline(self) -> List[tuple]:
+        """``(title, seconds on screen)`` for every DOM screen but the last, from browser timestamps."""
+        screens = [e for e in self.events if e.source == "dom"]
+        return [
+            (screen.title or screen.question_id, (following.timestamp - screen.timestamp) / 1000)
+            for screen, following in zip(screens, screens[1:])
+        ]
+
+    def _on_screen(self, source, payload):
+        event = ScreenChanged(**payload)
+        self.events.append(event)
+        self.log.debug(f"📺 Screen {event.index}: {event.title or event.question_id} ({event.source})")
+        for listener in self._listeners:
+            listener(event)
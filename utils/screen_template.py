@@ -0,0 +1,134 @@
+"""
+Whole-screen verification against an accessibility-style template.
+
+A page object declares the screen it expects as ``SCREEN``, one node per line::
+
+    SCREEN = '''
+    - heading "Your Medical Review"
+    - text "BMI"
+    - button /Continue|Next/
+    '''
+
+``take_snapshot`` reads the iframe's visible nodes as ``(role, name)`` pairs in one
+``evaluate`` call and ``missing_nodes`` matches the template against them in Python.
+Roles are ``heading``, ``button``, ``textbox``, ``img`` and ``text``; a ``text`` line
+matches a node of any role. Names are compared after whitespace normalization, or
+as a regular expression when written between slashes.
+
+Templates replace verify methods that hard-check several static texts of one
+screen. Screens verified by a single heading, by an image ``src``, by option lists
+whose absence is only logged, or through ``BasePage.soft_assert`` (GLP-1 content)
+keep their locator checks; ``verify_screen`` fails hard, and a snapshot would not
+save a round trip for a single check.
+"""
+import difflib
+import re
+from typing import List, NamedTuple, Optional, Pattern
+
+from playwright.sync_api import Frame
+
+ROLES = ("heading", "button", "textbox", "img", "text")
+
+_LINE = re.compile(r'^-\s+(?P<role>\w+)\s+(?:"(?P<name>.*)"|/(?P<pattern>.*)/)\s*$')
+
+
+class ScreenNode(NamedTuple):
+    role: str
+    name: str
+    pattern: Optional[Pattern] = None
+
+    def matches(self, node: "ScreenNode") -> bool:
+        if self.role != "text" and self.role != node.role:
+            return False
+        if self.pattern is not None:
+            return bool(self.pattern.search(node.name))
+        return self.name == node.name
+
+    def __str__(self) -> str:
+        name = f"/{self.pattern.pattern}/" if self.pattern is not None else f'"{self.name}"'
+        return f"- {self.role} {name}"
+
+
+SNAPSHOT_SCRIPT = """
+() => {
+  const norm = (s) => (s || "").replace(/\\s+/g, " ").trim();
+  const visible = (el) => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== "hidden";
+  };
+  const roleOf = (el) => {
+    const explicit = el.getAttribute("role");
+    if (explicit === "heading" || explicit === "button" || explicit === "img") return explicit;
+    const tag = el.tagName;
+    if (/^H[1-6]$/.test(tag)) return "heading";
+    if (tag === "BUTTON") return "button";
+    if (tag === "IMG") return "img";
+    if (tag === "INPUT" || tag === "TEXTAREA") return "textbox";
+    return "text";
+  };
+  const nameOf = (el, role) => {
+    if (role === "img") return norm(el.getAttribute("alt"));
+    if (role === "textbox") return norm(el.getAttribute("aria-label") || el.getAttribute("placeholder"));
+    if (role === "button") return norm(el.textContent);
+    let text = "";
+    for (const child of el.childNodes) if (child.nodeType === Node.TEXT_NODE) text += child.nodeValue;
+    return norm(text);
+  };
+  const nodes = [];
+  for (const el of document.body ? document.body.querySelectorAll("*") : []) {
+    if (el.closest("script, style, noscript")) continue;
+    const role = roleOf(el);
+    const name = nameOf(el, role);
+    if ((name || role === "textbox") && visible(el)) nodes.push([role, name]);
+  }
+  return nodes;
+}
+"""
+
+
+def parse_template(template: str) -> List[ScreenNode]:
+    """Parse ``SCREEN`` lines; raises ValueError on lines that are not ``- role "name"`` or ``- role /regex/``."""
+    nodes = []
+    for line in template.strip().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _LINE.match(line)
+        if not match or match["role"] not in ROLES:
+            raise ValueError(f"Invalid screen template line: {line!r}")
+        if match["pattern"] is not None:
+            nodes.append(ScreenNode(match["role"], match["pattern"], re.compile(match["pattern"])))
+        else:
+            nodes.append(ScreenNode(match["role"], " ".join(match["name"].split())))
+    return nodes
+
+
+def take_snapshot(frame: Frame) -> List[ScreenNode]:
+    """Visible nodes of ``frame`` in document order, in one round trip."""
+    return [ScreenNode(role, name) for role, name in frame.evaluate(SNAPSHOT_SCRIPT)]
+
+
+def missing_nodes(template: List[ScreenNode], snapshot: List[ScreenNode]) -> List[ScreenNode]:
+    return [expected for expected in template if not any(expected.matches(node) for node in snapshot)]
+
+
+def render_diff(template: List[ScreenNode], snapshot: List[ScreenNode]) -> str:
+    """
+    Template with every line marked as found (``  ``) or missing (``- ``), each missing
+    line followed by the closest nodes actually on screen (``+ ``).
+    """
+    missing = set(missing_nodes(template, snapshot))
+    actual = [_label(node) for node in snapshot]
+    lines = []
+    for expected in template:
+        if expected not in missing:
+            lines.append(f"  {_label(expected)}")
+            continue
+        lines.append(f"- {_label(expected)}")
+        for candidate in difflib.get_close_matches(_label(expected), actual, n=2, cutoff=0.5):
+            lines.append(f"+ {candidate}")
+    return "\n".join(lines)
+
+
+def _label(node: ScreenNode) -> str:
+    return str(node)[2:]
@@ -0,0 +1,214 @@
+"""
+Duration-aware shard planner.
+
+Reads per-test durations from Allure (``allure-report/history/history.json`` for
+past runs, ``allure-results/*-result.json`` for the latest one) and splits the
+tests into N shards with longest-processing-time-first bin packing, so wall time
+is bounded by the slowest shard rather than by an unlucky split.
+
+``history.json`` is keyed by Allure ``historyId``. The ids are mapped to pytest
+node ids through the latest results, the generated report's test cases
+(``allure-report/data/test-cases``) and the mapping stored in the previous plan,
+so planning still works after CI ran with ``--clean-alluredir``.
+``history/duration-trend.json`` only holds whole-run totals; it is used to show
+the expected speed-up over the last run, not to balance shards.
+
+    python -m utils.shard_planner --nodes 4
+    pytest --medvi-shard=2/4
+"""
+import argparse
+import hashlib
+import heapq
+import json
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_PLAN = ".medvi_shards.json"
+
+
+# ---------------------- Durations ---------------------- #
+
+def _node_id(result: dict) -> Optional[str]:
+    """Return the pytest node id of an Allure result."""
+    for label in result.get("labels", []):
+        if label.get("name") == "nodeid":
+            return label["value"]
+    # Older results predate the label: rebuild it from "tests.test_medvi_app#test_name"
+    full_name = result.get("fullName")
+    if not full_name or "#" not in full_name:
+        return None
+    module, name = full_name.split("#", 1)
+    return f"{module.replace('.', '/')}.py::{name}"
+
+
+def load_history_ids(results_dir: str = "allure-results", report_dir: str = "allure-report",
+                     plan: Optional[dict] = None) -> Dict[str, str]:
+    """Allure ``historyId`` → pytest node id, from every source that still has both."""
+    history_ids: Dict[str, str] = dict((plan or {}).get("history_ids", {}))
+    sources = list(Path(report_dir, "data", "test-cases").glob("*.json")) + list(Path(results_dir).glob("*-result.json"))
+    for path in sources:
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        node_id = _node_id(result)
+        if node_id is not None and result.get("historyId"):
+            history_ids[result["historyId"]] = node_id
+    return history_ids
+
+
+def load_durations(results_dir: str = "allure-results",
+                   history_dir: str = "allure-report/history",
+                   history_ids: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+    """Return the median duration in ms of every test Allure has seen."""
+    node_ids: Dict[str, str] = dict(history_ids or {})
+    samples: Dict[str, List[float]] = {}
+
+    for path in Path(results_dir).glob("*-result.json"):
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        node_id = _node_id(result)
+        if node_id is None:
+            continue
+        node_ids[result.get("historyId")] = node_id
+        if result.get("start") and result.get("stop"):
+            samples.setdefault(node_id, []).append(result["stop"] - result["start"])
+
+    history_path = Path(history_dir) / "history.json"
+    if history_path.exists():
+        history = json.loads(history_path.read_text(encoding="utf-8"))
+        for history_id, entry in history.items():
+            node_id = node_ids.get(history_id)
+            if node_id is None:
+                continue
+            for item in entry.get("items", []):
+                duration = item.get("time", {}).get("duration")
+                if duration:
+                    samples.setdefault(node_id, []).append(duration)
+
+    return {node_id: statistics.median(values) for node_id, values in samples.items()}
+
+
+def load_run_totals(history_dir: str = "allure-report/history") -> List[float]:
+    """Whole-run durations in ms from ``duration-trend.json``, newest first."""
+    try:
+        trend = json.loads((Path(history_dir) / "duration-trend.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [entry["data"]["duration"] for entry in trend if entry.get("data", {}).get("duration")]
+
+
+def estimate(node_id: str, durations: Dict[str, float]) -> float:
+    """Duration of ``node_id``; unseen parametrizations (segments, personas) use their function's mean."""
+    if node_id in durations:
+        return durations[node_id]
+    function = node_id.split("[", 1)[0]
+    siblings = [d for n, d in durations.items() if n.split("[", 1)[0] == function]
+    if siblings:
+        return statistics.mean(siblings)
+    return statistics.median(durations.values()) if durations else 1.0
+
+
+# ---------------------- Planning ---------------------- #
+
+def plan_shards(durations: Dict[str, float], nodes: int) -> List[dict]:
+    """Split tests into ``nodes`` shards, longest test first onto the lightest shard."""
+    shards = [{"index": i + 1, "estimated_ms": 0.0, "tests": []} for i in range(nodes)]
+    heap = [(0.0, i) for i in range(nodes)]
+    for node_id, duration in sorted(durations.items(), key=lambda kv: (-kv[1], kv[0])):
+        load, i = heapq.heappop(heap)
+        shards[i]["tests"].append(node_id)
+        shards[i]["estimated_ms"] = load + duration
+        heapq.heappush(heap, (load + duration, i))
+    return shards
+
+
+def write_plan(shards: List[dict], durations: Dict[str, float], path: str = DEFAULT_PLAN,
+               history_ids: Optional[Dict[str, str]] = None):
+    plan = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "nodes": len(shards),
+        "shards": shards,
+        "durations": durations,
+        "history_ids": history_ids or {},
+    }
+    Path(path).write_text(json.dumps(plan, indent=2), encoding="utf-8")
+
+
+def load_plan(path: str = DEFAULT_PLAN) -> Optional[dict]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def assign_shards(node_ids: List[str], plan: Optional[dict], nodes: int) -> Dict[str, int]:
+    """
+    Map each collected node id to its 1-based shard.
+
+    Planned tests keep their shard. Tests missing from the plan continue the same
+    bin packing on top of the planned loads, which every node computes identically
+    from the same collection; without a plan, tests are spread by a stable hash.
+    """
+    if not plan:
+        return {n: int(hashlib.md5(n.encode("utf-8")).hexdigest(), 16) % nodes + 1 for n in node_ids}
+
+    assigned = {}
+    for shard in plan["shards"]:
+        for node_id in shard["tests"]:
+            assigned[node_id] = shard["index"]
+
+    durations = plan.get("durations", {})
+    unplanned = [n for n in node_ids if n not in assigned]
+    heap = [(shard["estimated_ms"], shard["index"]) for shard in plan["shards"]]
+    heapq.heapify(heap)
+    for node_id in sorted(unplanned, key=lambda n: (-estimate(n, durations), n)):
+        load, index = heapq.heappop(heap)
+        assigned[node_id] = index
+        heapq.heappush(heap, (load + estimate(node_id, durations), index))
+    return assigned
+
+
+def parse_shard(value: str):
+    """Parse ``"i/N"`` into ``(i, N)`` with 1 <= i <= N."""
+    try:
+        index, nodes = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Expected --medvi-shard=i/N, got '{value}'")
+    if not 1 <= index <= nodes:
+        raise ValueError(f"Shard index must be between 1 and {nodes}, got {index}")
+    return index, nodes
+
+
+# ---------------------- CLI ---------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan duration-balanced test shards from Allure history.")
+    parser.add_argument("--nodes", type=int, required=True, help="Number of CI nodes or xdist workers")
+    parser.add_argument("--results", default="allure-results", help="Allure results directory")
+    parser.add_argument("--history", default="allure-report/history", help="Allure history directory")
+    parser.add_argument("--report", default="allure-report", help="Generated Allure report (test cases map history ids)")
+    parser.add_argument("--output", default=DEFAULT_PLAN, help="Plan file consumed by --medvi-shard")
+    args = parser.parse_args(argv)
+
+    history_ids = load_history_ids(args.results, args.report, load_plan(args.output))
+    durations = load_durations(args.results, args.history, history_ids)
+    shards = plan_shards(durations, args.nodes)
+    write_plan(shards, durations, args.output, history_ids)
+
+    for shard in shards:
+        print(f"Shard {shard['index']}/{args.nodes}: {len(shard['tests'])} tests, "
+              f"~{shard['estimated_ms'] / 1000:.1f}s")
+    totals = load_run_totals(args.history)
+    if totals and shards:
+        slowest = max(shard["estimated_ms"] for shard in shards)
+        print(f"Last run took {totals[0] / 1000:.1f}s; slowest shard ~{slowest / 1000:.1f}s")
+    print(f"✅ Plan written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Soft assertions that share one short deadline.
+
+Checks registered inside a ``SoftAssertions`` block are not awaited one by one:
+when the block closes they are polled together until all pass or the shared
+budget runs out, so any number of missing elements costs the budget once.
+Failures are logged and attached to Allure; with the ``fail`` policy they are
+also queued and fail the test once it has finished running (see ``conftest.py``).
+"""
+import logging
+import time
+from typing import Callable, List, Optional, Tuple
+
+import allure
+from playwright.sync_api import Locator
+
+WARN = "warn"
+FAIL = "fail"
+POLICIES = (WARN, FAIL)
+
+POLL_INTERVAL_MS = 100
+
+# Failures of ``fail`` policy blocks (and golden mismatches) in the running test, drained by conftest.
+PENDING_FAILURES: List[str] = []
+
+
+class SoftAssertions:
+    """Collect checks, evaluate them together against one deadline, record what failed."""
+
+    def __init__(self, page, name: str, budget_ms: int, policy: str):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown soft assert policy '{policy}', expected one of {POLICIES}")
+        self.page = page
+        self.name = name
+        self.budget_ms = budget_ms
+        self.policy = policy
+        self.failures: List[str] = []
+        self._checks: List[Tuple[str, Callable[[], bool]]] = []
+        self._texts: List[Tuple[object, List[str]]] = []
+        self._failed: List[str] = []
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    # ---------------------- Checks ---------------------- #
+
+    def visible(self, locator: Locator, description: Optional[str] = None):
+        """Expect ``locator`` to become visible before the deadline."""
+        self._checks.append((description or str(locator), locator.is_visible))
+
+    def check(self, description: str, condition: Callable[[], bool]):
+        """Expect the non-blocking ``condition`` to return True before the deadline."""
+        self._checks.append((description, condition))
+
+    def texts_visible(self, page_object, texts: List[str]):
+        """Expect every text to be visible; each poll checks all of them in one index lookup."""
+        self._texts.append((page_object, list(texts)))
+
+    def fail(self, description: str):
+        """Record a failure already established outside the block (not polled)."""
+        self._failed.append(description)
+
+    # ---------------------- Evaluation ---------------------- #
+
+    def __enter__(self) -> "SoftAssertions":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            return False
+        self._evaluate()
+        self._report()
+        return False
+
+    def _evaluate(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        pending = list(self._checks)
+        pending_texts = [(page_object, list(texts)) for page_object, texts in self._texts]
+        while True:
+            pending = [(description, condition) for description, condition in pending if not self._passes(condition)]
+            pending_texts = [(page_object, self._missing_texts(page_object, texts))
+                             for page_object, texts in pending_texts]
+            pending_texts = [(page_object, texts) for page_object, texts in pending_texts if texts]
+            if (not pending and not pending_texts) or time.perf_counter() >= deadline:
+                break
+            self.page.wait_for_timeout(POLL_INTERVAL_MS)
+        self.failures = [description for description, _ in pending]
+        self.failures += [text for _, texts in pending_texts for text in texts]
+        self.failures += self._failed
+
+    @staticmethod
+    def _missing_texts(page_object, texts: List[str]) -> List[str]:
+        try:
+            visibility = page_object.texts_visible(texts)
+        except Exception:
+            return texts
+        return [text for text in texts if not visibility.get(text)]
+
+    @staticmethod
+    def _passes(condition: Callable[[], bool]) -> bool:
+        try:
+            return bool(condition())
+        except Exception:
+            return False
+
+    @property
+    def total(self) -> int:
+        return len(self._checks) + sum(len(texts) for _, texts in self._texts) + len(self._failed)
+
+    def _report(self):
+        passed = self.total - len(self.failures)
+        if not self.failures:
+            self.log.info(f"✅ {self.name}: all {passed} checks passed")
+            return
+        summary = f"{self.name}: {len(self.failures)}/{self.total} checks failed within {self.budget_ms} ms"
+        self.log.warning(f"⚠️ {summary}\n" + "\n".join(f"  - {f}" for f in self.failures))
+        allure.attach(
+            summary + "\n" + "\n".join(f"- {f}" for f in self.failures),
+            name=f"Soft assertions: {self.name}",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        if self.policy == FAIL:
+            PENDING_FAILURES.append(summary + ": " + "; ".join(self.failures))
+
+
+def drain() -> List[str]:
+    """Return and clear the queued failures of the current test."""
+    failures = list(PENDING_FAILURES)
+    PENDING_FAILURES.clear()
+    return failures
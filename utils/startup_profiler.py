@@ -0,0 +1,75 @@
+"""
+Startup-cost profiling for ``--medvi-profile-startup``.
+
+Collects how long it takes to get from ``pytest`` to the first ``page.goto``:
+module import times (measured in a clean interpreter with ``-X importtime``),
+fixture setup of ``playwright``/``browser``/``page``, browser launch latency per
+engine and the first navigation to ``BASE_URL``. The result is printed as a
+breakdown table and written as JSON so regressions can be tracked over time.
+"""
+import json
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+class StartupProfile:
+    """Ordered list of ``(category, name, ms)`` startup measurements."""
+
+    def __init__(self):
+        self.records: List[dict] = []
+
+    def record(self, category: str, name: str, seconds: float):
+        self.records.append({"category": category, "name": name, "ms": round(seconds * 1000, 2)})
+
+    @contextmanager
+    def timed(self, category: str, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - started)
+
+    def measure_imports(self, modules: Iterable[str], cwd: str = "."):
+        """Import ``modules`` in a fresh interpreter and record their cumulative import time."""
+        modules = list(modules)
+        code = "; ".join(f"import {m}" for m in modules)
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=cwd, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            self.record("import", f"failed: {proc.stderr.strip().splitlines()[-1:]}", 0)
+            return
+
+        wanted = set(modules) | {"allure", "playwright.sync_api"}
+        seen = set()
+        for line in proc.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if not match or match.group(4) not in wanted or match.group(4) in seen:
+                continue
+            seen.add(match.group(4))
+            self.record("import", match.group(4), int(match.group(2)) / 1_000_000)
+
+    def table(self) -> str:
+        """Render the measurements as a fixed-width breakdown table."""
+        width = max([len(r["name"]) for r in self.records] + [4])
+        lines = [f"{'Category':<10} {'Name':<{width}} {'ms':>10}", "-" * (width + 22)]
+        for r in self.records:
+            lines.append(f"{r['category']:<10} {r['name']:<{width}} {r['ms']:>10.2f}")
+        return "\n".join(lines)
+
+    def write_json(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        payload = {"generated": datetime.now().isoformat(timespec="seconds"), "records": self.records}
+        Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+STARTUP = StartupProfile()
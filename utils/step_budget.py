@@ -0,0 +1,160 @@
+"""
+Whole-flow SLA: a time budget per step, enforced on every wait inside it.
+
+Step ``n`` must finish by ``start + budget(1) + … + budget(n)``, so a fast step
+leaves its slack to the next ones while the flow as a whole stays within the sum
+(and within ``total_s`` when configured). While a budget is active,
+``BasePage.DEFAULT_TIMEOUT`` and ``BasePage.budgeted()`` never exceed the time left
+to the current deadline, so no wait or retry inside a step can outlive it; once
+the deadline has passed, the next wait raises ``BudgetExceeded`` with the per-step
+overrun report instead of running into its own timeout.
+
+Budgets come from a JSON file (``{"total_s": 240, "default_s": 10, "steps": {"1": 25}}``)
+or from the step timing medians of an earlier ``--medvi-step-timings`` run.
+"""
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.step_timings import load_medians
+
+HISTORY_FACTOR = 1.5
+MIN_STEP_S = 2.0
+DEFAULT_STEP_S = 10.0
+
+# Budget of the running test, set by the conftest fixture (None: no SLA, plain timeouts)
+ACTIVE: Optional["StepBudget"] = None
+
+_STEP_TITLE = re.compile(r"^Step (\d+):")
+
+
+class BudgetExceeded(AssertionError):
+    """The flow ran past its cumulative step deadline."""
+
+
+class StepBudget:
+    """Per-step budgets of one flow run and the time actually used."""
+
+    def __init__(self, steps: Dict[int, float], default_s: float = DEFAULT_STEP_S, total_s: Optional[float] = None):
+        self.steps = steps
+        self.default_s = default_s
+        self.total_s = total_s
+        self.used: Dict[int, float] = {}
+        self.titles: Dict[int, str] = {}
+        self._started: Optional[float] = None
+        self._current: Optional[int] = None
+        self._step_started = 0.0
+        self._cumulative = 0.0
+        self._deadline = float("inf")
+
+    # ---------------------- Configuration ---------------------- #
+
+    @classmethod
+    def from_file(cls, path: str) -> "StepBudget":
+        config = json.loads(Path(path).read_text(encoding="utf-8"))
+        steps = {int(number): float(seconds) for number, seconds in config.get("steps", {}).items()}
+        return cls(steps, float(config.get("default_s", DEFAULT_STEP_S)), config.get("total_s"))
+
+    @classmethod
+    def from_history(cls, path: str, factor: float = HISTORY_FACTOR) -> "StepBudget":
+        """Budgets of ``factor`` × the recorded median per step (``StepTimings`` JSON)."""
+        steps = {}
+        for title, median in load_medians(path).items():
+            match = _STEP_TITLE.match(title)
+            if match:
+                steps[int(match.group(1))] = max(MIN_STEP_S, median * factor)
+        if not steps:
+            raise ValueError(f"No step timings in {path}; record them with --medvi-step-timings first")
+        return cls(steps)
+
+    def budget(self, number: int) -> float:
+        return self.steps.get(number, self.default_s)
+
+    # ---------------------- Tracking ---------------------- #
+
+    def enter(self, number: int, title: str):
+        """Close the running step and open step ``number``; fails if the flow is already late."""
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        else:
+            self._close(now)
+            self.check()
+        self._current, self._step_started = number, now
+        self.titles[number] = title
+        self._cumulative += self.budget(number)
+        deadline = self._started + self._cumulative
+        if self.total_s is not None:
+            deadline = min(deadline, self._started + self.total_s)
+        self._deadline = deadline
+
+    def finish(self) -> bool:
+        """Close the last step; True if the flow ended past its cumulative deadline."""
+        if self._current is None:
+            return False
+        now = time.perf_counter()
+        self._close(now)
+        self._current = None
+        return now > self._deadline
+
+    def _close(self, now: float):
+        self.used[self._current] = now - self._step_started
+
+    def remaining_ms(self) -> float:
+        return (self._deadline - time.perf_counter()) * 1000
+
+    def check(self):
+        if self.remaining_ms() <= 0:
+            raise self.exceeded()
+
+    def cap(self, timeout_ms: int) -> int:
+        """``timeout_ms`` limited to the time left in the current step's deadline."""
+        if self._current is None:
+            return timeout_ms
+        remaining = self.remaining_ms()
+        if remaining <= 0:
+            raise self.exceeded()
+        return max(1, min(timeout_ms, int(remaining)))
+
+    # ---------------------- Reporting ---------------------- #
+
+    def exceeded(self) -> BudgetExceeded:
+        number = self._current
+        if number is not None and number not in self.used:
+            self.used[number] = time.perf_counter() - self._step_started
+        return BudgetExceeded(
+            f"❌ Flow SLA exceeded in step {number} ({self.titles.get(number, '?')})\n{self.report()}"
+        )
+
+    def report(self) -> str:
+        rows = [f"{'step':<52} {'budget s':>9} {'used s':>8} {'over s':>8}"]
+        total_budget = total_used = 0.0
+        for number in sorted(self.used):
+            budget, used = self.budget(number), self.used[number]
+            total_budget += budget
+            total_used += used
+            over = f"{used - budget:>8.2f}" if used > budget else ""
+            label = f"{number:>2} {self.titles.get(number, '')}"[:52]
+            rows.append(f"{label:<52} {budget:>9.2f} {used:>8.2f} {over:>8}")
+        rows.append(f"{'total':<52} {total_budget:>9.2f} {total_used:>8.2f}")
+        return "\n".join(rows)
+
+    def overruns(self) -> List[int]:
+        return [number for number, used in self.used.items() if used > self.budget(number)]
+
+
+def cap(timeout_ms: int) -> int:
+    """``timeout_ms`` limited by the active budget, if any."""
+    return timeout_ms if ACTIVE is None else ACTIVE.cap(timeout_ms)
+
+
+class BudgetedTimeout:
+    """Class attribute whose value is a default timeout capped by the active budget."""
+
+    def __init__(self, default_ms: int):
+        self.default_ms = default_ms
+
+    def __get__(self, obj, owner) -> int:
+        return cap(self.default_ms)
@@ -0,0 +1,92 @@
+"""
+Sampling profiler for the Python side of the harness, scoped to Allure steps.
+
+While an ``allure.step`` is open, a background thread samples the test thread's
+Python stack every few milliseconds. Each sample is prefixed with the titles of
+the open steps, so the collapsed-stack output (one ``stack count`` line per
+unique stack, as read by flamegraph.pl / speedscope) groups hot spots such as
+locator building, ``escape_xpath_text`` or logging under the step that paid for them.
+"""
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+import allure_commons
+
+DEFAULT_INTERVAL = 0.005
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})"
+
+
+def _clean(label: str) -> str:
+    # ';' separates frames and the last ' ' separates the count in collapsed stacks
+    return label.replace(";", ",").replace("\n", " ")
+
+
+class StepSampler:
+    """Collect stack samples of the current thread while Allure steps are active."""
+
+    def __init__(self, root: str, interval: float = DEFAULT_INTERVAL):
+        self.root = str(Path(root).resolve())
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._steps: List[str] = []
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="StepSampler", daemon=True)
+
+    # ---------------------- Allure Hooks ---------------------- #
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._steps.append(_clean(title))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        if self._steps:
+            self._steps.pop()
+
+    # ---------------------- Sampling ---------------------- #
+
+    def start(self):
+        allure_commons.plugin_manager.register(self)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        allure_commons.plugin_manager.unregister(self)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            steps = list(self._steps)
+            if not steps:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            self.samples[";".join(steps + self._stack(frame))] += 1
+
+    def _stack(self, frame) -> List[str]:
+        """Root-to-leaf frame labels, starting at the first frame inside the project."""
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        for i, f in enumerate(frames):
+            if f.f_code.co_filename.startswith(self.root):
+                frames = frames[i:]
+                break
+        return [_clean(_frame_label(f)) for f in frames]
+
+    def write_collapsed(self, path: str):
+        """Write the samples in collapsed-stack format."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,83 @@
+"""
+Wall-clock durations of the flow steps, compared across runs.
+
+Only top-level Allure steps are timed, i.e. the ``Step N: ...`` steps opened by
+``flow.steps.run_steps``. Each run writes the per-step medians under a mode name
+(``baseline``, ``reduced_motion`` ...); when the file of another mode already
+exists, ``savings_table`` shows what the current mode saves per step.
+"""
+import json
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+import allure_commons
+
+
+class StepTimings:
+    """Record the duration of every top-level Allure step."""
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self._open: List[tuple] = []
+
+    # ---------------------- Allure Hooks ---------------------- #
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._open.append((title, time.perf_counter()))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        if not self._open:
+            return
+        title, started = self._open.pop()
+        if not self._open:
+            self.durations[title].append(time.perf_counter() - started)
+
+    # ---------------------- Reporting ---------------------- #
+
+    def start(self):
+        allure_commons.plugin_manager.register(self)
+
+    def stop(self):
+        allure_commons.plugin_manager.unregister(self)
+
+    def medians(self) -> Dict[str, float]:
+        return {title: statistics.median(values) for title, values in self.durations.items()}
+
+    def write_json(self, path: str, mode: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        payload = {"mode": mode, "steps": {title: round(s, 4) for title, s in self.medians().items()}}
+        Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_medians(path: str) -> Dict[str, float]:
+    """Per-step medians written by ``StepTimings.write_json``; empty if the file is missing."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))["steps"]
+    except FileNotFoundError:
+        return {}
+
+
+def savings_table(baseline: Dict[str, float], current: Dict[str, float]) -> str:
+    """Per-step and total time saved by ``current`` relative to ``baseline``."""
+    rows = [f"{'step':<60} {'before s':>9} {'after s':>9} {'saved s':>9} {'saved %':>8}"]
+    total_before = total_after = 0.0
+    for title, after in current.items():
+        before = baseline.get(title)
+        if before is None:
+            continue
+        total_before += before
+        total_after += after
+        pct = (before - after) / before * 100 if before else 0.0
+        rows.append(f"{title[:60]:<60} {before:>9.2f} {after:>9.2f} {before - after:>9.2f} {pct:>7.1f}%")
+    if total_before:
+        pct = (total_before - total_after) / total_before * 100
+        rows.append(
+            f"{'total':<60} {total_before:>9.2f} {total_after:>9.2f} "
+            f"{total_before - total_after:>9.2f} {pct:>7.1f}%"
+        )
+    return "\n".join(rows)
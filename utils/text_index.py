@@ -0,0 +1,134 @@
+"""
+In-iframe text index.
+
+``TEXT_INDEX_SCRIPT`` is installed as a context init script, so it runs once per
+load of every frame (it only activates inside iframes). It keeps a ``Map`` from
+normalized own-text to elements, updated by a ``MutationObserver``, and tags
+each indexed element with ``data-medvi-tid`` so Python can address it with a
+plain attribute selector instead of evaluating a text XPath over the whole DOM.
+"""
+import statistics
+import time
+from typing import Dict, Iterable
+
+TID_ATTRIBUTE = "data-medvi-tid"
+
+TEXT_INDEX_SCRIPT = """
+(() => {
+  if (window === window.top || window.__medviTextIndex) return;
+
+  const norm = (s) => (s || "").replace(/\\s+/g, " ").trim();
+  const byText = new Map();      // normalized text -> Set<Element>
+  const keyOf = new WeakMap();   // Element -> normalized text
+  const waiters = new Map();     // normalized text -> [resolve]
+  let nextId = 1;
+
+  const ownText = (el) => {
+    let text = "";
+    for (const child of el.childNodes) {
+      if (child.nodeType === Node.TEXT_NODE) text += child.nodeValue;
+    }
+    return norm(text);
+  };
+
+  const index = (el) => {
+    const old = keyOf.get(el);
+    const key = ownText(el);
+    if (old === key) return;
+    if (old !== undefined) byText.get(old)?.delete(el);
+    keyOf.set(el, key);
+    if (!key) return;
+    if (!byText.has(key)) byText.set(key, new Set());
+    byText.get(key).add(el);
+    if (!el.hasAttribute("%(attr)s")) el.setAttribute("%(attr)s", String(nextId++));
+    const pending = waiters.get(key);
+    if (pending) { waiters.delete(key); pending.forEach((resolve) => resolve()); }
+  };
+
+  const indexTree = (root) => {
+    if (root.nodeType !== Node.ELEMENT_NODE) return;
+    index(root);
+    root.querySelectorAll("*").forEach(index);
+  };
+
+  const lookup = (text) => {
+    const els = byText.get(norm(text));
+    if (!els) return [];
+    for (const el of els) if (!el.isConnected) els.delete(el);
+    return [...els];
+  };
+
+  const visible = (el) => {
+    const rect = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+  };
+
+  const start = () => {
+    indexTree(document.documentElement);
+    new MutationObserver((mutations) => {
+      for (const m of mutations) {
+        if (m.type === "characterData") { if (m.target.parentElement) index(m.target.parentElement); }
+        else { index(m.target); m.addedNodes.forEach(indexTree); }
+      }
+    }).observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+  };
+
+  window.__medviTextIndex = {
+    // Resolve with the tid of the first visible element with this text, or null on timeout.
+    find(text, timeout) {
+      const pick = () => {
+        const els = lookup(text);
+        const el = els.find(visible) || els[0];
+        return el ? el.getAttribute("%(attr)s") : null;
+      };
+      const found = pick();
+      if (found || !timeout) return Promise.resolve(found);
+      return new Promise((resolve) => {
+        const key = norm(text);
+        const timer = setTimeout(() => resolve(pick()), timeout);
+        const list = waiters.get(key) || [];
+        list.push(() => { clearTimeout(timer); resolve(pick()); });
+        waiters.set(key, list);
+      });
+    },
+    visible(texts) {
+      const result = {};
+      for (const text of texts) result[text] = lookup(text).some(visible);
+      return result;
+    },
+  };
+
+  if (document.documentElement) start();
+  else document.addEventListener("DOMContentLoaded", start, { once: true });
+})();
+""" % {"attr": TID_ATTRIBUTE}
+
+
+def tid_selector(tid: str) -> str:
+    return f"[{TID_ATTRIBUTE}='{tid}']"
+
+
+def benchmark(page_object, texts: Iterable[str], rounds: int = 20) -> Dict[str, float]:
+    """
+    Median latency (ms) of resolving each text via the index vs. the XPath text match.
+
+    Both sides resolve to an element count/id with one round trip per lookup, so the
+    numbers compare DOM lookup cost rather than actionability waits.
+    """
+    texts = list(texts)
+    frame = page_object.frame
+    page_object.find_by_text(texts[0])  # make sure the index is installed
+
+    def timed(lookup) -> float:
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for text in texts:
+                lookup(text)
+            samples.append((time.perf_counter() - started) * 1000 / len(texts))
+        return statistics.median(samples)
+
+    xpath_ms = timed(lambda t: page_object.locator("text", text=t).count())
+    index_ms = timed(lambda t: frame.evaluate("t => window.__medviTextIndex.find(t, 0)", t))
+    return {"xpath_ms": round(xpath_ms, 3), "index_ms": round(index_ms, 3)}
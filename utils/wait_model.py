@@ -0,0 +1,96 @@
+"""
+Adaptive wait timeouts learned from how long each locator actually took.
+
+``BasePage.wait_visible`` / ``expect_visible`` time every successful wait and
+record it under ``PageClass:selector``. Once a key has ``MIN_SAMPLES``
+observations, its timeout becomes the ``PERCENTILE`` of them plus a margin
+(never below ``FLOOR_MS``, never above the timeout the call site asked for): an
+option that shows up in 50 ms fails after half a second instead of ten, while the
+GLP-1 graph keeps the seconds it needs. A wait that misses its learned timeout
+does not fail: it goes on for the rest of the call site's timeout, its actual
+duration becomes an observation, and the key keeps the call site's timeout for
+the rest of the session, so one slow run widens the model instead of failing.
+
+Observations persist as JSON between runs (``--medvi-wait-model``)::
+
+    {"version": 1, "waits": {"GoalWeightPage:xpath=//button[...]": [120, 95, ...]}}
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+VERSION = 1
+MIN_SAMPLES = 5
+MAX_SAMPLES = 50        # newest observations kept per key
+PERCENTILE = 95
+MARGIN_FACTOR = 0.5     # margin on top of the percentile, relative to it …
+MARGIN_MS = 250         # … plus a fixed part for scheduling jitter
+FLOOR_MS = 500
+
+# Model of the running session, set by the conftest fixture (None: call-site timeouts)
+ACTIVE: Optional["WaitModel"] = None
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class WaitModel:
+    """Observed wait durations (ms) per locator key and the timeouts derived from them."""
+
+    def __init__(self, waits: Optional[Dict[str, List[float]]] = None):
+        self.waits: Dict[str, List[float]] = waits or {}
+        self.misses: Dict[str, int] = {}
+        self._widened: Set[str] = set()
+
+    @classmethod
+    def load(cls, path: str) -> "WaitModel":
+        """The persisted model, or an empty one if the file is missing or from another version."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        return cls(data.get("waits", {}) if data.get("version") == VERSION else {})
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "waits": self.waits}, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+
+    def learned(self, key: str) -> Optional[int]:
+        """Learned timeout of ``key`` in ms, None while it has too few observations."""
+        samples = self.waits.get(key, ())
+        if len(samples) < MIN_SAMPLES:
+            return None
+        high = percentile(samples, PERCENTILE)
+        return max(FLOOR_MS, int(high * (1 + MARGIN_FACTOR) + MARGIN_MS))
+
+    def timeout_for(self, key: str, timeout_ms: int) -> int:
+        """Timeout for a wait on ``key`` whose call site allows ``timeout_ms``."""
+        learned = None if key in self._widened else self.learned(key)
+        return timeout_ms if learned is None else min(timeout_ms, learned)
+
+    def observe(self, key: str, duration_ms: float):
+        samples = self.waits.setdefault(key, [])
+        samples.append(round(duration_ms, 1))
+        del samples[:-MAX_SAMPLES]
+
+    def miss(self, key: str):
+        """A wait ran out of its learned timeout: widen ``key`` back to the call site's timeout."""
+        self.misses[key] = self.misses.get(key, 0) + 1
+        self._widened.add(key)
+
+    def summary(self) -> str:
+        rows = [f"{'locator':<80} {'n':>3} {'p95 ms':>8} {'timeout':>8} {'misses':>6}"]
+        for key in sorted(self.waits):
+            samples = self.waits[key]
+            learned = self.learned(key)
+            rows.append(f"{key[:80]:<80} {len(samples):>3} {percentile(samples, PERCENTILE):>8.0f} "
+                        f"{learned if learned is not None else '-':>8} {self.misses.get(key, 0):>6}")
+        return "\n".join(rows)